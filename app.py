@@ -1,27 +1,59 @@
+import time
+STARTED = time.perf_counter()  # Açılış süresi ölçümünün başlangıcı (ağır içe aktarmalardan önce)
+
 import os
 import sys
-import difflib
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import quote, urlencode
 
 import numpy as np
-import pygame
-import librosa
-from flask import Flask, render_template, jsonify, send_from_directory
+from flask import Flask, Response, render_template, jsonify, send_from_directory, send_file, redirect, abort, request
+from werkzeug.security import safe_join
 from flask_socketio import SocketIO
-from gtts import gTTS
 
 # src klasörünü arama yoluna ekleyin
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
-from speech_to_text import recognize_speech, analyze_sentiment_from_audio
+from speech_to_text import recognize_audio, recognize_pcm, analyze_sentiment, warm_up as warm_up_features
+from streaming import StreamingPipeline, MicrophoneSource, GoogleSegmentRecognizer, float_to_pcm16
+from sessions import SessionRegistry, RecognitionPool
+from pipeline import StageGraph
+from gif_lexicon import get_lexicon
+from turkish_stemmer import STEMMER, get_resolver
+from tts_cache import TTSCache
+from repo_api import DictionarySync
+from sign_render import SequenceRenderer, FORMATS
+from history import HistoryStore
+from startup import StartupReport
+from audio_player import AudioPlayer, PygameSink, NullSink, PRIORITY_HIGH
+from metrics import REGISTRY, STAGE_SECONDS, UNMATCHED_WORDS, Trace, stage_timer, tracing
+
+startup = StartupReport(STARTED)
+startup.mark('imports')
 
 # === Sabit Yollar ===
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / 'static'
 GIF_DIR = BASE_DIR / 'Turkish_Sign_Language_Dictionary' / 'data' / 'img'
-NEW_GIF_DIR = STATIC_DIR / 'new_gifs'
 SOUND_FILE = Path('C:/Users/Lenovo/Desktop/Turkish_Sign_Language_Translator/src/retro-audio-logo-94648.mp3')
 LOGO_PATH = Path('C:/Users/Lenovo/Desktop/Turkish_Sign_Language_Translator/src/img/logo.png')
+TTS_CACHE_DIR = STATIC_DIR / 'cache'
+RENDER_DIR = STATIC_DIR / 'renders'
+HISTORY_DB = BASE_DIR / 'analysis_history.db'
+TTS_PREFIX = "Algılanan metin:"
+SIGN_MAX_AGE = 365 * 24 * 60 * 60  # İçerik özetli GIF URL'leri değişmez, bir yıl önbellekte kalabilir
+HOST, PORT = '127.0.0.1', 5000
+RECOGNITION_WORKERS = 4      # Aynı anda işlenen ifade sayısı
+RECOGNITION_QUEUE = 8        # Sırada bekleyebilecek en fazla ifade; fazlası reddedilir
+STREAMING_SESSIONS = 16      # Aynı anda canlı akışla tanınan tarayıcı oturumu (her biri kayıt boyunca bir işçi tutar)
+MAX_UTTERANCE_SECONDS = 30   # Tek bir ifadede kabul edilen en uzun ses
+RENDER_SIZE = (200, 200)     # Birleşik işaret animasyonlarının kare boyutu
+MAX_RENDER_SIGNS = 32        # Tek bir birleşik animasyondaki en fazla işaret
+RENDER_MAX_AGE = 60 * 60     # Birleşik animasyonlar ETag ile yeniden doğrulanır
+METRICS_ENABLED = True       # Kapalıyken zamanlayıcı ve sayaçlar hiçbir şey yapmaz
+TRACE_REQUESTS = False       # stage_timings olayına isteğin alt aşama sürelerini de ekle
+REMOTE_SIGNS = False         # Sözlükte bulunamayan kelimeleri uzak depodan arka planda indir
+AUDIO_OUTPUT = True          # False: ses aygıtı olmayan sunucularda sesler çalınmaz
 
 # === Flask ve SocketIO Uygulaması ===
 app = Flask(
@@ -32,18 +64,121 @@ app = Flask(
 )
 socketio = SocketIO(app)
 
-# new_gifs dizinini oluştur
-NEW_GIF_DIR.mkdir(parents=True, exist_ok=True)
+# Eksik işaretler uzak sözlükten GIF_DIR'e indirilir; sözlük dizini klasör değişikliğini görür
+dictionary_sync = DictionarySync(GIF_DIR) if REMOTE_SIGNS else None
+
+# Sentezlenen konuşmalar (metin, dil) özetine göre önbellekte tutulur
+tts_cache = TTSCache(TTS_CACHE_DIR)
+
+# Cümlenin işaretleri sırayla tek bir animasyonda birleştirilir, içerik özetine göre önbelleklenir
+renderer = SequenceRenderer(RENDER_DIR, size=RENDER_SIZE, digest=lambda path: get_lexicon(GIF_DIR).digest(path))
+
+# Her tanıma sonucu SQLite (WAL) geçmişine tek satır olarak eklenir
+history = HistoryStore(HISTORY_DB)
+
+# Tüm sesler tek bir kalıcı çalma servisinden, öncelik sırasıyla çalınır; sabit efektler bellekte tutulur
+audio = AudioPlayer(PygameSink() if AUDIO_OUTPUT else NullSink(), cues={'chime': SOUND_FILE})
+
+# Aşama süreleri, önbellek isabetleri ve eşleşmeyen kelimeler /metrics altında
+REGISTRY.enabled = METRICS_ENABLED
+CACHE_STATS = {
+    'tts': lambda: tts_cache.stats(),
+    'signs': lambda: get_resolver(GIF_DIR).stats(),
+    'renders': lambda: renderer.stats(),
+}
+REGISTRY.gauge('cache_hits_total', "Önbellek isabetleri",
+               lambda: {(name,): stats()['hits'] for name, stats in CACHE_STATS.items()}, ['cache'], kind='counter')
+REGISTRY.gauge('cache_misses_total', "Önbellek ıskaları",
+               lambda: {(name,): stats()['misses'] for name, stats in CACHE_STATS.items()}, ['cache'], kind='counter')
+
+# Tanıma sonrası aşamalar (GIF, duygu analizi, TTS) bu havuzda eşzamanlı çalışır
+stage_pool = ThreadPoolExecutor(max_workers=RECOGNITION_WORKERS * 4, thread_name_prefix='stage')
+
+# Her istemcinin sesi kendi oturumunda tutulur; tanıma işleri sınırlı havuzda çalışır
+sessions = SessionRegistry(max_seconds=MAX_UTTERANCE_SECONDS)
+recognition_pool = RecognitionPool(workers=RECOGNITION_WORKERS, max_queue=RECOGNITION_QUEUE)
+# Akış modunda bölütler konuşma sürerken tanınır, bu yüzden her oturum kayıt bitene kadar bir işçi
+# tutar (en fazla MAX_UTTERANCE_SECONDS); bu sınır bilerek ayrı bir havuzda tutulur. İfade modu ise
+# kayıt sırasında işçi tutmaz, ses oturum kuyruğunda birikir ve iş ancak kayıt bitince havuza verilir.
+streaming_pool = RecognitionPool(workers=STREAMING_SESSIONS, max_queue=0)
+
+REGISTRY.gauge('recognition_in_flight', "Havuzda çalışan ve bekleyen tanıma işleri", lambda: recognition_pool.in_flight)
+REGISTRY.gauge('streaming_in_flight', "Canlı akışla tanınan tarayıcı oturumları", lambda: streaming_pool.in_flight)
+REGISTRY.gauge('recognition_queue_depth', "Sırada bekleyen tanıma işleri", lambda: recognition_pool.queue_depth)
+REGISTRY.gauge('recognition_rejected_total', "Kapasite dolduğu için reddedilen işler",
+               lambda: recognition_pool.rejected, kind='counter')
+REGISTRY.gauge('active_sessions', "Ses yükleyen etkin istemci oturumları", lambda: len(sessions))
+REGISTRY.gauge('audio_queue_depth', "Çalınmayı bekleyen ses istekleri", lambda: audio.pending())
+
+# Ağır bileşenler (sözlük dizini, librosa JIT, ses efektleri, TTS) sunucu dinlemeye başlayınca ısıtılır
+WARMUP_TASKS = [
+    ('lexicon', lambda: get_resolver(GIF_DIR).phrases()),
+    ('features', warm_up_features),
+    ('audio', audio.preload),
+    ('tts', tts_cache.warm),
+]
+REGISTRY.gauge('startup_seconds', "Açılış aşamalarına kadar geçen süre",
+               lambda: {(name,): value for name, value in startup.marks.items()}, ['phase'])
+REGISTRY.gauge('warmup_seconds', "Arka planda ısıtılan bileşenlerin süresi",
+               lambda: {(name,): value for name, value in startup.warmups.items()}, ['task'])
 
 # === URL Yönlendirmeleri ===
 @app.route('/')
 def home():
     return render_template('index.html')
 
-@app.route('/static/new_gifs/<path:filename>')
-def serve_gif(filename):
-    """new_gifs klasöründeki GIF'leri sunmak için."""
-    return send_from_directory(str(NEW_GIF_DIR), filename)
+@app.route('/signs/<digest>/<path:filename>')
+def serve_gif(digest, filename):
+    """Sözlükteki GIF'i kopyalamadan, içerik özetli URL ile sunar."""
+    gif_path = safe_join(str(GIF_DIR), filename)
+    if gif_path is None or not os.path.isfile(gif_path):
+        abort(404)
+
+    # Dosya değiştiyse istemciyi güncel içeriğin URL'sine yönlendir
+    current = get_lexicon(GIF_DIR).digest(gif_path)
+    if current != digest:
+        return redirect(gif_url(gif_path))
+
+    response = send_from_directory(str(GIF_DIR), filename, etag=digest, max_age=SIGN_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+@app.route('/render')
+def render_sequence():
+    """İşaret dizisini (?s=a/anne.gif&s=...) tek, sıralı bir animasyon olarak sunar."""
+    fmt = request.args.get('format', 'gif')
+    signs = request.args.getlist('s')
+    if fmt not in FORMATS or not signs or len(signs) > MAX_RENDER_SIGNS:
+        abort(400)
+
+    gif_paths = []
+    for sign in signs:
+        gif_path = safe_join(str(GIF_DIR), sign)
+        if gif_path is None or not os.path.isfile(gif_path):
+            abort(404)
+        gif_paths.append(gif_path)
+
+    path = renderer.render(gif_paths, fmt)
+    response = send_file(str(path), mimetype=FORMATS[fmt][2], etag=path.stem, max_age=RENDER_MAX_AGE)
+    response.cache_control.public = True
+    return response
+
+@app.route('/history')
+def history_page():
+    """Analiz geçmişi (?emotion=&since=&until=&limit=&cursor=), yeniden eskiye sayfalı."""
+    args = request.args
+    try:
+        page = history.query(args.get('emotion'), args.get('since'), args.get('until'),
+                             args.get('limit', 50), args.get('cursor'))
+    except ValueError:
+        abort(400)
+    return jsonify(page)
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metin biçiminde ölçümler."""
+    return Response(REGISTRY.exposition(), mimetype='text/plain; version=0.0.4; charset=utf-8')
 
 @app.route('/static/logo.png')
 def serve_logo():
@@ -51,155 +186,320 @@ def serve_logo():
     return send_from_directory(str(LOGO_PATH.parent), LOGO_PATH.name)
 
 # === Ses Çalma Fonksiyonları ===
-def play_sound(sound_file):
-    """Ses çalma işlemini (pygame) gerçekleştirir. Bloklayıcıdır."""
-    try:
-        pygame.mixer.init()
-        pygame.mixer.music.load(sound_file)
-        pygame.mixer.music.play()
-        while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
-    except Exception as e:
-        print(f"Ses çalma hatası: {e}")
-    finally:
-        pygame.mixer.quit()
+def play_chime(interrupt=False):
+    """Mikrofon açılış/bitiş sesini kuyruğa ekler.
 
-def play_sound_threaded(sound_file):
-    """Ses çalma işlemini ayrı bir iş parçacığında (thread) başlatır."""
-    threading.Thread(target=play_sound, args=(sound_file,), daemon=True).start()
+    `interrupt=True` iken önceki ifadenin henüz çalınmamış ya da çalmakta olan
+    sesleri (TTS, bitiş sesi) kesilir ve açılış sesi sıranın önüne geçer.
+    """
+    if interrupt:
+        audio.cancel('utterance')
+        return audio.cue('chime', priority=PRIORITY_HIGH)
+    return audio.cue('chime', group='utterance')
 
 # === Metin Okuma (TTS) Fonksiyonu ===
-def say_text(text):
-    """Gelen metni TTS ile oku (gTTS) ve ses dosyasını çal."""
+def say_text(*parts):
+    """Metin parçalarını TTS önbelleğinden alıp (gerekirse sentezleyip) sırayla çal."""
     try:
-        speech_file = STATIC_DIR / 'speech.mp3'
-        tts = gTTS(text, lang='tr')
-        tts.save(str(speech_file))
-        play_sound_threaded(str(speech_file))
+        speech_files = [tts_cache.get(part, lang='tr') for part in parts if part]
+        audio.play(*speech_files, group='utterance')
     except Exception as e:
         print(f"Metin okuma hatası: {e}")
 
 # === GIF Bulma Yardımcı Fonksiyonları ===
 def get_word_root(word):
-    """Kelime kökünü bulmak için basit ek kesme."""
-    suffixes = ["e", "im", "in", "um", "sin", "siniz", "ler", "lar", "dir", "dır", "dur", "mız", "tik", "mek", "mekte"]
-    for suffix in sorted(suffixes, key=len, reverse=True):
-        if word.endswith(suffix):
-            return word[:-len(suffix)]
-    return word
-
-def find_similar_word(word, directory_path):
-    """Benzer kelimeyi bulmak için difflib kullan."""
-    try:
-        gif_files = [f.stem for f in Path(directory_path).glob('*.gif')]
-        similar_words = difflib.get_close_matches(word, gif_files, n=1, cutoff=0.6)
-        return similar_words[0] if similar_words else None
-    except Exception as e:
-        print(f"Benzer kelime arama hatası: {e}")
-        return None
+    """En uzun tek eki soyulmuş kelime kökü."""
+    return STEMMER.root(word)
 
 def find_gif(word, gif_dir):
-    """Verilen kelime için uygun GIF'i bul."""
-    if not word or not word[0].isalpha():
-        return None
-
-    first_letter = word[0].lower()
-    directory_path = Path(gif_dir) / first_letter
+    """Verilen kelime için uygun GIF'i bul (tam kelime, ek zinciri kökleri, benzer kelime)."""
+    return get_resolver(gif_dir).resolve(word)
 
-    if not directory_path.exists():
-        return None
+def translate_to_gif(text, gif_dir):
+    """Tanınan metindeki ifade ve kelimelerin sözlükteki GIF yollarını bulur.
 
-    # 1) Tam kelime eşleşmesi
-    gif_path = directory_path / f"{word}.gif"
-    if gif_path.exists():
-        return gif_path
-
-    # 2) Kök kelime kontrolü
-    word_root = get_word_root(word)
-    gif_path = directory_path / f"{word_root}.gif"
-    if gif_path.exists():
-        return gif_path
-
-    # 3) Benzer kelime kontrolü
-    similar_word = find_similar_word(word_root, directory_path)
-    if similar_word:
-        return directory_path / f"{similar_word}.gif"
-
-    return None
-
-def translate_to_gif(text, gif_dir, new_gif_dir):
-    """Tanınan metindeki kelimelerin GIF'lerini bulup kopyalar."""
+    Çok kelimeli işaretler (ör. "iyi akşamlar") en uzun eşleşmeyle tek GIF
+    olarak seçilir, kalan kelimeler tek tek çözülür.
+    """
     words = text.lower().split()
     gif_paths = []
+    missing = []
+
+    with stage_timer('gif_lookup'):
+        segments = get_resolver(gif_dir).segment(words)
 
-    for word in words:
-        gif_path = find_gif(word, gif_dir)
+    for phrase, gif_path in segments:
         if gif_path:
-            new_gif_path = Path(new_gif_dir) / f"{word}.gif"
-            try:
-                new_gif_path.write_bytes(gif_path.read_bytes())
-                gif_paths.append(new_gif_path)
-                print(f"GIF bulundu ve kopyalandı: {new_gif_path}")
-            except Exception as e:
-                print(f"GIF kopyalama hatası ({word}): {e}")
+            gif_paths.append(gif_path)
+            print(f"GIF bulundu: {gif_path}")
         else:
-            print(f"GIF bulunamadı: {word}")
+            missing.append(phrase)
+            UNMATCHED_WORDS.inc()
+            print(f"GIF bulunamadı: {phrase}")
 
+    if dictionary_sync and missing:
+        dictionary_sync.submit(w for w in missing if w[0].isalpha())
     return gif_paths
 
+def sign_name(gif_path):
+    """GIF'in sözlük klasörüne göre yolu (ör. a/anne.gif)."""
+    return Path(os.path.relpath(gif_path, GIF_DIR)).as_posix()
+
+def gif_url(gif_path):
+    """Sözlükteki GIF için içerik özetli, değişmez URL üretir."""
+    digest = get_lexicon(GIF_DIR).digest(gif_path)
+    return f"/signs/{digest}/{quote(sign_name(gif_path))}"
+
+def sequence_url(gif_paths, fmt='gif'):
+    """GIF dizisinin birleşik animasyon URL'si."""
+    signs = [sign_name(path) for path in gif_paths[:MAX_RENDER_SIGNS]]
+    return '/render?' + urlencode([('s', sign) for sign in signs] + [('format', fmt)])
+
 # === Konuşma Tanıma Sonrası Devam Sorusu ===
-def ask_for_continuation():
+def ask_for_continuation(room=None):
     """Konuşma bitince, devam etmek isteyip istemediğini sorar."""
     # GIF'leri HEMEN temizlemiyoruz; kullanıcı 'Evet' diyene kadar ekranda kalsın.
     status_label = "Konuşmaya devam etmek ister misiniz?"
-    socketio.emit('ask_continue', {'status': status_label})
+    socketio.emit('ask_continue', {'status': status_label}, to=room)
 
 # === Konuşma İşleme ve SocketIO Olayları ===
-def process_recognition(gif_dir, new_gif_dir):
-    """Arka planda çalışan konuşma tanıma ve işleme fonksiyonu."""
-    try:
-        text = recognize_speech()
-        if text:
-            sentiment = analyze_sentiment_from_audio("temp_audio.wav")
-            say_text(f"Algılanan metin: {text}")
-            # Tanınan metin ve duygu analizi, istemciye gönderiliyor
-            socketio.emit('text_recognized', {'text': text, 'sentiment': sentiment})
-
-            # GIF bulma ve istemciye gönderme
-            gif_paths = translate_to_gif(text, gif_dir, new_gif_dir)
-            gif_urls = [f"/static/new_gifs/{path.name}" for path in gif_paths]
-            socketio.emit('update_gifs', {'gifs': gif_urls})
-
-            # Konuşma bitiş sesi
-            play_sound_threaded(str(SOUND_FILE))
+# Olaylar `room` verilirse yalnızca o istemcinin odasına (Socket.IO sid), verilmezse herkese gönderilir.
+def emit_gifs(text, gif_dir, room=None):
+    """GIF'leri bulup istemciye gönderir."""
+    gif_paths = translate_to_gif(text, gif_dir)
+    gif_urls = [gif_url(path) for path in gif_paths]
+    sequence = sequence_url(gif_paths) if gif_paths else None
+    socketio.emit('update_gifs', {'gifs': gif_urls, 'sequence': sequence}, to=room)
+    return gif_paths
 
-            # Devam etmek ister misiniz?
-            ask_for_continuation()
+def emit_sentiment(text, analyze, room=None):
+    """Duygu analizini yapıp tanınan metinle birlikte istemciye gönderir."""
+    sentiment = analyze()
+    socketio.emit('text_recognized', {'text': text, 'sentiment': sentiment}, to=room)
+    return sentiment
+
+def speak(text, room=None):
+    """Sunucu mikrofonu modunda metni hoparlörden okur, oturum modunda ses URL'lerini istemciye gönderir."""
+    if room is None:
+        say_text(TTS_PREFIX, text)
+        return
+    speech_files = [tts_cache.get(part, lang='tr') for part in (TTS_PREFIX, text)]
+    socketio.emit('speech', {'urls': [f"/static/cache/{path.name}" for path in speech_files]}, to=room)
+
+def finish_recognition(*_, room=None):
+    """Konuşma bitiş sesi ve devam sorusu (diğer aşamalar bitince)."""
+    if room is None:
+        play_chime()
+    ask_for_continuation(room)
+
+def record_history(text, run, gif_paths):
+    """Tanıma sonucunu, eşleşen işaretleri ve aşama sürelerini geçmişe ekler."""
+    sentiment = run.results.get('sentiment') or {}
+    try:
+        history.append(
+            text,
+            emotion=sentiment.get('sentiment'),
+            scores=sentiment.get('mean_values'),
+            signs=[sign_name(path) for path in gif_paths or ()],
+            timings=run.summary()['stages'],
+        )
+    except Exception as e:
+        print(f"Geçmiş kaydı hatası: {e}")
+
+def new_trace(origin):
+    """İstek izleme açıksa, tanımanın başladığı ana göre bir izleme başlatır."""
+    return Trace(origin) if TRACE_REQUESTS and REGISTRY.enabled else None
+
+def run_post_recognition(text, analyze, gif_dir=None, origin=None, timings=None, room=None, gif_paths=None, trace=None):
+    """Tanıma sonrası aşamaları bağımlılık grafiği olarak eşzamanlı çalıştırır.
+
+    GIF, duygu analizi ve TTS birbirini beklemez; her olay kendi aşaması
+    biter bitmez gönderilir. `gif_dir` verilmezse (akış modu) GIF aşaması atlanır
+    ve akış sırasında bulunan `gif_paths` geçmişe yazılır.
+    """
+    traced = trace.wrap if trace else (lambda fn: fn)
+    graph = StageGraph()
+    graph.add('sentiment', traced(lambda: emit_sentiment(text, analyze, room)))
+    graph.add('tts', traced(lambda: speak(text, room)))
+    stages = ['sentiment', 'tts']
+    if gif_dir is not None:
+        graph.add('gifs', traced(lambda: emit_gifs(text, gif_dir, room)))
+        stages.append('gifs')
+    graph.add('finish', lambda *_: finish_recognition(room=room), after=stages, always=True)
+
+    run = graph.run(stage_pool, origin=origin, timings=timings)
+    for name, timing in run.timings.items():
+        STAGE_SECONDS.observe(timing['duration'], stage=name)
+    summary = run.summary()
+    print(f"Aşama süreleri (ms): {summary['stages']} | kritik yol: {' -> '.join(summary['critical_path'])}")
+    if trace:
+        summary['trace'] = trace.spans
+    socketio.emit('stage_timings', summary, to=room)
+    record_history(text, run, run.results.get('gifs', gif_paths))
+    return run
+
+def process_recognition(gif_dir, room=None):
+    """Arka planda çalışan konuşma tanıma ve işleme fonksiyonu (sunucu mikrofonu)."""
+    try:
+        origin = time.perf_counter()
+        trace = new_trace(origin)
+        with tracing(trace):
+            result = recognize_audio()
+        elapsed = time.perf_counter() - origin
+        timings = {'recognize': {'start': 0.0, 'end': elapsed, 'duration': elapsed}}
+        if result:
+            # Ses bellekte kalır, duygu analizine doğrudan verilir
+            analyze = lambda: analyze_sentiment(result.audio, result.sample_rate)
+            run_post_recognition(result.text, analyze, gif_dir, origin, timings, room, trace=trace)
         else:
             # Metin anlaşılamadıysa da devam sorusuna geçelim
-            ask_for_continuation()
+            ask_for_continuation(room)
     except Exception as e:
         print(f"Konuşma tanıma hatası: {e}")
-        ask_for_continuation()
-        socketio.emit('recognition_error', {'error': str(e)})
+        ask_for_continuation(room)
+        socketio.emit('recognition_error', {'error': str(e)}, to=room)
 
-# === Flask Yönlendirmeleri ===
-@app.route('/start_recognition', methods=['POST'])
-def start_recognition():
-    """Mikrofonu açma isteği (istemciden) geldiğinde tetiklenir."""
+def process_streaming_recognition(gif_dir, pipeline=None, room=None):
+    """Akış modu: kararlı hale gelen her kelimenin GIF'i anında istemciye gönderilir."""
+    try:
+        origin = time.perf_counter()
+        pipeline = pipeline or StreamingPipeline(MicrophoneSource(), GoogleSegmentRecognizer(language='tr-TR'))
+        gif_paths = []
+
+        def on_word(word):
+            with stage_timer('gif_lookup'):
+                gif_path = find_gif(word, gif_dir)
+            if gif_path:
+                socketio.emit('gif_append', {'word': word, 'gif': gif_url(gif_path), 'index': len(gif_paths)}, to=room)
+                gif_paths.append(gif_path)
+            else:
+                UNMATCHED_WORDS.inc()
+                print(f"GIF bulunamadı: {word}")
+
+        def on_partial(text):
+            socketio.emit('partial_text', {'text': text}, to=room)
+
+        trace = new_trace(origin)
+        with tracing(trace):
+            text = pipeline.run(on_word, on_partial)
+        if gif_paths:
+            # İfade bitince kelimelerin işaretleri tek, sıralı animasyon olarak da sunulur
+            socketio.emit('sign_sequence', {'url': sequence_url(gif_paths)}, to=room)
+        elapsed = time.perf_counter() - origin
+        timings = {'stream': {'start': 0.0, 'end': elapsed, 'duration': elapsed}}
+        if text:
+            # GIF'ler akış sırasında gönderildi; kalan aşamalar eşzamanlı çalışır
+            analyze = lambda: analyze_sentiment(pipeline.recorded_audio(), pipeline.sample_rate)
+            run_post_recognition(text, analyze, origin=origin, timings=timings, room=room, gif_paths=gif_paths,
+                                 trace=trace)
+        else:
+            # Devam etmek ister misiniz?
+            ask_for_continuation(room)
+    except Exception as e:
+        print(f"Konuşma tanıma hatası: {e}")
+        ask_for_continuation(room)
+        socketio.emit('recognition_error', {'error': str(e)}, to=room)
+
+def process_session_audio(session, gif_dir):
+    """Tarayıcıdan yüklenen sesi (oturuma özel bellek içi kuyruk) işler."""
+    room = session.sid
+    try:
+        if session.mode == 'streaming':
+            pipeline = StreamingPipeline(session.source, GoogleSegmentRecognizer(language='tr-TR'))
+            process_streaming_recognition(gif_dir, pipeline, room)
+            return
+
+        # İfade modu: ses bitene kadar biriktirilir, sonra tek seferde tanınır
+        audio = np.concatenate(list(session.source.chunks()) or [np.empty(0, dtype=np.float32)])
+        origin = time.perf_counter()
+        trace = new_trace(origin)
+        with tracing(trace):
+            text = recognize_pcm(float_to_pcm16(audio), session.sample_rate) if len(audio) else None
+        elapsed = time.perf_counter() - origin
+        timings = {'recognize': {'start': 0.0, 'end': elapsed, 'duration': elapsed}}
+        if text:
+            analyze = lambda: analyze_sentiment(audio, session.sample_rate)
+            run_post_recognition(text, analyze, gif_dir, origin, timings, room, trace=trace)
+        else:
+            ask_for_continuation(room)
+    except Exception as e:
+        print(f"Konuşma tanıma hatası: {e}")
+        ask_for_continuation(room)
+        socketio.emit('recognition_error', {'error': str(e)}, to=room)
+    finally:
+        sessions.discard(session)
+
+def busy_message():
+    return {
+        'status': "Sunucu şu anda meşgul, lütfen biraz sonra tekrar deneyin.",
+        'queue_depth': recognition_pool.queue_depth,
+    }
+
+# === Tarayıcıdan Ses Yükleme (Socket.IO) ===
+def submit_session(session, pool):
+    """Oturumun işini havuza verir; kapasite doluysa oturumu kapatıp istemciye bildirir."""
+    if pool.submit(process_session_audio, session, str(GIF_DIR)) is None:
+        sessions.discard(session)
+        socketio.emit('server_busy', busy_message(), to=session.sid)
+
+def end_utterance(sid):
+    """Kayıt bitti: ifade modundaki oturumun birikmiş sesi şimdi tanıma havuzuna verilir."""
+    session = sessions.close(sid)
+    if session is not None and session.mode != 'streaming':
+        submit_session(session, recognition_pool)
+
+@socketio.on('audio_start')
+def on_audio_start(data=None):
+    """İstemci kayda başladı: oturum açılır; akış modunda iş hemen akış havuzuna verilir."""
+    data = data or {}
+    session = sessions.start(request.sid, int(data.get('sample_rate', 16000)), data.get('mode', 'streaming'))
+    if session.mode == 'streaming':
+        submit_session(session, streaming_pool)
+
+@socketio.on('audio_chunk')
+def on_audio_chunk(data):
+    """16 bit PCM ses parçası."""
+    if not sessions.push(request.sid, data):
+        socketio.emit('recording_stopped', {'status': "Kayıt sınırına ulaşıldı."}, to=request.sid)
+        end_utterance(request.sid)
+
+@socketio.on('audio_end')
+def on_audio_end():
+    end_utterance(request.sid)
+
+@socketio.on('disconnect')
+def on_disconnect():
+    sessions.close(request.sid)
+
+# === Sunucu Mikrofonu (Socket.IO) ===
+@socketio.on('start_recognition')
+def on_start_recognition(data=None):
+    """Sunucu mikrofonunu açma isteği; sonuçlar isteği yapan istemcinin odasına gönderilir.
+
+    Oda istemcinin gönderdiği bir değerden değil, bağlantının kendi sid'inden
+    alınır; böylece bir istemci başka bir kullanıcının odasına sonuç yollayamaz.
+    Dönüş değeri istemcinin onay (ack) geri çağrısına iletilir.
+    """
     try:
         if not SOUND_FILE.exists():
-            return jsonify({"error": "Ses dosyası bulunamadı. Lütfen dosyanın doğru yerleştirildiğinden emin olun."})
+            return {"error": "Ses dosyası bulunamadı. Lütfen dosyanın doğru yerleştirildiğinden emin olun."}
 
-        # Mikrofon açılış sesini bloklamadan çal
-        play_sound_threaded(str(SOUND_FILE))
+        # Konuşma işleme fonksiyonunu sınırlı havuzda çalıştır ('streaming': kelime kelime GIF akışı)
+        data = data or {}
+        target = process_streaming_recognition if data.get('mode') == 'streaming' else process_recognition
+        if recognition_pool.submit(target, str(GIF_DIR), room=request.sid) is None:
+            return {"error": busy_message()['status']}
 
-        # Konuşma işleme fonksiyonunu arka planda çalıştır
-        socketio.start_background_task(process_recognition, str(GIF_DIR), str(NEW_GIF_DIR))
-        return jsonify({"status": True})
+        # Mikrofon açılış sesini bloklamadan çal
+        play_chime(interrupt=True)
+        return {"status": True}
     except Exception as e:
-        return jsonify({"error": str(e)})
+        return {"error": str(e)}
 
 # === Uygulama Başlatma ===
 if __name__ == '__main__':
-    socketio.run(app, debug=True, host='127.0.0.1', port=5000, use_reloader=False)
+    startup.mark('init')
+    print(startup.describe())
+    # Isıtma, sunucu bağlantı kabul etmeye başladıktan sonra arka planda yapılır
+    startup.warm_up(WARMUP_TASKS, wait_for=(HOST, PORT))
+    socketio.run(app, debug=True, host=HOST, port=PORT, use_reloader=False)
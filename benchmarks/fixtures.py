@@ -0,0 +1,79 @@
+import random
+import wave
+from pathlib import Path
+
+import numpy as np
+
+# Türkçe hece yapısına benzer sentetik kelimeler üretmek için harfler
+CONSONANTS = "bcçdfghjklmnprsştvyz"
+VOWELS = "aeıioöuü"
+# Derlemde kelimelere eklenen çekim eki zincirleri
+SUFFIX_CHAINS = ["", "ler", "lar", "im", "ımız", "de", "dan", "ları", "larımızdan", "iyor", "iyorum", "dim", "mek", "si"]
+
+# Geçerli 1x1 GIF (sözlük yalnızca dosya adlarını okur, içerik yalnızca özet için)
+TINY_GIF = bytes.fromhex('47494638396101000100800000000000ffffff2c000000000100010000020144003b')
+
+
+def make_words(count, seed=0):
+    """Tekrarsız, 2-4 heceli sentetik Türkçe benzeri kelimeler."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        syllables = rng.randint(2, 4)
+        words.add(''.join(rng.choice(CONSONANTS) + rng.choice(VOWELS) for _ in range(syllables)))
+    return sorted(words)
+
+
+def make_lexicon(directory, size, seed=0, phrase_ratio=0.02):
+    """`directory` altında harf klasörlü sentetik bir GIF sözlüğü kurar, kelimeleri döndürür."""
+    directory = Path(directory)
+    words = make_words(size, seed)
+    rng = random.Random(seed + 1)
+    names = list(words)
+    # Sözlüğün küçük bir kısmı çok kelimeli ifadelerdir (ör. iyi_akşamlar)
+    for _ in range(int(size * phrase_ratio)):
+        names.append(f"{rng.choice(words)}_{rng.choice(words)}")
+    for name in names:
+        shard = directory / name[0]
+        shard.mkdir(parents=True, exist_ok=True)
+        (shard / f"{name}.gif").write_bytes(TINY_GIF)
+    return words
+
+
+def make_corpus(words, count, seed=0, unknown_ratio=0.1):
+    """Sözlük kelimelerinden, eklerle çekimlenmiş ve bilinmeyen kelimeler içeren derlem."""
+    rng = random.Random(seed + 2)
+    unknown = make_words(max(1, int(count * unknown_ratio)), seed + 3)
+    corpus = []
+    for _ in range(count):
+        if rng.random() < unknown_ratio:
+            corpus.append(rng.choice(unknown))
+        else:
+            corpus.append(rng.choice(words) + rng.choice(SUFFIX_CHAINS))
+    return corpus
+
+
+def make_utterance(seconds=3.0, sample_rate=16000, words=4, seed=0):
+    """Sessizliklerle ayrılmış, konuşmaya benzer genlik modülasyonlu sinyal (float32)."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    pitch = 120 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    voice = sum(np.sin(2 * np.pi * k * np.cumsum(pitch) / sample_rate) / k for k in range(1, 6))
+    envelope = np.zeros_like(t)
+    slot = seconds / (words + 1)
+    for i in range(words):
+        start = (i + 0.5) * slot
+        envelope += np.exp(-0.5 * ((t - start - slot / 3) / (slot / 6)) ** 2)
+    signal = 0.3 * envelope * voice + 0.003 * rng.standard_normal(len(t))
+    return signal.astype(np.float32)
+
+
+def write_wav(path, audio, sample_rate=16000):
+    """float32 sinyali 16 bit PCM WAV olarak yazar."""
+    pcm = (np.clip(audio, -1.0, 32767 / 32768) * 32768).astype('<i2')
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm.tobytes())
+    return path
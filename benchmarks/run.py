@@ -0,0 +1,236 @@
+"""EKTA performans ölçümleri (mikrofon ve ağ bağlantısı gerektirmez).
+
+    python benchmarks/run.py -o results.json
+    python benchmarks/run.py --sizes 1000 100000 --compare baseline.json
+
+Sonuçlar JSON olarak yazılır. `--compare` ile kayıtlı bir temel ölçümle
+karşılaştırılır: adı `_per_s` ile bitenlerde büyük, `_ms` ile bitenlerde
+küçük değer daha iyidir. Tolerans aşılırsa çıkış kodu 1 olur.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.append(str(BENCH_DIR.parent / 'src'))
+sys.path.append(str(BENCH_DIR))
+from fixtures import make_lexicon, make_corpus, make_utterance, write_wav
+from gif_lexicon import GifLexicon
+from turkish_stemmer import SignResolver
+from speech_to_text import analyze_sentiment, extract_features
+from streaming import replay
+from pipeline import StageGraph
+from population_generator import generate
+from demographic_data import aggregate_file, load_population
+
+
+def median_ms(fn, repeat):
+    """`fn` çağrısının `repeat` tekrarlı ortanca süresi (ms)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(times), 3)
+
+
+def bench_resolve(size, words, workdir, seed):
+    """Sözlük dizini kurma, kelime çözümleme ve ifade bölütleme hızı."""
+    directory = Path(workdir) / f'lexicon_{size}'
+    vocabulary = make_lexicon(directory, size, seed)
+    corpus = make_corpus(vocabulary, words, seed)
+
+    start = time.perf_counter()
+    lexicon = GifLexicon(directory, refresh_interval=3600)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    resolver = SignResolver(lexicon)
+    start = time.perf_counter()
+    matched = sum(1 for word in corpus if resolver.resolve(word))
+    cold = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for word in corpus:
+        resolver.resolve(word)
+    warm = time.perf_counter() - start
+
+    sentences = [corpus[i:i + 8] for i in range(0, len(corpus), 8)]
+    segmenter = SignResolver(lexicon)
+    start = time.perf_counter()
+    for sentence in sentences:
+        segmenter.segment(sentence)
+    segment = time.perf_counter() - start
+
+    return {
+        'lexicon_entries': len(lexicon),
+        'index_build_ms': round(build_ms, 3),
+        'resolve_cold_words_per_s': round(len(corpus) / cold, 1),
+        'resolve_warm_words_per_s': round(len(corpus) / warm, 1),
+        'segment_words_per_s': round(len(corpus) / segment, 1),
+        'match_rate': round(matched / len(corpus), 4),
+    }
+
+
+def bench_features(seconds, repeat, sample_rate=16000):
+    """Bir ifadenin duygu analizi (yalnızca gereken öznitelikler) ve tam öznitelik vektörü süresi."""
+    audio = make_utterance(seconds, sample_rate)
+    analyze_sentiment(audio, sample_rate)  # İlk çağrının (JIT, önbellek) maliyeti ölçüme girmesin
+    return {
+        'analyze_sentiment_ms': median_ms(lambda: analyze_sentiment(audio, sample_rate), repeat),
+        'extract_features_ms': median_ms(lambda: extract_features(audio, sample_rate), repeat),
+    }
+
+
+def bench_end_to_end(workdir, size, repeat, seed, sample_rate=16000):
+    """Akış modunda ilk GIF'e kadar geçen süre; tanıma ve TTS sahte arka uçlarla."""
+    directory = Path(workdir) / f'lexicon_{size}'
+    if not directory.exists():
+        make_lexicon(directory, size, seed)
+    vocabulary = sorted(p.stem for p in directory.glob('*/*.gif') if '_' not in p.stem)
+    transcript = ' '.join(make_corpus(vocabulary, 6, seed, unknown_ratio=0))
+    wav = write_wav(Path(workdir) / 'utterance.wav', make_utterance(4.0, sample_rate, words=6, seed=seed), sample_rate)
+    lexicon = GifLexicon(directory, refresh_interval=3600)
+    pool = ThreadPoolExecutor(max_workers=4)
+
+    first_gif, total = [], []
+    for _ in range(repeat):
+        resolver = SignResolver(lexicon)
+        pipeline = replay(wav, transcript)
+        start = time.perf_counter()
+        first = []
+
+        def on_word(word):
+            if resolver.resolve(word) and not first:
+                first.append(time.perf_counter() - start)
+
+        text = pipeline.run(on_word)
+        graph = StageGraph()
+        graph.add('sentiment', lambda: analyze_sentiment(pipeline.recorded_audio(), pipeline.sample_rate))
+        graph.add('tts', lambda: None)
+        graph.add('finish', lambda *_: None, after=['sentiment', 'tts'], always=True)
+        graph.run(pool)
+        total.append(time.perf_counter() - start)
+        if first and text:
+            first_gif.append(first[0])
+    pool.shutdown()
+
+    return {
+        'time_to_first_gif_ms': round(statistics.median(first_gif) * 1000, 3) if first_gif else None,
+        'end_to_end_ms': round(statistics.median(total) * 1000, 3),
+    }
+
+
+def bench_population(rows, workdir, seed, workers=None):
+    """Sentetik nüfus üretimi ve demografik verinin okunup toplanma hızı."""
+    out_dir = Path(workdir) / f'population_{rows}'
+    start = time.perf_counter()
+    generate(rows, out_dir, seed=seed, block_size=max(1, min(rows, 1_000_000)), workers=workers)
+    generate_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    aggregate_file(out_dir).report()
+    aggregate_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = load_population(out_dir)
+    load_s = time.perf_counter() - start
+
+    return {
+        'generate_rows_per_s': round(rows / generate_s, 1),
+        'aggregate_rows_per_s': round(rows / aggregate_s, 1),
+        'load_rows_per_s': round(rows / load_s, 1),
+        'frame_mb': round(data.memory_usage(deep=True).sum() / 2**20, 2),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Sonuçları temel ölçümle karşılaştırır; gerilemelerin listesini döndürür."""
+    regressions = []
+    print(f"{'ölçüm':60} {'temel':>14} {'şimdi':>14} {'değişim':>9}")
+    for group, metrics in results['results'].items():
+        for name, value in metrics.items():
+            old = baseline.get('results', {}).get(group, {}).get(name)
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)) or not old:
+                continue
+            change = (value - old) / old
+            if name.endswith('_per_s'):
+                worse = change < -tolerance
+            elif name.endswith('_ms'):
+                worse = change > tolerance
+            else:
+                worse = False
+            mark = '  GERİLEME' if worse else ''
+            print(f"{group + '.' + name:60} {old:14.3f} {value:14.3f} {change:+9.1%}{mark}")
+            if worse:
+                regressions.append(f"{group}.{name}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EKTA performans ölçümleri")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000], help="Sentetik sözlük boyutları")
+    parser.add_argument('--words', type=int, default=5000, help="Çözümleme derlemindeki kelime sayısı")
+    parser.add_argument('--durations', type=float, nargs='+', default=[1.0, 3.0, 10.0], help="İfade süreleri (sn)")
+    parser.add_argument('--population', type=int, default=1_000_000, help="Sentetik nüfus satır sayısı")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', nargs='+', choices=['resolve', 'features', 'e2e', 'population'],
+                        default=['resolve', 'features', 'e2e', 'population'])
+    parser.add_argument('-o', '--out', help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument('--compare', help="Karşılaştırılacak temel ölçüm (JSON)")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="Gerileme sayılmayan en fazla göreli değişim")
+    args = parser.parse_args(argv)
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'params': {k: v for k, v in vars(args).items() if k not in ('out', 'compare')},
+        },
+        'results': {},
+    }
+
+    with tempfile.TemporaryDirectory() as workdir:
+        if 'resolve' in args.only:
+            for size in args.sizes:
+                print(f"Kelime çözümleme, sözlük boyutu {size}...")
+                results['results'][f'resolve_{size}'] = bench_resolve(size, args.words, workdir, args.seed)
+        if 'features' in args.only:
+            for seconds in args.durations:
+                print(f"Öznitelik çıkarma, {seconds:g} sn ifade...")
+                results['results'][f'features_{seconds:g}s'] = bench_features(seconds, args.repeat)
+        if 'e2e' in args.only:
+            print("Uçtan uca (akış modu, sahte tanıyıcı)...")
+            results['results']['end_to_end'] = bench_end_to_end(workdir, min(args.sizes), args.repeat, args.seed)
+        if 'population' in args.only:
+            print(f"Sentetik nüfus, {args.population} satır...")
+            results['results'][f'population_{args.population}'] = bench_population(args.population, workdir, args.seed)
+
+    print(json.dumps(results['results'], indent=2, ensure_ascii=False))
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("Gerileyen ölçümler:", ', '.join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
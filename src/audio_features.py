@@ -0,0 +1,77 @@
+from functools import cached_property
+
+import numpy as np
+
+HOP_LENGTH = 512
+FEATURE_GROUPS = ('mfcc', 'chroma', 'mel', 'contrast', 'tonnetz')
+
+
+class AudioFeatures:
+    """Tek bir STFT üzerinden türetilen, tembel hesaplanan ses öznitelikleri.
+
+    Genlik ve güç spektrogramı bir kez hesaplanır; MFCC, kroma, mel ve
+    spektral kontrast bunlardan türetilir. Her grup yalnızca ilk istendiğinde
+    hesaplanır, böylece sınıflandırıcının okumadığı gruplar (ör. tam HPSS
+    gerektiren tonnetz) hiç hesaplanmaz. Sonuçlar librosa'nın `y=` ile
+    çağrılan fonksiyonlarıyla aynıdır.
+    """
+
+    def __init__(self, audio, sr):
+        self.audio = np.asarray(audio)
+        self.sr = sr
+        # Kısa sinyallerde uyarı olmaması için n_fft sinyal uzunluğuna göre ayarlanır
+        self.n_fft = min(1024, len(self.audio))
+
+    @cached_property
+    def magnitude(self):
+        import librosa  # İlk öznitelik hesabında yüklenir; modül içe aktarımı hızlı kalır
+        return np.abs(librosa.stft(self.audio, n_fft=self.n_fft, hop_length=HOP_LENGTH))
+
+    @cached_property
+    def power(self):
+        return self.magnitude ** 2
+
+    @cached_property
+    def mel_spectrogram(self):
+        import librosa
+        return librosa.feature.melspectrogram(S=self.power, sr=self.sr, n_fft=self.n_fft, hop_length=HOP_LENGTH)
+
+    @cached_property
+    def log_mel(self):
+        import librosa
+        return librosa.power_to_db(self.mel_spectrogram)
+
+    def mfcc_mean(self, n_mfcc=40):
+        """İlk `n_mfcc` MFCC katsayısının zaman ortalaması."""
+        import librosa
+        return np.mean(librosa.feature.mfcc(S=self.log_mel, sr=self.sr, n_mfcc=n_mfcc), axis=1)
+
+    @cached_property
+    def mfcc(self):
+        return self.mfcc_mean(40)
+
+    @cached_property
+    def chroma(self):
+        import librosa
+        chroma = librosa.feature.chroma_stft(S=self.power, sr=self.sr, n_fft=self.n_fft, hop_length=HOP_LENGTH)
+        return np.mean(chroma, axis=1)
+
+    @cached_property
+    def mel(self):
+        return np.mean(self.mel_spectrogram, axis=1)
+
+    @cached_property
+    def contrast(self):
+        import librosa
+        contrast = librosa.feature.spectral_contrast(S=self.magnitude, sr=self.sr, n_fft=self.n_fft, hop_length=HOP_LENGTH)
+        return np.mean(contrast, axis=1)
+
+    @cached_property
+    def tonnetz(self):
+        import librosa
+        tonnetz = librosa.feature.tonnetz(y=librosa.effects.harmonic(self.audio), sr=self.sr)
+        return np.mean(tonnetz, axis=1)
+
+    def vector(self, groups=FEATURE_GROUPS):
+        """İstenen grupların ortalamalarını sırayla birleştirir."""
+        return np.concatenate([getattr(self, group) for group in groups])
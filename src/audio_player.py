@@ -0,0 +1,200 @@
+import heapq
+import itertools
+import threading
+
+from sound import get_pygame
+
+PRIORITY_HIGH = 0      # Ör. mikrofon açılış sesi: sıradaki her şeyin önüne geçer
+PRIORITY_NORMAL = 10
+
+
+class PygameSink:
+    """pygame mikseriyle çalan çıkış. Sesler `Sound` olarak bellekte çözülür."""
+
+    def __init__(self):
+        self._channel = None
+
+    def load(self, path):
+        return get_pygame().mixer.Sound(str(path))
+
+    def play(self, sound):
+        """Sesi başlatır ve süresini (saniye) döndürür."""
+        self._channel = sound.play()
+        return sound.get_length()
+
+    def stop(self):
+        if self._channel is not None:
+            self._channel.stop()
+            self._channel = None
+
+
+class NullSink:
+    """Ses aygıtı olmayan sunucular ve denemeler için: hiçbir şey çalmaz.
+
+    Çalınan dosyalar `played` listesine yazılır; `duration` verilirse her ses
+    o kadar sürmüş gibi beklenir.
+    """
+
+    def __init__(self, duration=0.0):
+        self.duration = duration
+        self.played = []
+
+    def load(self, path):
+        return str(path)
+
+    def play(self, sound):
+        self.played.append(sound)
+        return self.duration
+
+    def stop(self):
+        pass
+
+
+class Playback:
+    """Sıraya alınmış bir çalma isteği; `wait` ile bitmesi (ya da iptali) beklenir."""
+
+    def __init__(self, sources, priority, group):
+        self.sources = sources
+        self.priority = priority
+        self.group = group
+        self.cancelled = False
+        self.done = threading.Event()
+
+    def wait(self, timeout=None):
+        return self.done.wait(timeout)
+
+
+class AudioPlayer:
+    """Süreç boyunca açık kalan tek çıkışlı ses çalma servisi.
+
+    İstekler öncelik sırasına göre (eşit öncelikte geliş sırasıyla) tek bir
+    iş parçacığında çalınır, böylece üst üste gelen sesler mikseri birbirinin
+    altından kapatmaz. `cues` içindeki sabit efektler bir kez çözülüp bellekte
+    tutulur. Bir gruba ait istekler `cancel` ile sıradan atılır ve o an
+    çalıyorsa kesilir; çalma süresi sesin uzunluğu kadar bir olayda beklenir,
+    yoklama yapılmaz.
+    """
+
+    def __init__(self, sink=None, cues=None):
+        self.sink = sink or PygameSink()
+        self.cue_paths = dict(cues or {})
+        self.played = 0
+        self.cancelled = 0
+        self._cues = {}
+        self._queue = []
+        self._order = itertools.count()
+        self._current = None
+        self._interrupt = threading.Event()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def preload(self):
+        """Sabit efektleri çözüp bellekte tutar (ör. açılışta arka planda)."""
+        for name, path in self.cue_paths.items():
+            if name not in self._cues:
+                self._cues[name] = self.sink.load(path)
+
+    def play(self, *paths, priority=PRIORITY_NORMAL, group=None):
+        """Dosyaları sırayla çalınmak üzere kuyruğa ekler."""
+        return self._submit([('file', path) for path in paths if path], priority, group)
+
+    def cue(self, name, priority=PRIORITY_NORMAL, group=None):
+        """Önceden yüklenmiş efekti kuyruğa ekler."""
+        if name not in self.cue_paths:
+            raise KeyError(f"Tanımsız efekt: {name}")
+        return self._submit([('cue', name)], priority, group)
+
+    def cancel(self, group):
+        """Gruptaki bekleyen istekleri atar, çalmakta olanı keser."""
+        with self._cond:
+            kept = []
+            for entry in self._queue:
+                if entry[2].group == group:
+                    self._finish(entry[2], cancelled=True)
+                else:
+                    kept.append(entry)
+            heapq.heapify(kept)
+            self._queue = kept
+            current = self._current
+            if current is not None and current.group == group:
+                current.cancelled = True
+                self.sink.stop()
+                self._interrupt.set()
+
+    def pending(self):
+        with self._cond:
+            return len(self._queue)
+
+    def close(self):
+        """Kuyruktaki istekleri iptal eder ve çalma iş parçacığını durdurur."""
+        with self._cond:
+            self._closed = True
+            for entry in self._queue:
+                self._finish(entry[2], cancelled=True)
+            self._queue = []
+            if self._current is not None:
+                self._current.cancelled = True
+                self.sink.stop()
+                self._interrupt.set()
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def stats(self):
+        return {'played': self.played, 'cancelled': self.cancelled, 'pending': self.pending()}
+
+    def _submit(self, sources, priority, group):
+        playback = Playback(sources, priority, group)
+        with self._cond:
+            if self._closed or not sources:
+                self._finish(playback, cancelled=self._closed)
+                return playback
+            heapq.heappush(self._queue, (priority, next(self._order), playback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._worker, name='audio-player', daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return playback
+
+    def _finish(self, playback, cancelled=False):
+        if cancelled:
+            playback.cancelled = True
+            self.cancelled += 1
+        elif not playback.cancelled:
+            self.played += 1
+        else:
+            self.cancelled += 1
+        playback.done.set()
+
+    def _load(self, kind, value):
+        if kind == 'cue':
+            if value not in self._cues:
+                self._cues[value] = self.sink.load(self.cue_paths[value])
+            return self._cues[value]
+        return self.sink.load(value)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                playback = heapq.heappop(self._queue)[2]
+                self._current = playback
+                self._interrupt.clear()
+
+            for kind, value in playback.sources:
+                if playback.cancelled:
+                    break
+                try:
+                    duration = self.sink.play(self._load(kind, value))
+                    if duration:
+                        self._interrupt.wait(duration)
+                except Exception as e:
+                    print(f"Ses çalma hatası: {e}")
+
+            with self._cond:
+                self._current = None
+                self._finish(playback)
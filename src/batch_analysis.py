@@ -0,0 +1,123 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+import numpy as np
+
+from speech_to_text import analyze_sentiment_from_audio
+from emotion_classifier import ThresholdClassifier, DEFAULT_THRESHOLDS_PATH
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """Dosya içeriğinin SHA-1 özeti (değişmeyen dosyaları atlamak için)."""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_previous(out_path):
+    """Önceki çalıştırmaların JSONL çıktısını yol -> kayıt olarak okur."""
+    previous = {}
+    if not os.path.exists(out_path):
+        return previous
+    with open(out_path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Yarıda kalmış son satır
+            previous[record['path']] = record
+    return previous
+
+
+def _analyze_file(path, digest, classifier):
+    """İşçi süreçte tek bir dosyayı analiz eder; hatalar kayda yazılır."""
+    start = time.perf_counter()
+    record = {'path': path, 'sha1': digest, 'classifier': classifier.fingerprint()}
+    try:
+        record.update(analyze_sentiment_from_audio(path, classifier))
+    except Exception as e:
+        record['error'] = str(e)
+    record['seconds'] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def batch_analyze(directory, out_path, pattern='**/*.wav', workers=None, max_in_flight=None, classifier=None):
+    """Klasördeki ses dosyalarını süreç havuzunda analiz edip JSONL'e ekler.
+
+    Havuza aynı anda en fazla `max_in_flight` iş verilir, böylece binlerce
+    dosyalık arşivlerde bellek kullanımı sınırlı kalır. İçerik özeti önceki
+    çalıştırmadaki ile aynı olan (ve hatasız analiz edilmiş) dosyalar atlanır;
+    yalnızca eşikler değiştiyse kayıtlı öznitelikler ses yeniden işlenmeden
+    tek bir vektörel işlemle yeniden sınıflandırılır.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    classifier = classifier or ThresholdClassifier.from_file()
+    fingerprint = classifier.fingerprint()
+    previous = load_previous(out_path)
+    rescore = []
+    stats = {'processed': 0, 'skipped': 0, 'rescored': 0, 'errors': 0}
+    start = time.perf_counter()
+
+    def write(done, out):
+        for future in done:
+            record = future.result()
+            out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            stats['processed'] += 1
+            if 'error' in record:
+                stats['errors'] += 1
+        out.flush()
+
+    with open(out_path, 'a', encoding='utf-8') as out, ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = set()
+        for path in sorted(Path(directory).glob(pattern)):
+            path = str(path)
+            digest = file_digest(path)
+            record = previous.get(path)
+            if record and record.get('sha1') == digest and 'error' not in record:
+                if record.get('classifier') == fingerprint:
+                    stats['skipped'] += 1
+                    continue
+                if len(record.get('mean_values', ())) == classifier.feature_count:
+                    rescore.append(record)
+                    continue
+
+            in_flight.add(pool.submit(_analyze_file, path, digest, classifier))
+            if len(in_flight) >= max_in_flight:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                write(done, out)
+
+        write(in_flight, out)
+
+        if rescore:
+            labels = classifier.predict(np.array([record['mean_values'] for record in rescore]))
+            for record, label in zip(rescore, labels):
+                record.update(sentiment=str(label), classifier=fingerprint)
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+            stats['rescored'] = len(rescore)
+
+    stats['seconds'] = round(time.perf_counter() - start, 3)
+    stats['files_per_second'] = round(stats['processed'] / stats['seconds'], 2) if stats['seconds'] else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ses arşivleri için toplu duygu analizi")
+    parser.add_argument('directory', help="WAV dosyalarının bulunduğu klasör")
+    parser.add_argument('-o', '--out', default='emotion_results.jsonl', help="JSONL çıktı dosyası")
+    parser.add_argument('--pattern', default='**/*.wav', help="Dosya deseni (glob)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="İşçi süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument('--max-in-flight', type=int, default=None, help="Havuzdaki en fazla bekleyen iş sayısı")
+    parser.add_argument('--thresholds', default=str(DEFAULT_THRESHOLDS_PATH), help="Sınıflandırıcı eşik dosyası (JSON)")
+    args = parser.parse_args(argv)
+
+    classifier = ThresholdClassifier.from_file(args.thresholds)
+    stats = batch_analyze(args.directory, args.out, args.pattern, args.workers, args.max_in_flight, classifier)
+    print("Toplu analiz tamamlandı:", stats)
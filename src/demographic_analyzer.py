@@ -1,11 +1,12 @@
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from scipy import stats
 import xgboost as xgb
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
 from sklearn.pipeline import Pipeline
 from sklearn.compose import ColumnTransformer
 from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
@@ -19,27 +20,42 @@ from sklearn.metrics import (
 )
 from sklearn.feature_selection import SelectFromModel
 
+from demographic_data import CATEGORIES, DEFAULT_CHUNKSIZE, DemographicAggregator, compact, load_population
+from population_generator import generate_frame
+from model_search import model_search
+from demographic_plots import AGGREGATE_MIN_ROWS, compute_aggregates, draw
+from report_cache import ReportCache
+
+FIGURE_PATH = 'hearing_impaired_advanced_analysis.png'
+
 class AdvancedHearingImpairedAnalyzer:
-    def __init__(self, data_source=None):
+    def __init__(self, data_source=None, chunksize=DEFAULT_CHUNKSIZE, cache_dir=None, synthetic_size=10000,
+                 copula=False):
         """
         Gelişmiş demografik analiz için başlatma
         Gerçek veri kaynağı belirtilmezse sentetik veri üretilir
+        (copula=True: sütunlar arası korelasyonlu population_generator verisi)
+        Veri küçük tiplerle (category, float32) parça parça okunur; cache_dir
+        verilirse Parquet önbelleğinden yüklenir
         """
         if data_source is None:
-            self.data = self._generate_synthetic_data()
+            self.data = compact(self._generate_synthetic_data(synthetic_size, copula=copula))
         else:
-            self.data = pd.read_csv(data_source)
+            self.data = load_population(data_source, chunksize, cache_dir)
         
         # Veriön işleme
         self._preprocess_data()
     
-    def _generate_synthetic_data(self):
+    def _generate_synthetic_data(self, size=10000, seed=42, copula=False):
         """
         Yüksek kaliteli sentetik veri üretimi
-        Gerçekçi dağılımlar ve korelasyonlar
+        Varsayılan: sütunlar birbirinden bağımsız örneklenir
+        copula=True: aynı marjinaller, Gauss kopula ile korelasyonlu sütunlar
         """
-        np.random.seed(42)
-        size = 10000
+        if copula:
+            return generate_frame(size, seed)
+
+        np.random.seed(seed)
         
         data = pd.DataFrame({
             'yaş': np.random.normal(40, 15, size).clip(0, 85),
@@ -69,10 +85,9 @@ class AdvancedHearingImpairedAnalyzer:
         Gelişmiş veri ön işleme
         Eksik veri, kodlama, ölçeklendirme
         """
-        # Kategorik değişkenleri kodlama
-        le = LabelEncoder()
-        for col in ['cinsiyet', 'engellilik_seviyesi', 'iletişim_yöntemi', 'eğitim_durumu']:
-            self.data[col] = le.fit_transform(self.data[col])
+        # Kategorik değişkenleri kodlama (sıralı kategori kodları, int8)
+        for col in CATEGORIES:
+            self.data[col] = self.data[col].cat.codes
         
         # Yaş grupları
         self.data['yaş_grubu'] = pd.cut(
@@ -86,24 +101,26 @@ class AdvancedHearingImpairedAnalyzer:
         Detaylı demografik analiz
         İstatistiksel testler ve güven aralıkları
         """
-        demografik_rapor = {
-            'toplam_nufus': len(self.data),
-            'cinsiyet_dagilimi': self.data['cinsiyet'].value_counts(normalize=True),
-            'engellilik_dagilimi': self.data['engellilik_seviyesi'].value_counts(normalize=True),
-            'yas_grubu_dagilimi': self.data['yaş_grubu'].value_counts(normalize=True),
-            'iletisim_yontemi_dagilimi': self.data['iletişim_yöntemi'].value_counts(normalize=True),
-            'egitim_durumu_dagilimi': self.data['eğitim_durumu'].value_counts(normalize=True),
-            'istatistiksel_testler': {
-                'cinsiyet_normallik_testi': stats.normaltest(self.data['cinsiyet']).pvalue,
-                'sosyal_katilim_varyans': np.var(self.data['sosyal_katılım'])
-            }
-        }
-        return demografik_rapor
+        return self._demografik_toplayici().report()
     
-    def gelişmiş_ml_modeli(self):
+    def _demografik_toplayici(self, start=0):
+        """
+        `start` satırından itibaren dağılımlar ve momentler, parça parça
+        (bellekte tutulamayan dosyalar için demographic_data.aggregate_file)
+        """
+        toplayici = DemographicAggregator()
+        for i in range(start, len(self.data), DEFAULT_CHUNKSIZE):
+            toplayici.update(self.data.iloc[i:i + DEFAULT_CHUNKSIZE])
+        return toplayici
+    
+    def gelişmiş_ml_modeli(self, n_jobs=-1, halving=False, cache_dir=None):
         """
         Çoklu makine öğrenmesi modelleri
         Karmaşık öznitelik seçimi ve hiperparametre optimizasyonu
+        Katlar paralel eğitilir, öznitelik seçici adaylar arasında önbellekten
+        paylaşılır; çapraz doğrulama skorları aramadan alınır (model_search),
+        bu yüzden tüm veri yerine yalnızca eğitim kısmının (X_train) katlarındandır.
+        halving=True iken accuracy hesaplanmaz; skorlar seçim metriğiyle (f1) verilir
         """
         # Öznitelik hazırlama
         X = self.data.drop('sosyal_katılım', axis=1)
@@ -116,7 +133,7 @@ class AdvancedHearingImpairedAnalyzer:
         pipeline = Pipeline([
             ('imputer', SimpleImputer(strategy='median')),
             ('scaler', StandardScaler()),
-            ('feature_selector', SelectFromModel(estimator=RandomForestClassifier())),
+            ('feature_selector', SelectFromModel(estimator=RandomForestClassifier(random_state=42))),
             ('classifier', GradientBoostingClassifier())
         ])
         
@@ -126,25 +143,39 @@ class AdvancedHearingImpairedAnalyzer:
             'classifier__learning_rate': [0.01, 0.1, 0.3]
         }
         
-        grid_search = GridSearchCV(pipeline, param_grid, cv=5, scoring='f1')
-        grid_search.fit(X_train, y_train)
+        arama = model_search(pipeline, param_grid, X_train, y_train, cv=5, n_jobs=n_jobs,
+                             cache_dir=cache_dir, halving=halving)
+        print(f"Model araması: {arama.stats()}")
+        cv_metrigi = 'accuracy' if 'accuracy' in arama.metrics else arama.metrics[0]
         
         # En iyi model ile tahminleme
-        y_pred = grid_search.predict(X_test)
+        y_pred = arama.best_estimator_.predict(X_test)
         
         return {
-            'en_iyi_parametreler': grid_search.best_params_,
+            'en_iyi_parametreler': arama.best_params_,
             'f1_skoru': f1_score(y_test, y_pred),
             'roc_auc_skoru': roc_auc_score(y_test, y_pred),
             'siniflandirma_raporu': classification_report(y_test, y_pred),
-            'çapraz_doğrulama_skorları': cross_val_score(grid_search.best_estimator_, X, y, cv=5)
+            'çapraz_doğrulama_skorları': arama.cv_scores(cv_metrigi),
+            'çapraz_doğrulama_metriği': cv_metrigi,
+            'arama_istatistikleri': arama.stats()
         }
     
-    def gelişmiş_gorsellestime(self):
+    def _ozet_kipi(self, mod):
+        return mod == 'ozet' or (mod == 'auto' and len(self.data) >= AGGREGATE_MIN_ROWS)
+    
+    def gelişmiş_gorsellestime(self, mod='auto', workers=None, ozet=None):
         """
         Gelişmiş veri görselleştirmeleri
         Çoklu grafik türleri ve istatistiksel gösterimler
+        mod='ozet': grafikler satır sayısından bağımsız özetlerden (2B sayılar,
+        histogram KDE'leri, kantiller) çizilir; 'ham': tüm satırlar seaborn'a
+        verilir; 'auto': büyük verilerde özet kipi
         """
+        if self._ozet_kipi(mod):
+            draw(ozet or compute_aggregates(self.data, workers), FIGURE_PATH)
+            return
+        
         plt.figure(figsize=(20, 15))
         
         # Detaylı alt grafikler
@@ -169,16 +200,43 @@ class AdvancedHearingImpairedAnalyzer:
         plt.title('Değişkenler Arası Korelasyon')
         
         plt.tight_layout()
-        plt.savefig('hearing_impaired_advanced_analysis.png')
+        plt.savefig(FIGURE_PATH)
         plt.close()
     
-    def kapsamlı_rapor_olustur(self):
+    def kapsamlı_rapor_olustur(self, cache_dir=None, mod='auto'):
         """
         Detaylı ve profesyonel rapor üretimi
+        cache_dir verilirse bölümler (demografi, model, grafik) veri parmak izi
+        ve parametrelere göre ayrı ayrı önbelleklenir; değişmeyen veride rapor
+        yeniden hesaplanmadan döner. Veriye yalnızca satır eklendiyse
+        demografik ve grafik özetleri yalnızca yeni satırlarla güncellenir.
         """
-        demografik_analiz = self.demografik_analiz()
-        ml_analiz = self.gelişmiş_ml_modeli()
-        self.gelişmiş_gorsellestime()
+        if cache_dir is None:
+            demografik_analiz = self.demografik_analiz()
+            ml_analiz = self.gelişmiş_ml_modeli()
+            self.gelişmiş_gorsellestime(mod)
+        else:
+            onbellek = ReportCache(cache_dir, self.data)
+            demografik_analiz = onbellek.incremental(
+                'demografik',
+                build=self._demografik_toplayici,
+                extend=lambda toplayici, n: toplayici.merge(self._demografik_toplayici(n))
+            ).report()
+            ml_analiz = onbellek.get_or_compute('model', self.gelişmiş_ml_modeli)
+            
+            ozet_kipi = self._ozet_kipi(mod)
+            def grafik():
+                ozet = None
+                if ozet_kipi:
+                    ozet = onbellek.incremental(
+                        'grafik_ozet',
+                        build=lambda: compute_aggregates(self.data),
+                        extend=lambda ozet, n: ozet.merge(compute_aggregates(self.data.iloc[n:]))
+                    )
+                self.gelişmiş_gorsellestime(mod, ozet=ozet)
+                return Path(FIGURE_PATH).read_bytes()
+            Path(FIGURE_PATH).write_bytes(onbellek.get_or_compute('grafik', grafik, {'ozet': ozet_kipi}))
+            print(f"Rapor önbelleği: {onbellek.stats}")
         
         rapor = f"""
 İŞİTME ENGELLİLER GELİŞMİŞ DEMOGRAFİK ANALİZ RAPORU
@@ -200,10 +258,10 @@ class AdvancedHearingImpairedAnalyzer:
    - ROC AUC Skoru: {ml_analiz['roc_auc_skoru']:.4f}
    - En İyi Parametreler: {ml_analiz['en_iyi_parametreler']}
 
-4. Çapraz Doğrulama Sonuçları:
+4. Çapraz Doğrulama Sonuçları ({ml_analiz.get('çapraz_doğrulama_metriği', 'accuracy')}, eğitim verisi):
    {ml_analiz['çapraz_doğrulama_skorları']}
 
-Detaylı görselleştirmeler için 'hearing_impaired_advanced_analysis.png' dosyasını inceleyiniz.
+Detaylı görselleştirmeler için '{FIGURE_PATH}' dosyasını inceleyiniz.
 """
         return rapor
 
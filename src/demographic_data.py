@@ -0,0 +1,367 @@
+import argparse
+import hashlib
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+# Kategoriler sıralıdır; kodları LabelEncoder'ın verdiği kodlarla aynıdır.
+# Listede olmayan değerler eksik (kod -1) sayılır ve `compact` bunları uyarıyla bildirir.
+CATEGORIES = {
+    'cinsiyet': ['Erkek', 'Kadın'],
+    'engellilik_seviyesi': sorted(['Hafif', 'Orta', 'Ağır']),
+    'iletişim_yöntemi': sorted(['İşaret Dili', 'Dudak Okuma', 'İşitme Cihazı', 'Koklear İmplant', 'Karma Yöntem']),
+    'eğitim_durumu': sorted(['İlkokul', 'Ortaokul', 'Lise', 'Üniversite', 'Lisansüstü']),
+}
+NUMERIC_COLUMNS = ['yaş', 'sosyal_katılım', 'gelir_seviyesi']
+AGE_BINS = [0, 18, 35, 50, 65, 100]
+AGE_LABELS = [0, 1, 2, 3, 4]
+
+DTYPES = {column: pd.CategoricalDtype(values) for column, values in CATEGORIES.items()}
+DTYPES.update({column: np.float32 for column in NUMERIC_COLUMNS})
+
+DEFAULT_CHUNKSIZE = 250_000
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / 'static' / 'population_cache'
+
+# demografik_analiz raporundaki dağılım anahtarı -> sütun
+DISTRIBUTIONS = {
+    'cinsiyet_dagilimi': 'cinsiyet',
+    'engellilik_dagilimi': 'engellilik_seviyesi',
+    'yas_grubu_dagilimi': 'yaş_grubu',
+    'iletisim_yontemi_dagilimi': 'iletişim_yöntemi',
+    'egitim_durumu_dagilimi': 'eğitim_durumu',
+}
+
+
+def compact(frame, unknown=None):
+    """Sütunları küçük tiplere çevirir: kategoriler `category`, sayılar float32.
+
+    CATEGORIES'te olmayan değerler eksik (kod -1) olur; bunlar sütun ve
+    değere göre sayılıp `unknown` sözlüğüne eklenir. `unknown` verilmezse
+    sayılar hemen uyarı olarak yazdırılır.
+    """
+    found = {}
+    for column in CATEGORIES:
+        if column not in frame.columns or frame[column].dtype == DTYPES[column]:
+            continue
+        raw = frame[column]
+        lost = raw.notna() & raw.astype(DTYPES[column]).isna()
+        if lost.any():
+            found[column] = raw[lost].astype(str).value_counts().to_dict()
+    if unknown is None:
+        warn_unknown(found)
+    else:
+        for column, counts in found.items():
+            total = unknown.setdefault(column, {})
+            for value, count in counts.items():
+                total[value] = total.get(value, 0) + count
+    return frame.astype({column: dtype for column, dtype in DTYPES.items() if column in frame.columns})
+
+
+def warn_unknown(unknown):
+    """`compact` sayımlarını uyarı olarak yazdırır."""
+    for column, counts in unknown.items():
+        values = ', '.join(f"{value!r} ({count})" for value, count in
+                           sorted(counts.items(), key=lambda item: -item[1])[:10])
+        print(f"Uyarı: '{column}' sütununda bilinmeyen {sum(counts.values())} değer eksik sayıldı: {values}")
+
+
+def age_groups(age):
+    """Yaş grubu kodları (0-4, aralık dışı -1), int8."""
+    groups = pd.cut(age, bins=AGE_BINS, labels=AGE_LABELS)
+    return groups.cat.codes.to_numpy(np.int8)
+
+
+def is_parquet(path):
+    """Parquet dosyası ya da parça klasörü (ör. population_generator çıktısı) mı?"""
+    path = Path(path)
+    return path.is_dir() or path.suffix == '.parquet'
+
+
+def category_codes(chunk, column):
+    """Ham (metin kategorili) ya da kodlanmış parçadaki sütunun kodları; eksik değerler -1.
+
+    Parçada `yaş_grubu` yoksa yaştan hesaplanır.
+    """
+    if column == 'yaş_grubu' and column not in chunk.columns:
+        return age_groups(chunk['yaş'])
+    series = chunk[column]
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.cat.codes
+    return series.to_numpy()
+
+
+def read_chunks(path, chunksize=DEFAULT_CHUNKSIZE):
+    """CSV'yi ya da Parquet parçalarını küçük tiplerle `chunksize` satırlık parçalar halinde okur.
+
+    Bilinmeyen kategori değerleri okuma bitince tek uyarıda toplanır.
+    """
+    unknown = {}
+    if is_parquet(path):
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        for part in sorted(path.glob('*.parquet')) if path.is_dir() else [path]:
+            for batch in pq.ParquetFile(part).iter_batches(batch_size=chunksize):
+                yield compact(batch.to_pandas(), unknown)
+    else:
+        # Kategoriler önce dosyadan çıkarılır ki listede olmayan değerler sayılabilsin
+        header = pd.read_csv(path, nrows=0).columns
+        dtype = {column: 'category' if column in CATEGORIES else dtype
+                 for column, dtype in DTYPES.items() if column in header}
+        for chunk in pd.read_csv(path, dtype=dtype, chunksize=chunksize):
+            yield compact(chunk, unknown)
+    warn_unknown(unknown)
+
+
+class Moments:
+    """Bir sütunun sayısı, ortalaması ve 2.-4. merkezi moment toplamları.
+
+    Parça istatistikleri Welford/Pébay birleştirme formülleriyle eklenir;
+    veri bir kez ve parça parça okunarak varyans, çarpıklık, basıklık ve
+    D'Agostino-Pearson normallik testi hesaplanır.
+    """
+
+    __slots__ = ('n', 'mean', 'm2', 'm3', 'm4')
+
+    def __init__(self, n=0, mean=0.0, m2=0.0, m3=0.0, m4=0.0):
+        self.n, self.mean, self.m2, self.m3, self.m4 = n, mean, m2, m3, m4
+
+    @classmethod
+    def of(cls, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return cls()
+        mean = values.mean()
+        d = values - mean
+        d2 = d * d
+        return cls(len(values), mean, d2.sum(), (d2 * d).sum(), (d2 * d2).sum())
+
+    def merge(self, other):
+        if not other.n:
+            return self
+        if not self.n:
+            self.n, self.mean, self.m2, self.m3, self.m4 = other.n, other.mean, other.m2, other.m3, other.m4
+            return self
+        na, nb = self.n, other.n
+        n = na + nb
+        d = other.mean - self.mean
+        d2 = d * d
+        m4 = (self.m4 + other.m4 + d2 * d2 * na * nb * (na * na - na * nb + nb * nb) / n ** 3
+              + 6 * d2 * (na * na * other.m2 + nb * nb * self.m2) / n ** 2
+              + 4 * d * (na * other.m3 - nb * self.m3) / n)
+        m3 = (self.m3 + other.m3 + d2 * d * na * nb * (na - nb) / n ** 2
+              + 3 * d * (na * other.m2 - nb * self.m2) / n)
+        self.m2 += other.m2 + d2 * na * nb / n
+        self.m3, self.m4 = m3, m4
+        self.mean += d * nb / n
+        self.n = n
+        return self
+
+    def update(self, values):
+        return self.merge(Moments.of(values))
+
+    @property
+    def variance(self):
+        """Anakütle varyansı (np.var ile aynı, ddof=0)."""
+        return self.m2 / self.n if self.n else float('nan')
+
+    @property
+    def skewness(self):
+        return np.sqrt(self.n) * self.m3 / self.m2 ** 1.5 if self.m2 else 0.0
+
+    @property
+    def kurtosis(self):
+        """Pearson basıklığı (normal dağılım için 3)."""
+        return self.n * self.m4 / self.m2 ** 2 if self.m2 else 3.0
+
+    def normaltest(self):
+        """scipy.stats.normaltest ile aynı sonuç, veriyi yeniden okumadan."""
+        return normaltest_from_moments(self.n, self.skewness, self.kurtosis)
+
+
+def normaltest_from_moments(n, skewness, kurtosis):
+    """Örnek çarpıklığı ve Pearson basıklığından D'Agostino-Pearson testi (statistic, pvalue)."""
+    n = float(n)
+    y = skewness * np.sqrt((n + 1) * (n + 3) / (6.0 * (n - 2)))
+    beta2 = 3.0 * (n * n + 27 * n - 70) * (n + 1) * (n + 3) / ((n - 2) * (n + 5) * (n + 7) * (n + 9))
+    w2 = -1 + np.sqrt(2 * (beta2 - 1))
+    delta = 1 / np.sqrt(0.5 * np.log(w2))
+    alpha = np.sqrt(2.0 / (w2 - 1))
+    y = y if y != 0 else 1
+    z_skew = delta * np.log(y / alpha + np.sqrt((y / alpha) ** 2 + 1))
+
+    expected = 3.0 * (n - 1) / (n + 1)
+    variance = 24.0 * n * (n - 2) * (n - 3) / ((n + 1) ** 2 * (n + 3) * (n + 5))
+    x = (kurtosis - expected) / np.sqrt(variance)
+    sqrtbeta1 = 6.0 * (n * n - 5 * n + 2) / ((n + 7) * (n + 9)) * np.sqrt(6.0 * (n + 3) * (n + 5) / (n * (n - 2) * (n - 3)))
+    a = 6.0 + 8.0 / sqrtbeta1 * (2.0 / sqrtbeta1 + np.sqrt(1 + 4.0 / sqrtbeta1 ** 2))
+    denom = 1 + x * np.sqrt(2 / (a - 4.0))
+    term2 = np.sign(denom) * ((1 - 2.0 / a) / abs(denom)) ** (1 / 3.0) if denom else float('nan')
+    z_kurt = (1 - 2 / (9.0 * a) - term2) / np.sqrt(2 / (9.0 * a))
+
+    statistic = z_skew ** 2 + z_kurt ** 2
+    return statistic, stats.chi2.sf(statistic, 2)
+
+
+class DemographicAggregator:
+    """`demografik_analiz` raporunu veriyi parça parça okuyarak üretir.
+
+    Kategorik sütunlar için kod sayaçları, sayısal sütunlar için `Moments`
+    tutulur; bellek kullanımı satır sayısından bağımsızdır. İki toplayıcı
+    `merge` ile birleştirilebilir (ör. yeni eklenen satırlar için).
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.counts = {column: np.zeros(len(CATEGORIES.get(column, AGE_LABELS)), dtype=np.int64)
+                       for column in DISTRIBUTIONS.values()}
+        self.moments = {column: Moments() for column in ['cinsiyet'] + NUMERIC_COLUMNS}
+
+    def update(self, chunk):
+        """Ham (metin kategorili) ya da kodlanmış bir parçayı ekler."""
+        self.rows += len(chunk)
+        codes = {column: category_codes(chunk, column) for column in DISTRIBUTIONS.values()}
+
+        for column, counts in self.counts.items():
+            values = codes[column]
+            values = values[values >= 0]
+            counts += np.bincount(values.astype(np.intp), minlength=len(counts))[:len(counts)]
+
+        cinsiyet = codes['cinsiyet']
+        self.moments['cinsiyet'].update(cinsiyet[cinsiyet >= 0])
+        for column in NUMERIC_COLUMNS:
+            self.moments[column].update(chunk[column].to_numpy())
+        return self
+
+    def merge(self, other):
+        self.rows += other.rows
+        for column, counts in other.counts.items():
+            self.counts[column] += counts
+        for column, moments in other.moments.items():
+            self.moments[column].merge(moments)
+        return self
+
+    def distribution(self, column):
+        """`value_counts(normalize=True)` karşılığı: kod -> oran, büyükten küçüğe."""
+        counts = pd.Series(self.counts[column], index=range(len(self.counts[column])))
+        counts = counts[counts > 0].sort_values(ascending=False, kind='stable')
+        return counts / counts.sum()
+
+    def report(self):
+        return {
+            'toplam_nufus': self.rows,
+            **{key: self.distribution(column) for key, column in DISTRIBUTIONS.items()},
+            'istatistiksel_testler': {
+                'cinsiyet_normallik_testi': self.moments['cinsiyet'].normaltest()[1],
+                'sosyal_katilim_varyans': self.moments['sosyal_katılım'].variance,
+            },
+        }
+
+
+def aggregate_file(path, chunksize=DEFAULT_CHUNKSIZE):
+    """CSV'nin demografik raporunu tamamını belleğe almadan hesaplar."""
+    aggregator = DemographicAggregator()
+    for chunk in read_chunks(path, chunksize):
+        aggregator.update(chunk)
+    return aggregator
+
+
+def cache_path(path, cache_dir=DEFAULT_CACHE_DIR):
+    """Kaynak dosyanın yolu, boyutu ve değişiklik zamanına bağlı Parquet önbellek yolu."""
+    stat = os.stat(path)
+    key = f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    return Path(cache_dir) / (hashlib.sha1(key.encode('utf-8')).hexdigest()[:16] + '.parquet')
+
+
+def load_population(path, chunksize=DEFAULT_CHUNKSIZE, cache_dir=None):
+    """CSV'yi küçük tiplerle parça parça okuyup tek DataFrame döndürür.
+
+    Parquet kaynaklar (dosya ya da parça klasörü) doğrudan okunur.
+
+    `cache_dir` verilirse sonuç Parquet olarak saklanır ve kaynak dosya
+    değişmedikçe sonraki çalıştırmalar doğrudan bu sütunsal önbellekten
+    (kategoriler korunarak) okunur. Parquet için pyarrow gerekir; yoksa
+    önbellek kullanılmaz.
+    """
+    if is_parquet(path):
+        return compact(pd.read_parquet(path))
+    cached = cache_path(path, cache_dir) if cache_dir else None
+    if cached and cached.exists():
+        try:
+            return pd.read_parquet(cached)
+        except Exception as e:
+            print(f"Önbellek okuma hatası ({cached}): {e}")
+
+    data = pd.concat(read_chunks(path, chunksize), ignore_index=True)
+
+    if cached:
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cached.with_suffix('.tmp')
+            data.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, cached)
+        except Exception as e:
+            print(f"Önbellek yazma hatası ({cached}): {e}")
+    return data
+
+
+def measure(fn):
+    """`fn` çağrısının sonucu, süresi (sn) ve tracemalloc tepe belleği (bayt)."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = fn()
+        seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def memory_report(path, chunksize=DEFAULT_CHUNKSIZE, cache_dir=None):
+    """Varsayılan tiplerle tam okuma ile küçük tipli/parçalı okumanın bellek karşılaştırması."""
+    rows = []
+    plain, seconds, peak = measure(lambda: pd.read_csv(path))
+    rows.append(('pd.read_csv (varsayılan tipler)', seconds, peak, plain.memory_usage(deep=True).sum()))
+    del plain
+    data, seconds, peak = measure(lambda: load_population(path, chunksize, cache_dir))
+    rows.append(('load_population (küçük tipler)', seconds, peak, data.memory_usage(deep=True).sum()))
+    del data
+    if cache_dir:
+        data, seconds, peak = measure(lambda: load_population(path, chunksize, cache_dir))
+        rows.append(('load_population (Parquet önbelleği)', seconds, peak, data.memory_usage(deep=True).sum()))
+        del data
+    aggregator, seconds, peak = measure(lambda: aggregate_file(path, chunksize))
+    rows.append(('aggregate_file (parçalı, bellekte tutmadan)', seconds, peak, 0))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Demografik veri okuma ve bellek ölçümü")
+    parser.add_argument('path', help="CSV dosyası ya da Parquet dosyası/klasörü")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument('--cache-dir', help="Parquet önbellek klasörü")
+    parser.add_argument('--memory', action='store_true', help="Varsayılan okuma ile bellek karşılaştırması")
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        print(f"{'yöntem':45} {'süre (sn)':>10} {'tepe (MB)':>10} {'tablo (MB)':>11}")
+        for name, seconds, peak, size in memory_report(args.path, args.chunksize, args.cache_dir):
+            print(f"{name:45} {seconds:10.3f} {peak / 2**20:10.1f} {size / 2**20:11.1f}")
+        return
+
+    report = aggregate_file(args.path, args.chunksize).report()
+    print(f"Toplam nüfus: {report['toplam_nufus']}")
+    for key in DISTRIBUTIONS:
+        print(f"{key}: {report[key].round(4).to_dict()}")
+    print(report['istatistiksel_testler'])
+
+
+if __name__ == "__main__":
+    main()
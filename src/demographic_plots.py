@@ -0,0 +1,197 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.colors import LogNorm
+from scipy.ndimage import gaussian_filter1d
+
+from demographic_data import CATEGORIES, category_codes
+
+AGE_EDGES = np.linspace(0, 100, 101)             # 1 yıllık yaş aralıkları (yaş_grubu sınırlarıyla aynı)
+PARTICIPATION_EDGES = np.linspace(0, 100, 501)   # Sosyal katılım: kantiller ve KDE için 0.2'lik aralıklar
+SCATTER_EDGES = np.linspace(0, 100, 101)
+CORRELATION_COLUMNS = ['yaş', 'cinsiyet', 'engellilik_seviyesi', 'iletişim_yöntemi', 'eğitim_durumu',
+                       'sosyal_katılım', 'gelir_seviyesi', 'yaş_grubu']
+DEFAULT_CHUNKSIZE = 500_000
+AGGREGATE_MIN_ROWS = 100_000  # 'auto' kipinde bu satır sayısından itibaren özetlerden çizilir
+
+
+def _grouped_histogram(groups, values, n_groups, edges):
+    """Her grup için `values` histogramı; (n_groups, len(edges) - 1)."""
+    valid = groups >= 0
+    counts, _, _ = np.histogram2d(groups[valid], values[valid],
+                                  bins=[np.arange(n_groups + 1) - 0.5, edges])
+    return counts
+
+
+class PlotAggregates:
+    """`gelişmiş_gorsellestime` grafikleri için satır sayısından bağımsız özetler.
+
+    Kutu ve keman grafikleri için gruplara göre ince aralıklı histogramlar,
+    yığılmış histogram için cinsiyete göre yaş sayıları, saçılım grafiği için
+    2B sayılar ve korelasyon için birleştirilebilir kovaryans tutulur. Aralıklar
+    sabit olduğundan parçaların özetleri toplanarak birleştirilir.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.disability = np.zeros((len(CATEGORIES['engellilik_seviyesi']), len(PARTICIPATION_EDGES) - 1))
+        self.communication = np.zeros((len(CATEGORIES['iletişim_yöntemi']), len(PARTICIPATION_EDGES) - 1))
+        self.age_by_gender = np.zeros((len(CATEGORIES['cinsiyet']), len(AGE_EDGES) - 1))
+        self.scatter = np.zeros((len(AGE_EDGES) - 1, len(SCATTER_EDGES) - 1))
+        self.columns = []
+        self.n = 0
+        self.mean = None
+        self.comoment = None
+
+    def update(self, chunk):
+        self.rows += len(chunk)
+        # Aralık dışındaki değerler uçtaki aralıklara sayılır; hiçbir satır dışarıda kalmaz
+        participation = chunk['sosyal_katılım'].to_numpy(np.float64).clip(PARTICIPATION_EDGES[0], PARTICIPATION_EDGES[-1])
+        age = chunk['yaş'].to_numpy(np.float64).clip(AGE_EDGES[0], AGE_EDGES[-1])
+        codes = {column: category_codes(chunk, column) for column in list(CATEGORIES) + ['yaş_grubu']}
+
+        self.disability += _grouped_histogram(codes['engellilik_seviyesi'], participation,
+                                              len(self.disability), PARTICIPATION_EDGES)
+        self.communication += _grouped_histogram(codes['iletişim_yöntemi'], participation,
+                                                 len(self.communication), PARTICIPATION_EDGES)
+        self.age_by_gender += _grouped_histogram(codes['cinsiyet'], age, len(self.age_by_gender), AGE_EDGES)
+        self.scatter += np.histogram2d(age, participation, bins=[AGE_EDGES, SCATTER_EDGES])[0]
+
+        self.columns = [column for column in CORRELATION_COLUMNS if column in codes or column in chunk.columns]
+        matrix = np.column_stack([codes[column] if column in codes else chunk[column].to_numpy(np.float64)
+                                  for column in self.columns]).astype(np.float64)
+        coded = [self.columns.index(column) for column in codes if column in self.columns]
+        matrix = matrix[~np.isnan(matrix).any(axis=1) & (matrix[:, coded] >= 0).all(axis=1)]
+        if len(matrix):
+            mean = matrix.mean(axis=0)
+            centered = matrix - mean
+            self._merge_moments(len(matrix), mean, centered.T @ centered)
+        return self
+
+    def _merge_moments(self, n, mean, comoment):
+        if not self.n:
+            self.n, self.mean, self.comoment = n, mean, comoment
+            return
+        total = self.n + n
+        delta = mean - self.mean
+        self.comoment = self.comoment + comoment + np.outer(delta, delta) * self.n * n / total
+        self.mean = self.mean + delta * n / total
+        self.n = total
+
+    def merge(self, other):
+        self.rows += other.rows
+        for name in ('disability', 'communication', 'age_by_gender', 'scatter'):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        if other.n:
+            self.columns = other.columns
+            self._merge_moments(other.n, other.mean, other.comoment)
+        return self
+
+    def correlation(self):
+        std = np.sqrt(np.diag(self.comoment))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.comoment / np.outer(std, std)
+
+
+def compute_aggregates(data, workers=None, chunksize=DEFAULT_CHUNKSIZE):
+    """DataFrame'in ya da parça akışının (ör. read_chunks) özetleri.
+
+    DataFrame parçalara bölünür ve parçalar iş parçacığı havuzunda özetlenir;
+    numpy histogramları GIL'i bıraktığından çekirdekler birlikte çalışır.
+    """
+    if hasattr(data, 'iloc'):
+        chunks = (data.iloc[start:start + chunksize] for start in range(0, len(data), chunksize))
+    else:
+        chunks = data
+    total = PlotAggregates()
+    with ThreadPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for part in pool.map(lambda chunk: PlotAggregates().update(chunk), chunks):
+            total.merge(part)
+    return total
+
+
+def histogram_quantiles(counts, edges, qs):
+    """Histogramdan kantiller (aralık içinde doğrusal ara değerleme)."""
+    cdf = np.concatenate([[0.0], np.cumsum(counts)])
+    cdf /= cdf[-1]
+    return np.interp(qs, cdf, edges)
+
+
+def box_stats(counts, edges, label):
+    """Histogramdan `Axes.bxp` için kutu grafiği istatistikleri."""
+    q1, median, q3 = histogram_quantiles(counts, edges, [0.25, 0.5, 0.75])
+    nonzero = np.flatnonzero(counts)
+    low, high = edges[nonzero[0]], edges[nonzero[-1] + 1]
+    iqr = q3 - q1
+    return {'label': label, 'q1': q1, 'med': median, 'q3': q3,
+            'whislo': max(low, q1 - 1.5 * iqr), 'whishi': min(high, q3 + 1.5 * iqr), 'fliers': []}
+
+
+def binned_kde(counts, edges):
+    """Histogram üzerinde Gauss düzeltmesiyle KDE (Scott bant genişliği)."""
+    centers = (edges[:-1] + edges[1:]) / 2
+    n = counts.sum()
+    mean = (counts * centers).sum() / n
+    std = np.sqrt((counts * (centers - mean) ** 2).sum() / n)
+    bandwidth = 1.06 * std * n ** (-1 / 5)
+    density = gaussian_filter1d(counts, sigma=max(bandwidth / (edges[1] - edges[0]), 1.0), mode='constant')
+    return centers, density / density.max()
+
+
+def draw(aggregates, path='hearing_impaired_advanced_analysis.png'):
+    """Özetlerden `gelişmiş_gorsellestime` ile aynı düzende grafikleri çizer."""
+    disability_labels = CATEGORIES['engellilik_seviyesi']
+    communication_labels = CATEGORIES['iletişim_yöntemi']
+    plt.figure(figsize=(20, 15))
+
+    ax = plt.subplot(2, 3, 1)
+    ax.bxp([box_stats(counts, PARTICIPATION_EDGES, label)
+            for counts, label in zip(aggregates.disability, disability_labels) if counts.any()], showfliers=False)
+    ax.set_xlabel('engellilik_seviyesi')
+    ax.set_ylabel('sosyal_katılım')
+    plt.title('Engellilik Seviyesine Göre Sosyal Katılım')
+
+    ax = plt.subplot(2, 3, 2)
+    for i, counts in enumerate(aggregates.communication):
+        if not counts.any():
+            continue
+        centers, density = binned_kde(counts, PARTICIPATION_EDGES)
+        ax.fill_betweenx(centers, i - 0.4 * density, i + 0.4 * density, alpha=0.7)
+        q1, median, q3 = histogram_quantiles(counts, PARTICIPATION_EDGES, [0.25, 0.5, 0.75])
+        ax.vlines(i, q1, q3, color='k', linewidth=4)
+        ax.scatter([i], [median], color='white', zorder=3)
+    ax.set_xticks(range(len(communication_labels)), communication_labels, rotation=20)
+    ax.set_ylabel('sosyal_katılım')
+    plt.title('İletişim Yöntemlerine Göre Sosyal Katılım')
+
+    ax = plt.subplot(2, 3, 3)
+    bottom = np.zeros(len(AGE_EDGES) - 1)
+    for counts, label in zip(aggregates.age_by_gender, CATEGORIES['cinsiyet']):
+        ax.bar(AGE_EDGES[:-1], counts, width=np.diff(AGE_EDGES), bottom=bottom, align='edge', label=label)
+        bottom += counts
+    ax.set_xlabel('yaş')
+    ax.legend(title='cinsiyet')
+    plt.title('Yaş ve Cinsiyet Dağılımı')
+
+    ax = plt.subplot(2, 3, 4)
+    mesh = ax.pcolormesh(AGE_EDGES, SCATTER_EDGES, aggregates.scatter.T, norm=LogNorm(), cmap='viridis')
+    plt.colorbar(mesh, ax=ax, label='kişi sayısı')
+    ax.set_xlabel('yaş')
+    ax.set_ylabel('sosyal_katılım')
+    plt.title('Yaş ve Sosyal Katılım İlişkisi')
+
+    ax = plt.subplot(2, 3, 5)
+    correlation = aggregates.correlation()
+    image = ax.imshow(correlation, cmap='coolwarm', vmin=-1, vmax=1)
+    for (i, j), value in np.ndenumerate(correlation):
+        ax.text(j, i, f'{value:.2f}', ha='center', va='center', fontsize=8)
+    ax.set_xticks(range(len(aggregates.columns)), aggregates.columns, rotation=90)
+    ax.set_yticks(range(len(aggregates.columns)), aggregates.columns)
+    plt.colorbar(image, ax=ax)
+    plt.title('Değişkenler Arası Korelasyon')
+
+    plt.tight_layout()
+    plt.savefig(path)
+    plt.close()
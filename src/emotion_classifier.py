@@ -0,0 +1,51 @@
+import hashlib
+import json
+from pathlib import Path
+
+import numpy as np
+
+DEFAULT_THRESHOLDS_PATH = Path(__file__).resolve().parent / 'emotion_thresholds.json'
+
+
+class ThresholdClassifier:
+    """Eşik matrisi ile vektörel duygu sınıflandırıcısı.
+
+    Her satır bir duygunun eşik vektörüdür; bir örnek, tüm öznitelikleri
+    eşiğin üzerinde olan ilk satırın etiketini alır, hiçbiri sağlanmazsa
+    varsayılan etiketi alır. Bu, eski if/elif zinciriyle aynı karardır,
+    ancak (N, F) boyutlu bir matrisin tamamı tek işlemde sınıflandırılır.
+    """
+
+    def __init__(self, labels, thresholds, default='neutral'):
+        self.thresholds = np.asarray(thresholds, dtype=np.float64)
+        if self.thresholds.ndim != 2 or len(labels) != len(self.thresholds):
+            raise ValueError("Eşik matrisi (etiket sayısı, öznitelik sayısı) boyutunda olmalı.")
+        self.labels = np.array(list(labels) + [default])
+        self.default = default
+
+    @property
+    def feature_count(self):
+        return self.thresholds.shape[1]
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_THRESHOLDS_PATH):
+        """Parametreleri JSON dosyasından yükler."""
+        with open(path, encoding='utf-8') as f:
+            params = json.load(f)
+        return cls(params['labels'], params['thresholds'], params.get('default', 'neutral'))
+
+    def fingerprint(self):
+        """Parametrelerin kısa özeti; eşikler değişince sonuçların yeniden hesaplanması için."""
+        payload = json.dumps([self.labels.tolist(), self.thresholds.tolist()])
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+    def predict(self, features):
+        """(N, F) öznitelik matrisi için N etiket döndürür."""
+        features = np.atleast_2d(np.asarray(features, dtype=np.float64))
+        passed = np.all(features[:, None, :] > self.thresholds[None, :, :], axis=2)
+        first = np.where(passed.any(axis=1), passed.argmax(axis=1), len(self.thresholds))
+        return self.labels[first]
+
+    def predict_one(self, features):
+        """Tek bir öznitelik vektörünün etiketi."""
+        return str(self.predict(features)[0])
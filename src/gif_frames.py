@@ -0,0 +1,167 @@
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from PIL import Image, ImageSequence
+
+DEFAULT_SIZE = (150, 150)
+DEFAULT_FRAME_MS = 50   # Süresi yazılmamış kareler için (eski sabit animasyon hızı)
+MIN_FRAME_MS = 20
+
+# Çözülmüş ve yeniden boyutlandırılmış kareler ile kare süreleri (ms)
+GifFrames = namedtuple('GifFrames', ['frames', 'durations', 'nbytes'])
+
+
+def decode_gif(path, size=DEFAULT_SIZE):
+    """GIF'in tüm karelerini RGBA olarak çözüp `size` boyutuna getirir."""
+    frames, durations = [], []
+    with Image.open(path) as img:
+        for frame in ImageSequence.Iterator(img):
+            duration = frame.info.get('duration') or DEFAULT_FRAME_MS
+            frames.append(frame.convert('RGBA').resize(size, Image.Resampling.LANCZOS))
+            durations.append(max(MIN_FRAME_MS, int(duration)))
+    nbytes = sum(f.width * f.height * 4 for f in frames)
+    return GifFrames(frames, durations, nbytes)
+
+
+class FrameCache:
+    """(yol, boyut) anahtarlı, bellek sınırlı LRU GIF kare önbelleği.
+
+    Kareler Pillow görüntüleri olarak tutulur, böylece arka plan iş
+    parçacığında çözülebilir; Tk `PhotoImage` dönüşümü ana iş parçacığında
+    gösterim sırasında yapılır. Dosya değişirse (mtime) kayıt yeniden çözülür.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _key(self, path, size):
+        path = str(path)
+        return path, tuple(size), os.stat(path).st_mtime_ns
+
+    def get(self, path, size=DEFAULT_SIZE):
+        """GIF'in karelerini döndürür, önbellekte yoksa çözüp ekler."""
+        key = self._key(path, size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+            self.misses += 1
+            pending = self._pending.setdefault(key, threading.Lock())
+
+        # Aynı GIF'i aynı anda isteyenler tek bir çözümleme bekler.
+        # Çözümleme hata verse de kayıt silinir, sonraki istek yeniden dener.
+        try:
+            with pending:
+                with self._lock:
+                    entry = self._entries.get(key)
+                if entry is None:
+                    entry = decode_gif(path, size)
+                    with self._lock:
+                        self._entries[key] = entry
+                        self._total_bytes += entry.nbytes
+                        self._evict(keep=key)
+        finally:
+            with self._lock:
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+        return entry
+
+    def _evict(self, keep=None):
+        while self._entries and self._total_bytes > self.max_bytes:
+            key, entry = next(iter(self._entries.items()))
+            if key == keep:
+                break
+            del self._entries[key]
+            self._total_bytes -= entry.nbytes
+
+    def warm(self, paths, size=DEFAULT_SIZE):
+        """GIF'leri arka planda çözer (ör. tanıma ve seslendirme sürerken)."""
+        def run():
+            for path in paths:
+                try:
+                    self.get(path, size)
+                except Exception as e:
+                    print(f"GIF önbellek hatası ({path}): {e}")
+
+        thread = threading.Thread(target=run, daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+            }
+
+
+class AnimationScheduler:
+    """Ekrandaki tüm GIF animasyonlarını tek bir Tk `after` zamanlayıcısıyla sürer.
+
+    Her animasyonun bir sonraki kare zamanı tutulur; zamanlayıcı en yakın
+    kare zamanına kurulur ve o ana kadar gelen tüm kareleri birlikte
+    günceller. Yok edilen etiketlerin animasyonları kendiliğinden düşer.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._animations = []
+        self._timer = None
+
+    def add(self, label, photos, durations):
+        """Etiketi verilen PhotoImage kareleriyle canlandırır."""
+        label.config(image=photos[0])
+        # PhotoImage'lar çöp toplayıcıya gitmesin diye etikette tutulur
+        label.frames = photos
+        if len(photos) > 1:
+            self._animations.append([label, photos, durations, 0, time.monotonic() + durations[0] / 1000])
+            self._schedule()
+
+    def clear(self):
+        self._animations = []
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+            self._timer = None
+
+    def _schedule(self):
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+            self._timer = None
+        if self._animations:
+            due = min(animation[4] for animation in self._animations)
+            delay = max(1, int((due - time.monotonic()) * 1000))
+            self._timer = self.root.after(delay, self._tick)
+
+    def _tick(self):
+        self._timer = None
+        now = time.monotonic()
+        alive = []
+        for animation in self._animations:
+            label, photos, durations, index, due = animation
+            if not label.winfo_exists():
+                continue
+            if now >= due:
+                index = (index + 1) % len(photos)
+                label.config(image=photos[index])
+                animation[3] = index
+                animation[4] = due + durations[index] / 1000
+                if animation[4] < now:
+                    # Geciken kareler biriktirilmez, bir sonraki kare şimdiden sayılır
+                    animation[4] = now + durations[index] / 1000
+            alive.append(animation)
+        self._animations = alive
+        self._schedule()
@@ -0,0 +1,227 @@
+import difflib
+import hashlib
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from pathlib import Path
+
+
+class _FuzzyIndex:
+    """Harf bazında karakter ters dizini.
+
+    `difflib.get_close_matches(word, words, n=1, cutoff)` ile aynı sonucu verir;
+    ancak SequenceMatcher yalnızca karakter kesişimi (quick_ratio üst sınırı)
+    eşiği geçebilen adaylar için, en yüksek sınırdan başlayarak çalıştırılır.
+    """
+
+    def __init__(self, words, cutoff=0.6):
+        self.cutoff = cutoff
+        self._words = list(words)
+        self._lengths = [len(w) for w in self._words]
+        self._postings = defaultdict(list)
+        for idx, word in enumerate(self._words):
+            for char, count in Counter(word).items():
+                self._postings[char].append((idx, count))
+
+    def closest(self, word):
+        """En benzer kelimeyi döndürür; eşiği geçen yoksa None."""
+        overlap = defaultdict(int)
+        for char, count in Counter(word).items():
+            for idx, word_count in self._postings.get(char, ()):
+                overlap[idx] += min(count, word_count)
+
+        length = len(word)
+        candidates = []
+        for idx, common in overlap.items():
+            bound = 2.0 * common / (length + self._lengths[idx])
+            if bound >= self.cutoff:
+                candidates.append((bound, idx))
+        candidates.sort(reverse=True)
+
+        # difflib ile aynı: seq2 aranan kelime, eşitlikte büyük olan kelime kazanır
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(word)
+        best = None
+        for bound, idx in candidates:
+            if best is not None and bound < best[0]:
+                break
+            candidate = self._words[idx]
+            matcher.set_seq1(candidate)
+            score = matcher.ratio()
+            if score >= self.cutoff and (best is None or (score, candidate) > best):
+                best = (score, candidate)
+        return best[1] if best else None
+
+
+class _Shard:
+    """Tek bir harf klasörünün (ör. img/a) kelime -> yol tablosu.
+
+    Tablo ve ters dizin kurulduktan sonra değişmez (klasör değişince yeni
+    `_Shard` kurulur), bu yüzden benzerlik araması kilitsiz yapılır; yalnızca
+    sonuç belleği kendi küçük kilidiyle korunur.
+    """
+
+    def __init__(self, directory, cutoff, memo_size):
+        self.directory = directory
+        self.mtime = directory.stat().st_mtime_ns
+        self.words = {p.stem: p for p in directory.glob('*.gif')}
+        self.fuzzy = _FuzzyIndex(self.words, cutoff)
+        self._memo = OrderedDict()
+        self._memo_size = memo_size
+        self._memo_lock = threading.Lock()
+
+    def closest(self, word):
+        with self._memo_lock:
+            if word in self._memo:
+                self._memo.move_to_end(word)
+                return self._memo[word]
+        match = self.fuzzy.closest(word)
+        with self._memo_lock:
+            self._memo[word] = match
+            if len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+        return match
+
+
+class GifLexicon:
+    """GIF sözlüğünün bellek içi dizini.
+
+    Açılışta `gif_dir` altındaki harf klasörleri bir kez taranır; tam ve kök
+    eşleşmeleri sözlük araması, benzer kelime araması ise önceden kurulmuş
+    ters dizin ile yapılır. Klasör değişiklik zamanları en fazla
+    `refresh_interval` saniyede bir kontrol edilir, yeni eklenen dosyalar
+    böylece kendiliğinden dizine girer.
+    """
+
+    def __init__(self, gif_dir, refresh_interval=2.0, cutoff=0.6, memo_size=4096):
+        self.gif_dir = Path(gif_dir)
+        self.refresh_interval = refresh_interval
+        self.cutoff = cutoff
+        self.memo_size = memo_size
+        self.generation = 0
+        self._lock = threading.RLock()
+        self._shards = {}
+        self._digests = {}
+        self._root_mtime = None
+        self._last_check = 0.0
+        self.refresh(force=True)
+
+    def __len__(self):
+        return sum(len(shard.words) for shard in self._shards.values())
+
+    def entries(self):
+        """Sözlükteki tüm (ad, yol) çiftleri."""
+        self.refresh()
+        with self._lock:
+            return [item for shard in self._shards.values() for item in shard.words.items()]
+
+    def refresh(self, force=False):
+        """Değişen harf klasörlerini yeniden tarar. Değişiklik olduysa True döner."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_check < self.refresh_interval:
+                return False
+            self._last_check = now
+
+            try:
+                root_mtime = self.gif_dir.stat().st_mtime_ns
+            except OSError:
+                changed = bool(self._shards)
+                self._shards = {}
+                self._root_mtime = None
+                if changed:
+                    self.generation += 1
+                return changed
+
+            changed = False
+            if force or root_mtime != self._root_mtime:
+                self._root_mtime = root_mtime
+                names = {d.name for d in self.gif_dir.iterdir() if d.is_dir()}
+                for name in set(self._shards) - names:
+                    del self._shards[name]
+                    changed = True
+            else:
+                names = set(self._shards)
+
+            for name in names:
+                directory = self.gif_dir / name
+                shard = self._shards.get(name)
+                try:
+                    if shard is not None and directory.stat().st_mtime_ns == shard.mtime:
+                        continue
+                    self._shards[name] = _Shard(directory, self.cutoff, self.memo_size)
+                    changed = True
+                except OSError:
+                    self._shards.pop(name, None)
+                    changed = True
+
+            if changed:
+                self.generation += 1
+            return changed
+
+    def _shard_for(self, word):
+        if not word or not word[0].isalpha():
+            return None
+        self.refresh()
+        return self._shards.get(word[0].lower())
+
+    def exact(self, word):
+        """Kelimenin birebir GIF yolunu döndürür (yoksa None)."""
+        shard = self._shard_for(word)
+        return shard.words.get(word) if shard else None
+
+    def find(self, word, root=None):
+        """Tam kelime, kök ve benzer kelime sırasıyla GIF yolunu arar."""
+        shard = self._shard_for(word)
+        if shard is None:
+            return None
+
+        # 1) Tam kelime eşleşmesi
+        path = shard.words.get(word)
+        if path:
+            return path
+
+        # 2) Kök kelime kontrolü
+        if root is None:
+            root = word
+        path = shard.words.get(root)
+        if path:
+            return path
+
+        # 3) Benzer kelime kontrolü (kelimenin harf klasöründe)
+        return self.similar(root)
+
+    def similar(self, word):
+        """Kelimenin harf klasöründeki en benzer GIF yolunu döndürür (yoksa None)."""
+        shard = self._shard_for(word)
+        if shard is None:
+            return None
+        # Sözlük kilidi tutulmaz: eşzamanlı aramalar ve yenilemeler birbirini beklemez
+        similar_word = shard.closest(word)
+        return shard.words.get(similar_word) if similar_word else None
+
+    def digest(self, path):
+        """GIF dosyasının içerik özetini döndürür (dosya değişmedikçe önbellekten)."""
+        stat = Path(path).stat()
+        key = str(path)
+        cached = self._digests.get(key)
+        if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return cached[1]
+        with open(path, 'rb') as f:
+            digest = hashlib.sha1(f.read()).hexdigest()[:16]
+        self._digests[key] = ((stat.st_mtime_ns, stat.st_size), digest)
+        return digest
+
+
+_LEXICONS = {}
+_LEXICONS_LOCK = threading.Lock()
+
+
+def get_lexicon(gif_dir):
+    """Aynı klasör için süreç boyunca tek bir GifLexicon örneği döndürür."""
+    key = str(Path(gif_dir).resolve())
+    with _LEXICONS_LOCK:
+        lexicon = _LEXICONS.get(key)
+        if lexicon is None:
+            lexicon = _LEXICONS[key] = GifLexicon(key)
+        return lexicon
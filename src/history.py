@@ -0,0 +1,167 @@
+import argparse
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_DB_PATH = BASE_DIR / 'analysis_history.db'
+LEGACY_JSON_PATH = BASE_DIR / 'static' / 'analysis_history.json'
+MAX_PAGE_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    text TEXT NOT NULL,
+    emotion TEXT,
+    scores TEXT,
+    signs TEXT,
+    timings TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_history_ts ON history (ts, id);
+CREATE INDEX IF NOT EXISTS idx_history_emotion_ts ON history (emotion, ts, id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_history_entry ON history (ts, text);
+"""
+
+JSON_COLUMNS = ('scores', 'signs', 'timings')
+
+
+class HistoryStore:
+    """Tanıma sonuçlarının yalnızca eklenen, SQLite (WAL) tabanlı geçmişi.
+
+    Her kayıt tek bir INSERT ile eklenir; dosyanın tamamı yeniden yazılmaz ve
+    WAL kipinde okuyucular yazarları beklemez. Her iş parçacığı kendi
+    bağlantısını kullanır. Sorgular zaman ve duygu dizinleri üzerinden, (ts, id)
+    imleciyle sayfalanır.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = str(db_path)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def append(self, text, emotion=None, scores=None, signs=None, timings=None, ts=None):
+        """Bir tanıma sonucunu ekler ve kayıt kimliğini döndürür.
+
+        Aynı (ts, text) kaydı zaten varsa (ör. aynı zaman damgasıyla iki kez
+        eklenen sonuç) yeni satır eklenmez, mevcut kaydın kimliği döner.
+        """
+        row = (ts or datetime.now().isoformat(), text, emotion,
+               *(json.dumps(value, ensure_ascii=False) if value is not None else None
+                 for value in (scores, signs, timings)))
+        with self._connect() as conn:
+            cursor = conn.execute(
+                'INSERT OR IGNORE INTO history (ts, text, emotion, scores, signs, timings) VALUES (?, ?, ?, ?, ?, ?)',
+                row)
+            if cursor.rowcount:
+                return cursor.lastrowid
+            return conn.execute('SELECT id FROM history WHERE ts = ? AND text = ?', row[:2]).fetchone()[0]
+
+    def _where(self, emotion, since, until):
+        clauses, params = [], []
+        if emotion:
+            clauses.append('emotion = ?')
+            params.append(emotion)
+        if since:
+            clauses.append('ts >= ?')
+            params.append(since)
+        if until:
+            clauses.append('ts < ?')
+            params.append(until)
+        return clauses, params
+
+    def query(self, emotion=None, since=None, until=None, limit=50, cursor=None):
+        """Kayıtları yeniden eskiye sayfa sayfa döndürür.
+
+        `cursor`, önceki sayfanın `next` değeridir; sayfa ofset kullanmadan
+        dizin üzerinden kaldığı yerden devam eder.
+        """
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        clauses, params = self._where(emotion, since, until)
+        if cursor:
+            ts, _, row_id = cursor.rpartition('|')
+            clauses.append('(ts < ? OR (ts = ? AND id < ?))')
+            params.extend([ts, ts, int(row_id)])
+        sql = 'SELECT * FROM history'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY ts DESC, id DESC LIMIT ?'
+        rows = self._connect().execute(sql, params + [limit + 1]).fetchall()
+
+        items = [self._record(row) for row in rows[:limit]]
+        next_cursor = f"{items[-1]['timestamp']}|{items[-1]['id']}" if len(rows) > limit else None
+        return {'items': items, 'next': next_cursor}
+
+    def count(self, emotion=None, since=None, until=None):
+        clauses, params = self._where(emotion, since, until)
+        sql = 'SELECT COUNT(*) FROM history'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        return self._connect().execute(sql, params).fetchone()[0]
+
+    def emotion_counts(self):
+        """Duygu -> kayıt sayısı."""
+        rows = self._connect().execute('SELECT emotion, COUNT(*) FROM history GROUP BY emotion').fetchall()
+        return {emotion: count for emotion, count in rows}
+
+    def _record(self, row):
+        record = {'id': row['id'], 'timestamp': row['ts'], 'text': row['text'], 'emotion': row['emotion']}
+        for column in JSON_COLUMNS:
+            record[column] = json.loads(row[column]) if row[column] is not None else None
+        return record
+
+    def import_json(self, path=LEGACY_JSON_PATH):
+        """Eski `analysis_history.json` dizisini içe aktarır; zaten var olan kayıtlar atlanır."""
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)
+        rows = [
+            (entry.get('timestamp') or datetime.now().isoformat(), entry.get('text', ''), entry.get('emotion'),
+             *(json.dumps(entry[key], ensure_ascii=False) if entry.get(key) is not None else None
+               for key in JSON_COLUMNS))
+            for entry in entries
+        ]
+        with self._connect() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                'INSERT OR IGNORE INTO history (ts, text, emotion, scores, signs, timings) VALUES (?, ?, ?, ?, ?, ?)',
+                rows)
+            return conn.total_changes - before
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analiz geçmişi araçları")
+    parser.add_argument('--db', default=str(DEFAULT_DB_PATH), help="SQLite veritabanı")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    import_parser = subparsers.add_parser('import', help="Eski JSON geçmişini içe aktar")
+    import_parser.add_argument('path', nargs='?', default=str(LEGACY_JSON_PATH))
+    query_parser = subparsers.add_parser('query', help="Son kayıtları listele")
+    query_parser.add_argument('--emotion')
+    query_parser.add_argument('--since')
+    query_parser.add_argument('--until')
+    query_parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    store = HistoryStore(args.db)
+    if args.command == 'import':
+        print(f"{store.import_json(args.path)} kayıt içe aktarıldı, toplam {store.count()} kayıt.")
+    else:
+        page = store.query(args.emotion, args.since, args.until, args.limit)
+        for item in page['items']:
+            print(json.dumps(item, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
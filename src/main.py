@@ -1,20 +1,43 @@
+import time
+
+STARTED = time.perf_counter()
+
 import os
 import sys
-import difflib
-from gtts import gTTS
-import pygame
 from tkinter import Tk, Label, Button, Frame, messagebox, PhotoImage
-from PIL import Image, ImageTk, ImageSequence
+from PIL import ImageTk
 import threading
-from time import sleep
-from nltk.sentiment.vader import SentimentIntensityAnalyzer  # Sentiment analizi için
 
 # `src` klasörünü arama yoluna ekleyin
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
-from speech_to_text import recognize_speech, process_text
+from speech_to_text import recognize_speech
+from turkish_stemmer import STEMMER, get_resolver
+from tts_cache import TTSCache
+from gif_frames import FrameCache, AnimationScheduler
+from audio_player import AudioPlayer, PRIORITY_HIGH
+from startup import StartupReport
+
+GIF_DIR = r'Turkish_Sign_Language_Dictionary\data\img'
+START_SOUND = r'src/retro-audio-logo-94648.mp3'
+
+_sia = None
+_sia_lock = threading.Lock()
+
+
+def get_sentiment_analyzer():
+    """VADER çözümleyicisini ilk kullanımda içe aktarır ve bir kez oluşturur."""
+    global _sia
+    if _sia is None:
+        with _sia_lock:
+            if _sia is None:
+                from nltk.sentiment.vader import SentimentIntensityAnalyzer  # Sentiment analizi için
+
+                _sia = SentimentIntensityAnalyzer()
+    return _sia
+
 
 class GifApp:
-    def __init__(self, root):
+    def __init__(self, root, startup=None):
         self.root = root
         self.root.title("Erişilebilir Konuşma - Tercüme Asistanı (EKTA)")
         self.root.geometry("1000x700")
@@ -42,88 +65,70 @@ class GifApp:
         self.gif_frame = Frame(root, bg="#f4fefe")
         self.gif_frame.pack(pady=25)
 
-    def play_sound(self, sound_file):
-        try:
-            pygame.mixer.init()
-            pygame.mixer.music.load(sound_file)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                pygame.time.Clock().tick(10)
-        except Exception as e:
-            print(f"Ses çalma hatası: {e}")
-        finally:
-            pygame.mixer.quit()
-
-    def say_text(self, text):
+        self.tts_cache = TTSCache()
+        # Kareler bir kez çözülüp boyutlandırılır, tüm animasyonlar tek zamanlayıcıyla döner
+        self.frame_cache = FrameCache()
+        self.animations = AnimationScheduler(root)
+        # Sesler tek bir kalıcı çalma servisinden sırayla çalınır
+        self.audio = AudioPlayer(cues={'start': START_SOUND})
+
+        # Ağır bileşenler pencere açıldıktan sonra arka planda ısıtılır
+        self.startup = startup or StartupReport(STARTED)
+        self.root.after(0, self.warm_up)
+
+    def warm_up(self):
+        self.startup.mark('window')
+        self.startup.warm_up([
+            ('vader', get_sentiment_analyzer),
+            ('lexicon', lambda: get_resolver(GIF_DIR).phrases()),
+            ('audio', self.audio.preload),
+            ('tts', self.tts_cache.warm),
+        ])
+
+    def say_text(self, *parts):
+        # Okuma bitene (ya da yeni bir ifadeyle kesilene) kadar bekler
         try:
-            speech_file = "speech.mp3"
-            tts = gTTS(text, lang='tr')
-            tts.save(speech_file)
-            self.play_sound(speech_file)
-            os.remove(speech_file)
+            speech_files = [self.tts_cache.get(part, lang='tr') for part in parts if part]
+            self.audio.play(*speech_files, group='utterance').wait()
         except Exception as e:
             print(f"Metin okuma hatası: {e}")
 
     def get_word_root(self, word):
-        suffixes = ["e", "im", "in", "um", "sin", "siniz", "ler", "lar", "dir", "dır", "dur", "mız", "tik", "mek", "mekte"]
-        for suffix in suffixes:
-            if word.endswith(suffix):
-                return word[:-len(suffix)]
-        return word
-
-    def find_similar_word(self, word, directory_path):
-        try:
-            gif_files = os.listdir(directory_path)
-            similar_word = difflib.get_close_matches(word, [f.split('.')[0] for f in gif_files], n=1, cutoff=0.6)
-            if similar_word:
-                return similar_word[0]
-        except Exception as e:
-            print(f"Benzer kelime arama hatası: {e}")
-        return None
+        return STEMMER.root(word)
 
     def find_gif(self, word, gif_dir):
         try:
-            first_letter = word[0].lower()
-            if not first_letter.isalpha():
+            if not word[0].isalpha():
                 return None  # Sayısal kelimeler için GIF bulunmuyor
 
-            directory_path = os.path.join(gif_dir, first_letter)
-            gif_path = os.path.join(directory_path, f"{word}.gif")
-            if os.path.exists(gif_path):
-                return gif_path
-
-            word_root = self.get_word_root(word)
-            gif_path = os.path.join(directory_path, f"{word_root}.gif")
-            if os.path.exists(gif_path):
-                return gif_path
-
-            similar_word = self.find_similar_word(word_root, directory_path)
-            if similar_word:
-                return os.path.join(directory_path, f"{similar_word}.gif")
+            # app.py ile aynı gövdeleyici ve çözümleme belleği kullanılır
+            gif_path = get_resolver(gif_dir).resolve(word)
+            if gif_path:
+                return str(gif_path)
         except Exception as e:
             print(f"GIF bulma hatası: {e}")
         return None
 
-    def translate_to_gif(self, text, gif_dir, new_gif_dir):
+    def translate_to_gif(self, text, gif_dir):
+        # GIF'ler kopyalanmaz, doğrudan sözlükteki dosyalar gösterilir
+        # Çok kelimeli işaretler önce, en uzun eşleşmeyle seçilir
         words = text.lower().split()
-        os.makedirs(new_gif_dir, exist_ok=True)
         gif_paths = []
-        for word in words:
-            gif_path = self.find_gif(word, gif_dir)
+        try:
+            segments = get_resolver(gif_dir).segment(words)
+        except Exception as e:
+            print(f"GIF bulma hatası: {e}")
+            segments = []
+        for phrase, gif_path in segments:
             if gif_path:
-                new_gif_path = os.path.join(new_gif_dir, f"{word}.gif")
-                try:
-                    with open(gif_path, 'rb') as source, open(new_gif_path, 'wb') as dest:
-                        dest.write(source.read())
-                    gif_paths.append(new_gif_path)
-                    print(f"GIF bulundu ve kopyalandı: {new_gif_path}")
-                except Exception as e:
-                    print(f"GIF kopyalama hatası ({word}): {e}")
+                gif_paths.append(str(gif_path))
+                print(f"GIF bulundu: {gif_path}")
             else:
-                print(f"GIF bulunamadı: {word}")
+                print(f"GIF bulunamadı: {phrase}")
         return gif_paths
 
     def display_gifs(self, gif_paths):
+        self.animations.clear()
         for widget in self.gif_frame.winfo_children():
             widget.destroy()
         for gif_path in gif_paths:
@@ -132,23 +137,17 @@ class GifApp:
 
     def show_gif(self, gif_path):
         try:
-            img = Image.open(gif_path)
-            frames = [ImageTk.PhotoImage(img.copy().resize((150, 150), Image.Resampling.LANCZOS)) for img in ImageSequence.Iterator(img)]
+            gif = self.frame_cache.get(gif_path)
+            photos = [ImageTk.PhotoImage(frame) for frame in gif.frames]
             label = Label(self.gif_frame, bg="#f4fefe")
             label.pack(side="left", padx=10)
-
-            def animate(counter):
-                label.config(image=frames[counter])
-                self.root.update()
-                self.root.after(50, animate, (counter + 1) % len(frames))
-
-            animate(0)
+            self.animations.add(label, photos, gif.durations)
         except Exception as e:
             print(f"GIF gösterme hatası: {e}")
 
     def analyze_sentiment(self, text):
         try:
-            sia = SentimentIntensityAnalyzer()
+            sia = get_sentiment_analyzer()
             sentiment = sia.polarity_scores(text)
             print("Sentiment Analizi:", sentiment)
 
@@ -167,23 +166,32 @@ class GifApp:
 
     def start_recognition(self):
         self.status_label.config(text="Mikrofon açılacak, lütfen birkaç saniye bekleyin.")
-        self.play_sound(r'src/retro-audio-logo-94648.mp3')
+        # Önceki ifadenin okuması kesilir, açılış sesi sıranın önüne geçer
+        self.audio.cancel('utterance')
+        chime = self.audio.cue('start', priority=PRIORITY_HIGH)
 
         def recognition_thread():
+            chime.wait()  # Mikrofon açılış sesini kaydetmesin
             text = recognize_speech()
             self.detected_text_label.config(text=f"Algılanan Metin: {text}")
-            self.say_text(f"Algılanan metin: {text}")
+
+            # GIF kareleri seslendirme ve duygu analizi sürerken arka planda çözülür
+            gif_paths = self.translate_to_gif(text, GIF_DIR)
+            self.frame_cache.warm(gif_paths)
+            self.say_text("Algılanan metin:", text)
 
             sentiment = self.analyze_sentiment(text)
             if sentiment:
                 messagebox.showinfo("Duygu Analizi Sonucu", f"Duygu Durumu: {sentiment}")
 
-            gif_paths = self.translate_to_gif(text, r'Turkish_Sign_Language_Dictionary\data\img', r'static\new_gifs')
-            self.display_gifs(gif_paths)
+            # Tk nesneleri yalnızca ana iş parçacığında oluşturulur
+            self.root.after(0, self.display_gifs, gif_paths)
 
         threading.Thread(target=recognition_thread).start()
 
 if __name__ == "__main__":
+    startup = StartupReport(STARTED)
+    startup.mark('imports')
     root = Tk()
-    app = GifApp(root)
+    app = GifApp(root, startup)
     root.mainloop()
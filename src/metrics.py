@@ -0,0 +1,269 @@
+import contextlib
+import contextvars
+import random
+import threading
+import time
+from collections import Counter as _Tally
+
+# Etkin izleme (Trace); aynı iş parçacığında açılan zamanlayıcılar buraya da yazar
+_CURRENT_TRACE = contextvars.ContextVar('trace', default=None)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, registry, name, help, labelnames=()):
+        self.registry = registry
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        return tuple(labels.get(name, '') for name in self.labelnames)
+
+    def header(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Artan sayaç. Etiket değerleri sınırlı bir kümeden gelmelidir; kullanıcı
+    girdisi (ör. kelimeler) etiket yapılmaz, günlüğe yazılır."""
+
+    kind = 'counter'
+
+    def __init__(self, registry, name, help, labelnames=()):
+        super().__init__(registry, name, help, labelnames)
+        self._values = _Tally()
+
+    def inc(self, amount=1, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] += amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    def most_common(self, n=None):
+        with self._lock:
+            return self._values.most_common(n)
+
+    def lines(self):
+        return [f"{self.name}{_labels(self.labelnames, key)} {value}"
+                for key, value in self.most_common()]
+
+
+class Summary(_Metric):
+    """Gözlem sayısı, toplamı ve örneklem havuzundan (reservoir) yüzdelikler."""
+
+    kind = 'summary'
+
+    def __init__(self, registry, name, help, labelnames=(), reservoir_size=1024):
+        super().__init__(registry, name, help, labelnames)
+        self.reservoir_size = reservoir_size
+        self._series = {}
+        self._random = random.Random(0)
+
+    def observe(self, value, **labels):
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0, 0.0, []]
+            series[0] += 1
+            series[1] += value
+            reservoir = series[2]
+            if len(reservoir) < self.reservoir_size:
+                reservoir.append(value)
+            else:
+                slot = self._random.randrange(series[0])
+                if slot < self.reservoir_size:
+                    reservoir[slot] = value
+
+    def time(self, **labels):
+        """Bloğun süresini (saniye) gözlem olarak ekleyen zamanlayıcı."""
+        if not self.registry.enabled:
+            return NULL_TIMER
+        return _Timer(self, labels)
+
+    def quantiles(self, **labels):
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            values = sorted(series[2]) if series else []
+        if not values:
+            return {}
+        return {q: values[min(len(values) - 1, int(q * len(values)))] for q in QUANTILES}
+
+    def lines(self):
+        with self._lock:
+            series = {key: (count, total, sorted(values)) for key, (count, total, values) in self._series.items()}
+        lines = []
+        for key, (count, total, values) in sorted(series.items()):
+            for q in QUANTILES:
+                value = values[min(len(values) - 1, int(q * len(values)))]
+                lines.append(f"{self.name}{_labels(self.labelnames, key, [('quantile', q)])} {value:.6f}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {total:.6f}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Gauge(_Metric):
+    """Değeri okuma anında bir fonksiyondan alınan ölçü (ör. önbellek istatistikleri).
+
+    `fn` tek bir sayı ya da etiket değerleri demeti -> sayı sözlüğü döndürür.
+    """
+
+    def __init__(self, registry, name, help, fn, labelnames=(), kind='gauge'):
+        super().__init__(registry, name, help, labelnames)
+        self.fn = fn
+        self.kind = kind
+
+    def lines(self):
+        values = self.fn()
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [f"{self.name}{_labels(self.labelnames, key)} {value}" for key, value in values.items()]
+
+
+class _NullTimer:
+    """Ölçüm kapalıyken kullanılan, hiçbir şey yapmayan zamanlayıcı."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ('summary', 'labels', 'start')
+
+    def __init__(self, summary, labels):
+        self.summary = summary
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        duration = time.perf_counter() - self.start
+        self.summary.observe(duration, **self.labels)
+        trace = _CURRENT_TRACE.get()
+        if trace is not None:
+            trace.add(self.labels.get('stage', self.summary.name), self.start, duration)
+        return False
+
+
+class Trace:
+    """Tek bir isteğin alt aşama süreleri (istemciye gönderilmek üzere, ms)."""
+
+    def __init__(self, origin=None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def add(self, name, start, duration):
+        with self._lock:
+            self.spans.append({
+                'name': name,
+                'start': round((start - self.origin) * 1000, 1),
+                'duration': round(duration * 1000, 1),
+            })
+
+    @contextlib.contextmanager
+    def activate(self):
+        """Blok boyunca bu iş parçacığındaki zamanlayıcılar izlemeye de yazar."""
+        token = _CURRENT_TRACE.set(self)
+        try:
+            yield self
+        finally:
+            _CURRENT_TRACE.reset(token)
+
+    def wrap(self, fn):
+        """`fn` çağrısı boyunca (hangi iş parçacığında olursa olsun) bu izlemeyi etkin kılar."""
+        def traced(*args, **kwargs):
+            with self.activate():
+                return fn(*args, **kwargs)
+        return traced
+
+
+class Registry:
+    """Ölçüm kaydı. `enabled=False` iken sayaçlar ve zamanlayıcılar hiçbir şey yapmaz."""
+
+    def __init__(self, prefix='ekta', enabled=True, reservoir_size=1024):
+        self.prefix = prefix
+        self.enabled = enabled
+        self.reservoir_size = reservoir_size
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, name, factory):
+        name = f"{self.prefix}_{name}" if self.prefix else name
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory(name)
+            return metric
+
+    def counter(self, name, help, labelnames=()):
+        return self._register(name, lambda full: Counter(self, full, help, labelnames))
+
+    def summary(self, name, help, labelnames=()):
+        return self._register(name, lambda full: Summary(self, full, help, labelnames, self.reservoir_size))
+
+    def gauge(self, name, help, fn, labelnames=(), kind='gauge'):
+        return self._register(name, lambda full: Gauge(self, full, help, fn, labelnames, kind))
+
+    def exposition(self):
+        """Prometheus metin biçiminde tüm ölçümler."""
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            try:
+                body = metric.lines()
+            except Exception as e:
+                print(f"Ölçüm okuma hatası ({metric.name}): {e}")
+                continue
+            lines.extend(metric.header())
+            lines.extend(body)
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.summary('stage_seconds', "Tanıma hattı aşama süreleri (saniye)", ['stage'])
+UNMATCHED_WORDS = REGISTRY.counter('unmatched_words_total', "İşareti bulunamayan kelimeler")
+
+
+def tracing(trace):
+    """İzleme verildiyse etkinleştirir, verilmediyse hiçbir şey yapmaz."""
+    return trace.activate() if trace is not None else contextlib.nullcontext()
+
+
+def stage_timer(stage):
+    """Aşama süresini ölçen zamanlayıcı: `with stage_timer('listen'): ...`"""
+    if not REGISTRY.enabled:
+        return NULL_TIMER
+    return _Timer(STAGE_SECONDS, {'stage': stage})
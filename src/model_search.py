@@ -0,0 +1,103 @@
+import tempfile
+import time
+
+import numpy as np
+from joblib import Memory
+from sklearn.base import clone
+from sklearn.model_selection import GridSearchCV, StratifiedKFold
+
+DEFAULT_SCORING = {'f1': 'f1', 'roc_auc': 'roc_auc', 'accuracy': 'accuracy'}
+
+
+class SearchResult:
+    """Model aramasının sonucu ve maliyeti.
+
+    `fits` sınıflandırıcı eğitim sayısıdır (aday x kat + en iyi modelin
+    yeniden eğitimi). `cv_scores`, en iyi adayın arama sırasında zaten
+    hesaplanmış kat skorlarıdır; yeniden eğitim gerektirmez. `metrics`
+    aramada gerçekten hesaplanan metriklerin adlarıdır (ilk sıradaki, en iyi
+    adayın seçildiği metriktir).
+    """
+
+    def __init__(self, search, seconds, method, metrics):
+        self.search = search
+        self.seconds = seconds
+        self.method = method
+        self.metrics = tuple(metrics)
+        self.best_estimator_ = search.best_estimator_
+        self.best_params_ = search.best_params_
+        self.fits = self._count_fits(search)
+
+    @staticmethod
+    def _count_fits(search):
+        n_splits = search.n_splits_
+        if hasattr(search, 'n_candidates_'):  # Ardışık yarılama: tur başına aday sayıları
+            candidates = sum(search.n_candidates_)
+        else:
+            candidates = len(search.cv_results_['params'])
+        return candidates * n_splits + (1 if search.refit else 0)
+
+    def cv_scores(self, metric=None):
+        """En iyi adayın `metric` kat skorları (`cross_val_score` çıktısı gibi).
+
+        `metric` verilmezse seçimde kullanılan metrik döner; aramada
+        hesaplanmamış bir metrik istenirse ValueError.
+        """
+        metric = metric or self.metrics[0]
+        if metric not in self.metrics:
+            raise ValueError(f"'{metric}' skoru hesaplanmadı; hesaplanan metrikler: {', '.join(self.metrics)}")
+        results = self.search.cv_results_
+        key = f'test_{metric}' if isinstance(self.search.scoring, dict) else 'test_score'
+        index = self.search.best_index_
+        return np.array([results[f'split{i}_{key}'][index] for i in range(self.search.n_splits_)])
+
+    def stats(self):
+        return {'yöntem': self.method, 'eğitim_sayısı': self.fits, 'süre_sn': round(self.seconds, 3)}
+
+
+def model_search(pipeline, param_grid, X, y, cv=5, scoring=None, refit='f1', n_jobs=-1, cache_dir=None,
+                 halving=False, random_state=42):
+    """Boru hattı için hiperparametre araması.
+
+    - Katlar `n_jobs` süreçte paralel eğitilir (-1: tüm çekirdekler).
+    - Boru hattının dönüştürücü adımları (ör. öznitelik seçici) `cache_dir`
+      altında joblib ile önbelleklenir; yalnızca sınıflandırıcı parametreleri
+      değişen adaylar aynı kat için dönüştürücüleri yeniden eğitmez.
+      `cache_dir` verilmezse arama süresince geçici bir klasör kullanılır.
+    - `halving=True` iken HalvingGridSearchCV ile zayıf adaylar az veriyle
+      erken elenir; yalnızca `refit` metriği hesaplanır.
+    - Varsayılan olarak f1, roc_auc ve accuracy tek aramada hesaplanır.
+    - Kat skorları yalnızca verilen `X`, `y` üzerindendir; test ayrımı
+      yapılmışsa eğitim kısmı verilmelidir.
+    """
+    scoring = scoring or DEFAULT_SCORING
+    if not isinstance(scoring, dict):
+        metrics = [scoring if isinstance(scoring, str) else 'score']
+    elif halving:
+        metrics = [refit]
+    else:
+        metrics = [refit] + [name for name in scoring if name != refit]
+    folds = StratifiedKFold(n_splits=cv)
+
+    with tempfile.TemporaryDirectory(prefix='model_search_') as tmp_dir:
+        # Çağıranın boru hattı değiştirilmez; önbellek yalnızca kopyaya bağlanır
+        pipeline = clone(pipeline).set_params(memory=Memory(cache_dir or tmp_dir, verbose=0))
+        if halving:
+            from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+            from sklearn.model_selection import HalvingGridSearchCV
+
+            metric = scoring[refit] if isinstance(scoring, dict) else scoring
+            search = HalvingGridSearchCV(pipeline, param_grid, cv=folds, scoring=metric, n_jobs=n_jobs,
+                                         random_state=random_state)
+            method = 'halving_grid'
+        else:
+            search = GridSearchCV(pipeline, param_grid, cv=folds, scoring=scoring, refit=refit, n_jobs=n_jobs)
+            method = 'grid'
+
+        start = time.perf_counter()
+        search.fit(X, y)
+        seconds = time.perf_counter() - start
+        # Önbellek klasörü silinmeden önce en iyi model önbellekten ayrılır
+        search.best_estimator_.set_params(memory=None)
+
+    return SearchResult(search, seconds, method, metrics)
@@ -0,0 +1,109 @@
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
+
+Stage = namedtuple('Stage', ['name', 'fn', 'after', 'always'])
+
+
+class PipelineRun:
+    """Bir grafik çalıştırmasının sonuçları, hataları ve aşama zamanlamaları."""
+
+    def __init__(self, stages, results, errors, timings):
+        self._stages = stages
+        self.results = results
+        self.errors = errors
+        self.timings = timings
+
+    def critical_path(self):
+        """En geç biten aşamaya giden, her adımda en geç biten bağımlılığı izleyen yol."""
+        finished = {name: t for name, t in self.timings.items() if name in self._stages}
+        if not finished:
+            return []
+        name = max(finished, key=lambda n: finished[n]['end'])
+        path = [name]
+        while True:
+            deps = [d for d in self._stages[name].after if d in finished]
+            if not deps:
+                break
+            name = max(deps, key=lambda n: finished[n]['end'])
+            path.append(name)
+        return path[::-1]
+
+    def summary(self):
+        """Zamanlamaları milisaniye olarak, kritik yolla birlikte döndürür."""
+        return {
+            'stages': {
+                name: {key: round(value * 1000, 1) for key, value in timing.items()}
+                for name, timing in self.timings.items()
+            },
+            'critical_path': self.critical_path(),
+            'errors': {name: str(error) for name, error in self.errors.items()},
+        }
+
+
+class StageGraph:
+    """Bağımlılık grafiği olarak tanımlanan aşamaları bir iş parçacığı havuzunda çalıştırır.
+
+    Bir aşama, bağımlı olduğu aşamalar bitince hemen havuza verilir ve
+    bağımlılıklarının sonuçlarını sırayla argüman olarak alır. Bağımlılığı
+    hata veren aşamalar atlanır; `always=True` olanlar yine de çalışır
+    (hatalı bağımlılığın yerine None alır).
+    """
+
+    def __init__(self):
+        self._stages = {}
+
+    def add(self, name, fn, after=(), always=False):
+        for dep in after:
+            if dep not in self._stages:
+                raise ValueError(f"Bilinmeyen bağımlılık: {dep}")
+        self._stages[name] = Stage(name, fn, tuple(after), always)
+        return self
+
+    def _run_stage(self, stage, args, origin):
+        start = time.perf_counter()
+        try:
+            return stage.fn(*args), None, (start - origin, time.perf_counter() - origin)
+        except Exception as e:
+            return None, e, (start - origin, time.perf_counter() - origin)
+
+    def run(self, executor, origin=None, timings=None):
+        """Grafiği çalıştırır; zamanlar `origin` anına (perf_counter) göre saniyedir."""
+        origin = time.perf_counter() if origin is None else origin
+        timings = dict(timings or {})
+        results, errors = {}, {}
+        pending = dict(self._stages)
+        running = {}
+
+        def submit_ready():
+            progress = True
+            while progress:
+                progress = False
+                for name, stage in list(pending.items()):
+                    if not all(dep in results or dep in errors for dep in stage.after):
+                        continue
+                    del pending[name]
+                    progress = True
+                    failed = [dep for dep in stage.after if dep in errors]
+                    if failed and not stage.always:
+                        # Atlanan aşamanın bağımlıları da aynı turda atlanır
+                        errors[name] = RuntimeError(f"Bağımlılık başarısız: {', '.join(failed)}")
+                        continue
+                    args = [results.get(dep) for dep in stage.after]
+                    running[executor.submit(self._run_stage, stage, args, origin)] = name
+
+        submit_ready()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                result, error, (start, end) = future.result()
+                timings[name] = {'start': start, 'end': end, 'duration': end - start}
+                if error is None:
+                    results[name] = result
+                else:
+                    errors[name] = error
+                    print(f"Aşama hatası ({name}): {error}")
+            submit_ready()
+
+        return PipelineRun(self._stages, results, errors, timings)
@@ -0,0 +1,162 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from demographic_data import DTYPES
+
+DEFAULT_BLOCK_SIZE = 1_000_000
+
+# Sayısal sütunlar: (ortalama, standart sapma, alt sınır, üst sınır)
+NUMERIC_MARGINALS = {
+    'yaş': (40, 15, 0, 85),
+    'sosyal_katılım': (50, 15, 0, 100),
+    'gelir_seviyesi': (3000, 1000, 0, 10000),
+}
+
+# Kategorik sütunlar: doğal sıralarıyla değerler ve olasılıkları
+CATEGORICAL_MARGINALS = {
+    'cinsiyet': (['Erkek', 'Kadın'], [0.52, 0.48]),
+    'engellilik_seviyesi': (['Hafif', 'Orta', 'Ağır'], [0.65, 0.25, 0.10]),
+    'iletişim_yöntemi': (['İşaret Dili', 'Dudak Okuma', 'İşitme Cihazı', 'Koklear İmplant', 'Karma Yöntem'], [0.2] * 5),
+    'eğitim_durumu': (['İlkokul', 'Ortaokul', 'Lise', 'Üniversite', 'Lisansüstü'], [0.2] * 5),
+}
+
+COLUMNS = ['yaş', 'cinsiyet', 'engellilik_seviyesi', 'iletişim_yöntemi', 'eğitim_durumu', 'sosyal_katılım', 'gelir_seviyesi']
+
+# Gizli normal değişkenler arasındaki korelasyonlar (Gauss kopula).
+# Kategorik sütunlarda korelasyon doğal sıraya göredir (ör. eğitim arttıkça gelir).
+DEFAULT_CORRELATIONS = {
+    ('yaş', 'gelir_seviyesi'): 0.3,
+    ('eğitim_durumu', 'gelir_seviyesi'): 0.4,
+    ('engellilik_seviyesi', 'sosyal_katılım'): -0.25,
+    ('gelir_seviyesi', 'sosyal_katılım'): 0.2,
+}
+
+
+def correlation_matrix(correlations=None):
+    """Sütun çiftlerinin korelasyonlarından tam korelasyon matrisi."""
+    matrix = np.eye(len(COLUMNS))
+    for (a, b), rho in (DEFAULT_CORRELATIONS if correlations is None else correlations).items():
+        i, j = COLUMNS.index(a), COLUMNS.index(b)
+        matrix[i, j] = matrix[j, i] = rho
+    return matrix
+
+
+def cholesky(correlations=None):
+    """Korelasyon matrisinin Cholesky çarpanı; matris pozitif tanımlı değilse ValueError."""
+    try:
+        return np.linalg.cholesky(correlation_matrix(correlations))
+    except np.linalg.LinAlgError:
+        raise ValueError("Korelasyonlar tutarsız: matris pozitif tanımlı değil.") from None
+
+
+# Doğal sıradaki kategori indeksini sıralı kategori koduna çeviren tablolar
+_THRESHOLDS = {column: stats.norm.ppf(np.cumsum(p)[:-1]) for column, (_, p) in CATEGORICAL_MARGINALS.items()}
+_CODES = {column: np.array([list(DTYPES[column].categories).index(v) for v in values], dtype=np.int8)
+          for column, (values, _) in CATEGORICAL_MARGINALS.items()}
+
+
+def generate_block(seed, rows, factor):
+    """`seed` (SeedSequence) ile tek bir blok üretir; sonuç yalnızca tohuma bağlıdır."""
+    rng = np.random.default_rng(seed)
+    latent = rng.standard_normal((rows, len(COLUMNS)), dtype=np.float64) @ factor.T
+    data = {}
+    for i, column in enumerate(COLUMNS):
+        z = latent[:, i]
+        if column in NUMERIC_MARGINALS:
+            mean, std, low, high = NUMERIC_MARGINALS[column]
+            data[column] = (mean + std * z).clip(low, high).astype(np.float32)
+        else:
+            codes = _CODES[column][np.searchsorted(_THRESHOLDS[column], z)]
+            data[column] = pd.Categorical.from_codes(codes, dtype=DTYPES[column])
+    return pd.DataFrame(data, columns=COLUMNS)
+
+
+def block_sizes(rows, block_size):
+    return [min(block_size, rows - start) for start in range(0, rows, block_size)]
+
+
+def block_seeds(seed, count):
+    """Her blok için bağımsız tohum; çalışan sayısından bağımsızdır."""
+    return np.random.SeedSequence(seed).spawn(count)
+
+
+def generate_frame(rows, seed=42, block_size=DEFAULT_BLOCK_SIZE, correlations=None):
+    """Bellekte DataFrame üretir; aynı tohum ve blok boyutuyla `generate` çıktısıyla aynıdır."""
+    factor = cholesky(correlations)
+    sizes = block_sizes(rows, block_size)
+    if not sizes:
+        return pd.DataFrame({column: pd.Series(dtype=DTYPES[column]) for column in COLUMNS})
+    blocks = [generate_block(s, n, factor) for s, n in zip(block_seeds(seed, len(sizes)), sizes)]
+    return pd.concat(blocks, ignore_index=True) if len(blocks) > 1 else blocks[0]
+
+
+def _write_block(task):
+    path, seed, rows, factor = task
+    tmp_path = path.with_suffix('.tmp')
+    generate_block(seed, rows, factor).to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def generate(rows, out_dir, seed=42, block_size=DEFAULT_BLOCK_SIZE, workers=None, correlations=None):
+    """`rows` satırlık nüfusu `block_size`'lık Parquet parçaları olarak yazar.
+
+    Bloklar süreç havuzunda üretilir; her blok `SeedSequence.spawn` ile
+    türetilmiş kendi tohumunu kullandığından çıktı, çalışan sayısından
+    bağımsız olarak aynıdır. Klasör `pd.read_parquet(out_dir)` ile tek tablo
+    olarak okunabilir; bu yüzden klasördeki önceki çalıştırmalardan kalan
+    `part-*.parquet` dosyaları yazmadan önce silinir.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in list(out_dir.glob('part-*.parquet')) + list(out_dir.glob('part-*.tmp')):
+        stale.unlink()
+    factor = cholesky(correlations)
+    sizes = block_sizes(rows, block_size)
+    tasks = [(out_dir / f'part-{i:05d}.parquet', s, n, factor)
+             for i, (s, n) in enumerate(zip(block_seeds(seed, len(sizes)), sizes))]
+    if workers == 1:
+        return [_write_block(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_write_block, tasks))
+
+
+def parse_correlation(text):
+    """'yaş:gelir_seviyesi=0.3' -> (('yaş', 'gelir_seviyesi'), 0.3)"""
+    pair, _, value = text.partition('=')
+    a, _, b = pair.partition(':')
+    if a not in COLUMNS or b not in COLUMNS:
+        raise argparse.ArgumentTypeError(f"Bilinmeyen sütun çifti: {pair}")
+    return (a, b), float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sentetik işitme engelli nüfusu üretici")
+    parser.add_argument('rows', type=int, help="Satır sayısı")
+    parser.add_argument('out_dir', help="Parquet parçalarının yazılacağı klasör")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE)
+    parser.add_argument('--workers', type=int, help="Süreç sayısı (varsayılan: işlemci sayısı)")
+    parser.add_argument('--corr', type=parse_correlation, action='append',
+                        help="Varsayılanların yerine korelasyon, ör. yaş:gelir_seviyesi=0.3 (tekrarlanabilir)")
+    parser.add_argument('--independent', action='store_true', help="Sütunlar arası korelasyon olmasın")
+    args = parser.parse_args(argv)
+
+    correlations = {} if args.independent else (dict(args.corr) if args.corr else None)
+    start = time.perf_counter()
+    paths = generate(args.rows, args.out_dir, args.seed, args.block_size, args.workers, correlations)
+    seconds = time.perf_counter() - start
+    size = sum(path.stat().st_size for path in paths)
+    print(f"{args.rows} satır, {len(paths)} parça, {size / 2**20:.1f} MB, "
+          f"{seconds:.2f} sn ({args.rows / seconds:,.0f} satır/sn)")
+
+
+if __name__ == "__main__":
+    main()
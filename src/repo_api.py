@@ -1,17 +1,231 @@
+import argparse
+import json
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import quote
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "https://raw.githubusercontent.com/dogaulkua/Turkish_Sign_Language_Dictionary/main/data/img/"
+LISTING_URL = "https://api.github.com/repos/dogaulkua/Turkish_Sign_Language_Dictionary/contents/data/img/"
+MANIFEST_NAME = '.manifest.json'
+TIMEOUT = (5, 30)  # (bağlantı, okuma) saniye
+
+
+def make_session(pool_size=8, retries=3):
+    """Bağlantı havuzlu, geçici hatalarda geri çekilerek yeniden deneyen HTTP oturumu."""
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({'GET', 'HEAD'}),
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class DictionarySync:
+    """Uzak işaret dili sözlüğünden GIF'leri paralel ve önbellekli indirir.
+
+    İndirilen her GIF'in ETag/Last-Modified bilgisi hedef klasördeki bir
+    manifestte tutulur; yerel kopyası olan işaretler koşullu istekle yeniden
+    doğrulanır (304 ise dosya yeniden indirilmez). 404 alan kelimeler
+    `missing_ttl` saniye boyunca tekrar sorulmaz. Dosyalar geçici dosyaya
+    yazılıp `os.replace` ile yerine konur. HTTP katmanı `session` ile
+    değiştirilebilir (ör. yerel bir test sunucusu için `base_url` ile birlikte).
+    """
+
+    def __init__(self, target_dir, base_url=BASE_URL, listing_url=LISTING_URL, session=None, workers=8,
+                 missing_ttl=24 * 60 * 60, revalidate_after=60 * 60, shard_dirs=True):
+        self.target_dir = Path(target_dir)
+        self.base_url = base_url
+        self.listing_url = listing_url
+        self.session = session or make_session(pool_size=workers)
+        self.workers = workers
+        self.missing_ttl = missing_ttl
+        self.revalidate_after = revalidate_after
+        self.shard_dirs = shard_dirs
+        self.manifest_path = self.target_dir / MANIFEST_NAME
+        self._lock = threading.Lock()
+        self._executor = None
+        self.stats = {'downloaded': 0, 'not_modified': 0, 'fresh': 0, 'missing': 0, 'skipped_missing': 0, 'errors': 0}
+        self.target_dir.mkdir(parents=True, exist_ok=True)
+        self.signs, self.missing = self._load_manifest()
+
+    # === Manifest ===
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}, {}
+        return manifest.get('signs', {}), manifest.get('missing', {})
+
+    def save_manifest(self):
+        with self._lock:
+            payload = json.dumps({'signs': self.signs, 'missing': self.missing}, ensure_ascii=False, indent=1)
+        self._write(self.manifest_path, payload.encode('utf-8'))
+
+    def _write(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    # === Tek Kelime ===
+    def url_for(self, word):
+        return f"{self.base_url}{quote(word[0])}/{quote(word)}.gif"
+
+    def path_for(self, word):
+        directory = self.target_dir / word[0] if self.shard_dirs else self.target_dir
+        return directory / f"{word}.gif"
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def is_known_missing(self, word):
+        """Kelime yakın zamanda 404 aldıysa True."""
+        checked = self.missing.get(word)
+        return checked is not None and time.time() - checked < self.missing_ttl
+
+    def fetch(self, word):
+        """Kelimenin GIF'ini indirir ya da yeniden doğrular; yolunu (yoksa None) döndürür."""
+        word = word.strip().lower()
+        if not word:
+            return None
+        if self.is_known_missing(word):
+            self._count('skipped_missing')
+            return None
+
+        path = self.path_for(word)
+        entry = self.signs.get(word)
+        headers = {}
+        if entry and path.exists():
+            if time.time() - entry.get('checked', 0) < self.revalidate_after:
+                self._count('fresh')
+                return path
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        url = self.url_for(word)
+        try:
+            response = self.session.get(url, headers=headers, timeout=TIMEOUT)
+        except requests.RequestException as e:
+            print(f"{word} kelimesi için GIF indirilemedi: {e}")
+            self._count('errors')
+            return None
+
+        now = time.time()
+        if response.status_code == 304 and entry:
+            with self._lock:
+                entry['checked'] = now
+            self._count('not_modified')
+            return path
+        if response.status_code == 404:
+            with self._lock:
+                self.missing[word] = now
+                self.signs.pop(word, None)
+            self._count('missing')
+            print(f"{word} kelimesi için GIF bulunamadı: {url}")
+            return None
+        if response.status_code != 200:
+            print(f"{word} kelimesi için GIF indirilemedi ({response.status_code}): {url}")
+            self._count('errors')
+            return None
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._write(path, response.content)
+        with self._lock:
+            self.signs[word] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'size': len(response.content),
+                'checked': now,
+            }
+            self.missing.pop(word, None)
+        self._count('downloaded')
+        return path
+
+    # === Toplu İndirme ===
+    def prefetch(self, words):
+        """Kelime listesini paralel indirir, manifesti kaydeder; kelime -> yol sözlüğü döndürür."""
+        words = list(dict.fromkeys(w.strip().lower() for w in words if w and w.strip()))
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='sign-sync') as pool:
+            paths = dict(zip(words, pool.map(self.fetch, words)))
+        self.save_manifest()
+        return paths
+
+    def list_shard(self, letter):
+        """Uzak sözlükte bir harf klasöründeki kelimeleri listeler."""
+        response = self.session.get(f"{self.listing_url}{quote(letter)}", timeout=TIMEOUT)
+        response.raise_for_status()
+        return [item['name'][:-4] for item in response.json()
+                if item.get('type', 'file') == 'file' and item['name'].endswith('.gif')]
+
+    def prefetch_letter(self, letter):
+        """Bir harf klasörünün tamamını indirir."""
+        return self.prefetch(self.list_shard(letter))
+
+    def submit(self, words):
+        """Kelimeleri arka planda indirir (ör. sözlükte bulunamayan kelimeler için)."""
+        words = [w for w in words if not self.is_known_missing(w)]
+        if not words:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='sign-prefetch')
+        return self._executor.submit(self.prefetch, words)
+
+
+_default_syncs = {}
+
 
 def get_gif_from_repo(word, save_path):
-    base_url = "https://raw.githubusercontent.com/dogaulkua/Turkish_Sign_Language_Dictionary/main/data/img/"
-    first_letter = word[0]  # Kelimenin ilk harfini al
-    gif_url = f"{base_url}{first_letter}/{word}.gif"
-    response = requests.get(gif_url)
-    
-    if response.status_code == 200:
-        gif_data = response.content
-        gif_name = f"{word}.gif"
-        with open(os.path.join(save_path, gif_name), 'wb') as gif_file:
-            gif_file.write(gif_data)
-        print(f"{word} kelimesi için GIF başarıyla indirildi: {gif_name}")
-    else:
-        print(f"{word} kelimesi için GIF bulunamadı: {gif_url}")
+    """Tek bir kelimenin GIF'ini `save_path` klasörüne indirir (geriye dönük uyumluluk)."""
+    key = str(Path(save_path).resolve())
+    sync = _default_syncs.get(key)
+    if sync is None:
+        sync = _default_syncs.setdefault(key, DictionarySync(save_path, shard_dirs=False))
+    path = sync.fetch(word)
+    sync.save_manifest()
+    if path:
+        print(f"{word} kelimesi için GIF hazır: {path.name}")
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Uzak işaret dili sözlüğünden GIF indirme")
+    parser.add_argument('target', help="Hedef sözlük klasörü (ör. Turkish_Sign_Language_Dictionary/data/img)")
+    parser.add_argument('words', nargs='*', help="İndirilecek kelimeler")
+    parser.add_argument('--letter', action='append', default=[], help="Bir harf klasörünün tamamını indir")
+    parser.add_argument('-j', '--workers', type=int, default=8)
+    args = parser.parse_args(argv)
+
+    sync = DictionarySync(args.target, workers=args.workers)
+    start = time.perf_counter()
+    if args.words:
+        sync.prefetch(args.words)
+    for letter in args.letter:
+        sync.prefetch_letter(letter)
+    print(f"Eşitleme tamamlandı ({time.perf_counter() - start:.2f} sn):", sync.stats)
+
+
+if __name__ == "__main__":
+    main()
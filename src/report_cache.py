@@ -0,0 +1,175 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 1  # Bölüm hesaplamaları değişirse artırılır; eski kayıtlar kullanılmaz
+
+
+def _digest(*parts):
+    sha1 = hashlib.sha1()
+    for part in parts:
+        sha1.update(part if isinstance(part, bytes) else repr(part).encode('utf-8'))
+    return sha1.hexdigest()
+
+
+class ReportCache:
+    """Rapor bölümlerinin veri parmak izi ve parametrelere göre disk önbelleği.
+
+    Parmak izi, `hash_pandas_object` ile satır satır hesaplanan özetlerden ve
+    sütun şemasından türetilir. Her bölüm (demografi, model, grafik) kendi
+    parametreleriyle ayrı anahtarlanır, böylece yalnızca ilgili bölüm
+    geçersiz olur. `incremental` ile tutulan akış durumları (ör. toplayıcılar)
+    veri yalnızca sonuna satır eklenerek değiştiyse yeniden taranmadan
+    yalnızca yeni satırlarla güncellenir.
+
+    Varsayılan olarak her seferinde tüm satırlar özetlenir. `verify_rows`
+    verilirse önbellekte saklanan satır özetlerinden bu kadarı (ilk, son ve
+    rastgele seçilenler) yeniden özetlenip karşılaştırılır, eşleşirse yalnızca
+    sonradan eklenen satırlar özetlenir. Bu kipte örneklenmeyen bir satırın
+    yerinde değiştirilmesi fark edilmez; yalnızca verinin sadece sonuna satır
+    eklendiği biliniyorsa kullanılmalıdır.
+    Klasörde en fazla `max_entries` dosya ve `max_bytes` bayt tutulur; en
+    uzun süredir kullanılmayanlar silinir.
+    """
+
+    def __init__(self, cache_dir, data, verify_rows=None, max_entries=64, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.rows = len(data)
+        self.schema = [(str(column), str(dtype)) for column, dtype in data.dtypes.items()]
+        self.stats = {'hits': 0, 'misses': 0, 'incremental': 0, 'hashed_rows': 0, 'evictions': 0}
+        self.row_hashes = self._row_hashes(data, verify_rows)
+        self.fingerprint = self.prefix_digest(self.rows)
+
+    def _row_hashes(self, data, verify_rows):
+        """Satır özetleri; `verify_rows` verilmişse ve kayıtlı özetler örneklemde
+        eşleşiyorsa yalnızca eklenen satırlar özetlenir."""
+        path = self.cache_dir / f"rows-{_digest(CACHE_VERSION, self.schema)[:20]}.npy"
+        saved = None
+        if verify_rows is not None:
+            try:
+                saved = np.load(path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Rapor önbelleği okuma hatası ({path.name}): {e}")
+        if saved is not None and 0 < len(saved) <= self.rows:
+            n = len(saved)
+            sample = np.unique(np.concatenate([[0, n - 1], np.random.default_rng().integers(0, n, verify_rows)]))
+            if np.array_equal(pd.util.hash_pandas_object(data.iloc[sample], index=False).to_numpy(), saved[sample]):
+                if n == self.rows:
+                    os.utime(path)
+                    return saved
+                tail = pd.util.hash_pandas_object(data.iloc[n:], index=False).to_numpy()
+                self.stats['hashed_rows'] += len(tail)
+                return self._store_hashes(path, np.concatenate([saved, tail]))
+        self.stats['hashed_rows'] += self.rows
+        return self._store_hashes(path, pd.util.hash_pandas_object(data, index=False).to_numpy())
+
+    def _store_hashes(self, path, hashes):
+        try:
+            self._write(path, lambda f: np.save(f, hashes))
+            self._evict()
+        except OSError as e:
+            print(f"Rapor önbelleği yazma hatası ({path.name}): {e}")
+        return hashes
+
+    def prefix_digest(self, rows):
+        """İlk `rows` satırın parmak izi."""
+        return _digest(self.schema, self.row_hashes[:rows].tobytes())
+
+    def _path(self, name):
+        return self.cache_dir / f'{name}.pkl'
+
+    def _load(self, name):
+        path = self._path(name)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)  # Son kullanım zamanı; silme sırası buna göre
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Rapor önbelleği okuma hatası ({name}): {e}")
+            return None
+
+    def _write(self, path, dump):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                dump(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _store(self, name, value):
+        self._write(self._path(name), lambda f: pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL))
+        self._evict()
+
+    def _evict(self):
+        files = []
+        for path in self.cache_dir.iterdir():
+            if path.suffix in ('.pkl', '.npy'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime_ns, stat.st_size, path))
+        files.sort(reverse=True)
+        kept = total = 0
+        for _, size, path in files:
+            if kept and (kept >= self.max_entries or total + size > self.max_bytes):
+                try:
+                    path.unlink()
+                    self.stats['evictions'] += 1
+                except FileNotFoundError:
+                    pass
+                continue
+            kept += 1
+            total += size
+
+    def key(self, section, params=None):
+        return f"{section}-{_digest(CACHE_VERSION, section, params, self.fingerprint)[:20]}"
+
+    def get_or_compute(self, section, compute, params=None):
+        """Bölümün bu veri ve parametrelerle kayıtlı sonucu; yoksa `compute()` ile üretilip saklanır."""
+        name = self.key(section, params)
+        cached = self._load(name)
+        if cached is not None:
+            self.stats['hits'] += 1
+            return cached
+        self.stats['misses'] += 1
+        value = compute()
+        self._store(name, value)
+        return value
+
+    def incremental(self, section, build, extend, params=None):
+        """Satır eklemeleriyle güncellenebilen akış durumu.
+
+        Kayıtlı durum, verinin ilk `n` satırıyla üretilmişse ve bu satırlar
+        değişmemişse `extend(durum, n)` ile yalnızca yeni satırlar eklenir;
+        aksi halde `build()` ile baştan üretilir.
+        """
+        name = f"{section}-{_digest(CACHE_VERSION, section, params)[:20]}-state"
+        saved = self._load(name)
+        if saved is not None and saved['rows'] == self.rows and saved['prefix'] == self.fingerprint:
+            self.stats['hits'] += 1
+            return saved['state']
+        if saved is not None and saved['rows'] < self.rows and saved['prefix'] == self.prefix_digest(saved['rows']):
+            self.stats['incremental'] += 1
+            state = extend(saved['state'], saved['rows'])
+        else:
+            self.stats['misses'] += 1
+            state = build()
+        self._store(name, {'rows': self.rows, 'prefix': self.fingerprint, 'state': state})
+        return state
@@ -0,0 +1,124 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from streaming import QueueSource
+
+
+class Session:
+    """Bir istemcinin (Socket.IO sid) tek bir ifadesine ait ses akışı.
+
+    Gelen 16 bit PCM parçaları oturuma özel bir kuyrukta tutulur; paylaşılan
+    geçici dosya yoktur. `max_seconds` süresini aşan ses kabul edilmez ve
+    ifade kapatılır.
+    """
+
+    def __init__(self, sid, sample_rate, mode='streaming', max_seconds=30):
+        self.sid = sid
+        self.sample_rate = sample_rate
+        self.mode = mode
+        self.max_samples = sample_rate * max_seconds
+        self.received = 0
+        self.closed = False
+        self.source = QueueSource(sample_rate, timeout=max_seconds + 5)
+
+    def push(self, data):
+        """PCM parçasını ekler; oturum kapalıysa ya da süre aşıldıysa False döner."""
+        if self.closed:
+            return False
+        data = bytes(data[:len(data) // 2 * 2])
+        samples = len(data) // 2
+        if self.received + samples > self.max_samples:
+            self.close()
+            return False
+        self.received += samples
+        self.source.push(data)
+        return True
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.source.close()
+
+
+class SessionRegistry:
+    """Etkin oturumların sid -> Session tablosu."""
+
+    def __init__(self, max_seconds=30):
+        self.max_seconds = max_seconds
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def start(self, sid, sample_rate, mode='streaming'):
+        """Yeni bir ifade başlatır; aynı istemcinin yarım kalan ifadesi kapatılır."""
+        session = Session(sid, sample_rate, mode, self.max_seconds)
+        with self._lock:
+            previous = self._sessions.get(sid)
+            self._sessions[sid] = session
+        if previous:
+            previous.close()
+        return session
+
+    def push(self, sid, data):
+        session = self._sessions.get(sid)
+        return session.push(data) if session else False
+
+    def close(self, sid):
+        """İstemcinin ifadesini bitirir, oturumu tablodan çıkarır ve döndürür (yoksa None)."""
+        with self._lock:
+            session = self._sessions.pop(sid, None)
+        if session:
+            session.close()
+        return session
+
+    def discard(self, session):
+        """İşi biten oturumu (yerine yenisi gelmediyse) tablodan çıkarır."""
+        with self._lock:
+            if self._sessions.get(session.sid) is session:
+                del self._sessions[session.sid]
+        session.close()
+
+
+class RecognitionPool:
+    """Sınırlı tanıma işçi havuzu.
+
+    En fazla `workers` iş aynı anda çalışır, `max_queue` iş sırada bekler;
+    daha fazlası reddedilir (geri basınç) ve istemciye meşgul bilgisi verilir.
+    """
+
+    def __init__(self, workers=4, max_queue=8):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='recognition')
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rejected = 0
+
+    @property
+    def queue_depth(self):
+        """Çalışan işler dışında sırada bekleyen iş sayısı."""
+        return max(0, self.in_flight - self.workers)
+
+    def submit(self, fn, *args, **kwargs):
+        """İşi havuza verir; kapasite doluysa None döner."""
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return None
+        with self._lock:
+            self.in_flight += 1
+        try:
+            future = self._executor.submit(fn, *args, **kwargs)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from PIL import Image
+
+from gif_frames import FrameCache
+
+# biçim -> (Pillow biçimi, dosya uzantısı, MIME türü)
+FORMATS = {
+    'gif': ('GIF', '.gif', 'image/gif'),
+    'webp': ('WEBP', '.webp', 'image/webp'),
+}
+
+
+def file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+class SequenceRenderer:
+    """İşaret GIF dizisini tek, sıralı ve aynı boyutlu bir animasyona dönüştürür.
+
+    Her işaretin kareleri `size` boyutuna getirilip arka plan rengi üzerine
+    yerleştirilir ve sırayla art arda eklenir; işaretler arasında son kare
+    `gap_ms` kadar bekletilir. Sonuç, dizideki dosyaların içerik özetleri ve
+    çıktı ayarlarından türetilen anahtarla `cache_dir` içinde saklanır, yani
+    sık kullanılan cümleler yeniden işlenmeden sunulur.
+    """
+
+    def __init__(self, cache_dir, size=(200, 200), frame_cache=None, digest=None, max_entries=256,
+                 gap_ms=250, background=(255, 255, 255)):
+        self.cache_dir = Path(cache_dir)
+        self.size = tuple(size)
+        self.frame_cache = frame_cache or FrameCache()
+        self.digest = digest or file_digest
+        self.max_entries = max_entries
+        self.gap_ms = gap_ms
+        self.background = background
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending = {}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, paths, fmt='gif'):
+        """Dizinin içerik ve ayarlara bağlı önbellek anahtarı."""
+        payload = [fmt, self.size, self.gap_ms, self.background] + [self.digest(path) for path in paths]
+        return hashlib.sha1(repr(payload).encode('utf-8')).hexdigest()
+
+    def render(self, paths, fmt='gif'):
+        """Dizinin birleşik animasyon dosyasının yolunu döndürür, yoksa üretir."""
+        if fmt not in FORMATS:
+            raise ValueError(f"Desteklenmeyen biçim: {fmt}")
+        if not paths:
+            raise ValueError("Boş işaret dizisi.")
+        path = self.cache_dir / (self.key(paths, fmt) + FORMATS[fmt][1])
+        with self._lock:
+            if path.exists():
+                self.hits += 1
+                os.utime(path)
+                return path
+            self.misses += 1
+            pending = self._pending.setdefault(path.name, threading.Lock())
+
+        # Aynı cümle için eşzamanlı istekler tek bir üretim bekler; üretim hata verse de kayıt silinir
+        try:
+            with pending:
+                if not path.exists():
+                    self._write(path, paths, fmt)
+                    self._evict()
+        finally:
+            with self._lock:
+                if self._pending.get(path.name) is pending:
+                    del self._pending[path.name]
+        return path
+
+    def _compose(self, paths):
+        frames, durations = [], []
+        for gif_path in paths:
+            gif = self.frame_cache.get(gif_path, self.size)
+            for frame in gif.frames:
+                canvas = Image.new('RGB', self.size, self.background)
+                canvas.paste(frame, mask=frame)
+                frames.append(canvas)
+            durations.extend(gif.durations)
+            durations[-1] += self.gap_ms
+        return frames, durations
+
+    def _write(self, path, paths, fmt):
+        frames, durations = self._compose(paths)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                options = {'quality': 80} if fmt == 'webp' else {}
+                frames[0].save(f, format=FORMATS[fmt][0], save_all=True, append_images=frames[1:],
+                               duration=durations, loop=0, **options)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _evict(self):
+        suffixes = {suffix for _, suffix, _ in FORMATS.values()}
+        files = [p for p in self.cache_dir.iterdir() if p.suffix in suffixes]
+        if len(files) <= self.max_entries:
+            return
+        files.sort(key=lambda p: p.stat().st_mtime_ns)
+        for old in files[:len(files) - self.max_entries]:
+            try:
+                old.unlink()
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'hit_rate': self.hits / total if total else 0.0}
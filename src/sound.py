@@ -0,0 +1,18 @@
+import threading
+
+_init_lock = threading.Lock()
+_pygame = None
+
+
+def get_pygame():
+    """pygame'i ilk kullanımda içe aktarır ve mikseri süreç boyunca bir kez başlatır."""
+    global _pygame
+    if _pygame is None:
+        with _init_lock:
+            if _pygame is None:
+                import pygame
+
+                pygame.mixer.init()
+                _pygame = pygame
+    return _pygame
+
@@ -1,37 +1,63 @@
+import os
+import sys
+from collections import namedtuple
+
 import speech_recognition as sr
 import numpy as np
-import librosa
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from audio_features import AudioFeatures
+from emotion_classifier import ThresholdClassifier
+from streaming import pcm16_to_float
+from metrics import stage_timer
+
+# Eşikler (kendi modelinize göre düzenleyin) emotion_thresholds.json dosyasından bir kez yüklenir
+EMOTION_CLASSIFIER = ThresholdClassifier.from_file()
+
+# Tanıma sonucu: metin, float32 PCM ses ve örnekleme hızı
+RecognitionResult = namedtuple('RecognitionResult', ['text', 'audio', 'sample_rate'])
 
 def extract_features(audio, sr):
-    """Kısa sinyallerde uyarı olmaması için n_fft'i sinyal uzunluğuna göre ayarla."""
-    n_fft = min(1024, len(audio))
-    mfcc = librosa.feature.mfcc(y=audio, sr=sr, n_mfcc=40, n_fft=n_fft)
-    chroma = librosa.feature.chroma_stft(y=audio, sr=sr, n_fft=n_fft)
-    mel = librosa.feature.melspectrogram(y=audio, sr=sr, n_fft=n_fft)
-    contrast = librosa.feature.spectral_contrast(y=audio, sr=sr, n_fft=n_fft)
-    tonnetz = librosa.feature.tonnetz(y=librosa.effects.harmonic(audio), sr=sr)
-    features = np.concatenate([
-        np.mean(mfcc, axis=1),
-        np.mean(chroma, axis=1),
-        np.mean(mel, axis=1),
-        np.mean(contrast, axis=1),
-        np.mean(tonnetz, axis=1)
-    ])
-    return features
+    """Tüm öznitelik gruplarının ortalamaları (tek STFT üzerinden)."""
+    return AudioFeatures(audio, sr).vector()
 
-def recognize_speech():
-    """Mikrofonu dinleyip Google Speech Recognition ile metin döndürür."""
+def recognize_audio():
+    """Mikrofonu dinleyip Google Speech Recognition ile tanır.
+
+    Tanınan metni, ham PCM sesi (float32 NumPy dizisi) ve örnekleme hızıyla
+    birlikte döndürür; ses diske yazılmadan doğrudan duygu analizine verilebilir.
+    """
     recognizer = sr.Recognizer()
     with sr.Microphone() as source:
         print("Konuşun, sizi dinliyorum...")
-        audio = recognizer.listen(source)
+        with stage_timer('listen'):
+            audio = recognizer.listen(source)
 
     try:
-        text = recognizer.recognize_google(audio, language='tr-TR')
+        with stage_timer('google'):
+            text = recognizer.recognize_google(audio, language='tr-TR')
+        print("Algılanan Metin: " + text)
+        return RecognitionResult(text, pcm16_to_float(audio.get_raw_data(convert_width=2)), audio.sample_rate)
+    except sr.UnknownValueError:
+        print("Google Speech Recognition konuşmayı anlayamadı.")
+        return None
+    except sr.RequestError as e:
+        print("Google Speech Recognition servisine erişim sağlanamıyor; {0}".format(e))
+        return None
+
+def recognize_speech():
+    """Mikrofonu dinleyip Google Speech Recognition ile metin döndürür."""
+    result = recognize_audio()
+    return result.text if result else None
+
+def recognize_pcm(pcm, sample_rate, sample_width=2, language='tr-TR'):
+    """Bellekteki PCM sesini (ör. tarayıcıdan gelen) Google Speech Recognition ile metne çevirir."""
+    recognizer = sr.Recognizer()
+    audio = sr.AudioData(bytes(pcm), sample_rate, sample_width)
+    try:
+        with stage_timer('google'):
+            text = recognizer.recognize_google(audio, language=language)
         print("Algılanan Metin: " + text)
-        # Tanınan ses kaydını dosyaya yaz
-        with open("temp_audio.wav", "wb") as f:
-            f.write(audio.get_wav_data())
         return text
     except sr.UnknownValueError:
         print("Google Speech Recognition konuşmayı anlayamadı.")
@@ -40,36 +66,58 @@ def recognize_speech():
         print("Google Speech Recognition servisine erişim sağlanamıyor; {0}".format(e))
         return None
 
-def analyze_sentiment_from_audio(file_path):
-    """temp_audio.wav dosyası üzerinden duygu analizi."""
-    y, sr = librosa.load(file_path, sr=None)
-    features = extract_features(y, sr)
-    
-    # Örnek eşik değerleri (kendi modelinize göre düzenleyin)
-    threshold_angry = np.array([0.495, 0.148, 0.549, 3.470, 0.87])
-    threshold_calm  = np.array([0.447, 0.176, 0.374, 3.613, 0.913])
-    threshold_happy = np.array([0.438, 0.159, 0.535, 3.308, 0.912])
-    threshold_sad   = np.array([0.446, 0.177, 0.316, 3.043, 0.899])
-    
-    mean_values = features[:5]
-    
-    # Basit kıyaslama (örnek). İhtiyaca göre değiştirebilirsiniz.
-    if np.all(mean_values > threshold_angry):
-        sentiment = "angry"
-    elif np.all(mean_values > threshold_calm):
-        sentiment = "calm"
-    elif np.all(mean_values > threshold_happy):
-        sentiment = "happy"
-    elif np.all(mean_values > threshold_sad):
-        sentiment = "sad"
-    else:
-        sentiment = "neutral"
-    
+def analyze_sentiment_from_audio(file_path, classifier=None):
+    """Ses dosyası üzerinden duygu analizi (analyze_sentiment için ince sarmalayıcı)."""
+    import librosa
+
+    with stage_timer('load'):
+        y, sr = librosa.load(file_path, sr=None)
+    return analyze_sentiment(y, sr, classifier)
+
+def as_audio_array(y):
+    """Sesi float32 diziye çevirir.
+
+    bytes/bytearray/memoryview gibi tamponlar 16 bit PCM kabul edilir,
+    tam sayı dizileri türlerinin aralığına göre [-1, 1) aralığına ölçeklenir.
+    İşaretsiz türler (ör. 8 bit PCM, uint8) önce ortalanır.
+    """
+    if isinstance(y, (bytes, bytearray, memoryview)):
+        return pcm16_to_float(y)
+    y = np.asarray(y)
+    if np.issubdtype(y.dtype, np.unsignedinteger):
+        half = 2 ** (np.iinfo(y.dtype).bits - 1)
+        return ((y.astype(np.float64) - half) / half).astype(np.float32)
+    if np.issubdtype(y.dtype, np.integer):
+        return y.astype(np.float32) / -np.iinfo(y.dtype).min
+    return y.astype(np.float32, copy=False)
+
+def analyze_sentiment(y, sr, classifier=None):
+    """Bellekteki ses sinyali (dizi ya da PCM tamponu) üzerinden duygu analizi."""
+    classifier = classifier or EMOTION_CLASSIFIER
+    y = as_audio_array(y)
+
+    # Yalnızca sınıflandırıcının okuduğu öznitelikler (ilk MFCC ortalamaları) hesaplanır
+    with stage_timer('features'):
+        mean_values = AudioFeatures(y, sr).mfcc_mean(classifier.feature_count)
+    with stage_timer('classify'):
+        sentiment = classifier.predict_one(mean_values)
+
     return {"mean_values": mean_values.tolist(), "sentiment": sentiment}
 
+def warm_up(sample_rate=16000):
+    """librosa/numba'nın ilk çağrıdaki derleme maliyetini (yaklaşık 2 sn) önceden öder."""
+    noise = np.random.default_rng(0).standard_normal(sample_rate).astype(np.float32) * 0.1
+    # Ölçümlere (stage_timer) girmemesi için analyze_sentiment yerine doğrudan
+    AudioFeatures(noise, sample_rate).mfcc_mean(EMOTION_CLASSIFIER.feature_count)
+
 if __name__ == "__main__":
-    # Test amaçlı direkt çalıştırma
-    text = recognize_speech()
-    if text:
-        sentiment = analyze_sentiment_from_audio("temp_audio.wav")
-        print("Duygu Analizi:", sentiment)
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        # Toplu analiz: python -m src.speech_to_text batch <klasör>
+        from batch_analysis import main as batch_main
+        batch_main(sys.argv[2:])
+    else:
+        # Test amaçlı direkt çalıştırma
+        result = recognize_audio()
+        if result:
+            sentiment = analyze_sentiment(result.audio, result.sample_rate)
+            print("Duygu Analizi:", sentiment)
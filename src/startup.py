@@ -0,0 +1,79 @@
+import socket
+import threading
+import time
+
+
+class StartupReport:
+    """Açılış süresini ölçer ve ağır bileşenleri arka planda ısıtır.
+
+    `mark` açılıştan o ana kadar geçen süreyi kaydeder; `warm_up` verilen
+    işleri (ör. librosa JIT derlemesi, sözlük dizini) ayrı bir iş parçacığında
+    sırayla çalıştırıp her birinin süresini kaydeder. Sunucu modunda ısıtma,
+    HTTP sunucusu bağlantı kabul etmeye başladıktan sonra yapılır; böylece
+    ilk sayfa isteği bu işleri beklemez.
+    """
+
+    def __init__(self, origin=None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.marks = {}
+        self.warmups = {}
+        self.errors = {}
+        self.done = threading.Event()
+
+    def mark(self, name):
+        self.marks[name] = time.perf_counter() - self.origin
+        return self.marks[name]
+
+    def _run(self, tasks):
+        for name, fn in tasks:
+            start = time.perf_counter()
+            try:
+                fn()
+            except Exception as e:
+                self.errors[name] = str(e)
+                print(f"Isıtma hatası ({name}): {e}")
+            self.warmups[name] = time.perf_counter() - start
+        self.mark('warm')
+        self.done.set()
+        print(self.describe())
+
+    def warm_up(self, tasks, wait_for=None, timeout=30):
+        """(ad, fonksiyon) işlerini arka planda çalıştırır.
+
+        `wait_for=(host, port)` verilirse işler, o adres bağlantı kabul edene
+        kadar (en fazla `timeout` saniye) bekletilir.
+        """
+        def run():
+            if wait_for:
+                if wait_until_listening(*wait_for, timeout=timeout):
+                    self.mark('listening')
+            self._run(tasks)
+
+        thread = threading.Thread(target=run, name='warm-up', daemon=True)
+        thread.start()
+        return thread
+
+    def summary(self):
+        """Saniye cinsinden açılış aşamaları ve ısıtma süreleri."""
+        return {
+            'marks': {name: round(value, 4) for name, value in self.marks.items()},
+            'warmups': {name: round(value, 4) for name, value in self.warmups.items()},
+            'errors': dict(self.errors),
+        }
+
+    def describe(self):
+        marks = ', '.join(f"{name}={value * 1000:.0f} ms" for name, value in self.marks.items())
+        warmups = ', '.join(f"{name}={value * 1000:.0f} ms" for name, value in self.warmups.items())
+        return f"Açılış: {marks} | ısıtma: {warmups or '-'}"
+
+
+def wait_until_listening(host, port, timeout=30, interval=0.05):
+    """Adres bağlantı kabul edene kadar bekler; zaman aşımında False döner."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=interval):
+                return True
+        except OSError:
+            time.sleep(interval)
+    return False
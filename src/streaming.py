@@ -0,0 +1,280 @@
+import queue
+import time
+import wave
+from collections import namedtuple
+
+import numpy as np
+
+from metrics import stage_timer
+
+# Tanıyıcının ürettiği kısmi (final=False) ya da kesin (final=True) hipotez
+Hypothesis = namedtuple('Hypothesis', ['text', 'final'])
+
+
+def pcm16_to_float(data):
+    """16 bit PCM baytlarını [-1, 1) aralığında float32 diziye çevirir."""
+    return np.frombuffer(data, dtype='<i2').astype(np.float32) / 32768.0
+
+
+def float_to_pcm16(audio):
+    """float32 sinyali 16 bit PCM baytlarına çevirir."""
+    return (np.clip(audio, -1.0, 32767 / 32768) * 32768).astype('<i2').tobytes()
+
+
+# === Ses Kaynakları ===
+class MicrophoneSource:
+    """Mikrofondan float32 ses parçaları okur."""
+
+    def __init__(self, device_index=None, chunk_size=1024):
+        import speech_recognition as sr
+
+        self.microphone = sr.Microphone(device_index=device_index, chunk_size=chunk_size)
+        self.sample_rate = self.microphone.SAMPLE_RATE
+
+    def chunks(self):
+        with self.microphone as source:
+            while True:
+                yield pcm16_to_float(source.stream.read(source.CHUNK))
+
+
+class WavFileSource:
+    """16 bit PCM WAV dosyasını parça parça okur (çevrimdışı test ve ölçüm için).
+
+    `realtime=True` ile her parça süresi kadar beklenir, mikrofon gibi davranır.
+    """
+
+    def __init__(self, path, chunk_ms=100, realtime=False):
+        self.path = path
+        self.chunk_ms = chunk_ms
+        self.realtime = realtime
+        with wave.open(str(path), 'rb') as wav:
+            self.sample_rate = wav.getframerate()
+
+    def chunks(self):
+        with wave.open(str(self.path), 'rb') as wav:
+            if wav.getsampwidth() != 2:
+                raise ValueError("Yalnızca 16 bit PCM WAV dosyaları destekleniyor.")
+            channels = wav.getnchannels()
+            frames = max(1, self.sample_rate * self.chunk_ms // 1000)
+            while True:
+                data = wav.readframes(frames)
+                if not data:
+                    return
+                audio = pcm16_to_float(data)
+                if channels > 1:
+                    audio = audio.reshape(-1, channels).mean(axis=1)
+                yield audio
+                if self.realtime:
+                    time.sleep(len(audio) / self.sample_rate)
+
+
+class QueueSource:
+    """İstemciden (ör. tarayıcıdan Socket.IO ile) gelen PCM parçalarını sırayla verir.
+
+    `close()` çağrılınca ya da `timeout` saniye boyunca veri gelmezse akış biter.
+    """
+
+    def __init__(self, sample_rate, timeout=30):
+        self.sample_rate = sample_rate
+        self.timeout = timeout
+        self._queue = queue.Queue()
+
+    def push(self, data):
+        self._queue.put(pcm16_to_float(data))
+
+    def close(self):
+        self._queue.put(None)
+
+    def chunks(self):
+        while True:
+            try:
+                chunk = self._queue.get(timeout=self.timeout)
+            except queue.Empty:
+                return
+            if chunk is None:
+                return
+            yield chunk
+
+
+# === Ses Etkinliği Algılama (VAD) ===
+class EnergyVAD:
+    """Enerji tabanlı VAD: ses parçalarını sessizliklerden bölütlere ayırır.
+
+    `pause_ms` süren bir sessizlik bölütü kapatır, konuşma duyulduktan sonra
+    `end_ms` süren bir sessizlik ifadeyi bitirir. Hiç konuşma gelmezse
+    `max_wait_ms` sonunda, çok uzun bölütler `max_segment_ms` sonunda kesilir.
+    """
+
+    def __init__(self, sample_rate, frame_ms=30, threshold=0.015, pause_ms=300,
+                 end_ms=1200, max_segment_ms=4000, max_wait_ms=10000):
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame = max(1, sample_rate * frame_ms // 1000)
+        self.threshold = threshold
+        self.pause_ms = pause_ms
+        self.end_ms = end_ms
+        self.max_segment_ms = max_segment_ms
+        self.max_wait_ms = max_wait_ms
+
+    def segments(self, chunks):
+        """Konuşma bölütlerini (float32 dizi) sırayla üretir."""
+        pending = np.empty(0, dtype=np.float32)
+        current = []
+        heard_speech = False
+        silence_ms = 0
+        waited_ms = 0
+
+        for chunk in chunks:
+            pending = np.concatenate([pending, chunk])
+            offset = 0
+            while len(pending) - offset >= self.frame:
+                frame = pending[offset:offset + self.frame]
+                offset += self.frame
+                voiced = np.sqrt(np.mean(frame ** 2)) >= self.threshold
+
+                if voiced:
+                    heard_speech = True
+                    silence_ms = 0
+                    current.append(frame)
+                elif heard_speech:
+                    silence_ms += self.frame_ms
+                    if current:
+                        current.append(frame)
+                else:
+                    waited_ms += self.frame_ms
+                    if waited_ms >= self.max_wait_ms:
+                        return
+
+                if current and (silence_ms >= self.pause_ms or len(current) * self.frame_ms >= self.max_segment_ms):
+                    yield np.concatenate(current)
+                    current = []
+                if heard_speech and silence_ms >= self.end_ms:
+                    return
+            pending = pending[offset:]
+
+        if current:
+            yield np.concatenate(current)
+
+
+# === Tanıyıcı Arka Uçları ===
+class GoogleSegmentRecognizer:
+    """Her VAD bölütünü Google Speech Recognition ile tanır.
+
+    Bölütler sessizlikte kapandığından bir bölütün metni kesindir; her
+    bölütten sonra o ana kadarki metin kısmi hipotez olarak üretilir.
+    """
+
+    def __init__(self, language='tr-TR'):
+        import speech_recognition as sr
+
+        self.sr = sr
+        self.language = language
+        self.recognizer = sr.Recognizer()
+
+    def hypotheses(self, segments, sample_rate):
+        words = []
+        for segment in segments:
+            audio = self.sr.AudioData(float_to_pcm16(segment), sample_rate, 2)
+            try:
+                with stage_timer('google'):
+                    text = self.recognizer.recognize_google(audio, language=self.language)
+            except self.sr.UnknownValueError:
+                continue
+            words.extend(text.split())
+            # Sessizlikle kapanan bölütün kelimeleri artık değişmez
+            yield Hypothesis(' '.join(words), True)
+        yield Hypothesis(' '.join(words), True)
+
+
+class ScriptedRecognizer:
+    """Senaryolu metni ses bölütleriyle eş zamanlı oynatan sahte tanıyıcı.
+
+    `transcript` bir metin ise kelime kelime büyüyen kısmi hipotezler,
+    bir liste ise doğrudan bu kısmi hipotezler üretilir. Her bölütten sonra
+    `per_segment` hipotez verilir, kalanlar ses bitince verilir.
+    """
+
+    def __init__(self, transcript, per_segment=2):
+        if isinstance(transcript, str):
+            words = transcript.split()
+            transcript = [' '.join(words[:i]) for i in range(1, len(words) + 1)]
+        self.partials = list(transcript)
+        self.per_segment = per_segment
+
+    def hypotheses(self, segments, sample_rate):
+        remaining = iter(self.partials)
+        for _ in segments:
+            for _, text in zip(range(self.per_segment), remaining):
+                yield Hypothesis(text, False)
+        for text in remaining:
+            yield Hypothesis(text, False)
+        yield Hypothesis(self.partials[-1] if self.partials else '', True)
+
+
+def replay(wav_path, transcript, realtime=False, **vad_options):
+    """WAV dosyası ve senaryolu metinle çevrimdışı bir akış hattı kurar."""
+    source = WavFileSource(wav_path, realtime=realtime)
+    return StreamingPipeline(source, ScriptedRecognizer(transcript), vad=EnergyVAD(source.sample_rate, **vad_options))
+
+
+# === Kararlı Kelime Takibi ===
+class StableWordTracker:
+    """Ardışık kısmi hipotezlerde artık değişmeyen kelimeleri bir kez verir.
+
+    Bir kelime, son iki hipotezin ortak önekinde yer alıyor ve hipotezin son
+    kelimesi değilse (tanıyıcı onu hâlâ düzeltebilir) kararlı sayılır.
+    """
+
+    def __init__(self):
+        self.emitted = []
+        self._previous = []
+
+    def update(self, text, final=False):
+        words = text.lower().split()
+        if final:
+            stable = words
+        else:
+            stable = []
+            for current, previous in zip(words[:-1], self._previous):
+                if current != previous:
+                    break
+                stable.append(current)
+        self._previous = words
+
+        new_words = stable[len(self.emitted):]
+        self.emitted.extend(new_words)
+        return new_words
+
+
+class StreamingPipeline:
+    """Ses kaynağı -> VAD -> tanıyıcı -> kararlı kelimeler akışı."""
+
+    def __init__(self, source, recognizer, vad=None):
+        self.source = source
+        self.recognizer = recognizer
+        self.vad = vad or EnergyVAD(source.sample_rate)
+        self.audio = []
+
+    @property
+    def sample_rate(self):
+        return self.source.sample_rate
+
+    def _recorded_chunks(self):
+        for chunk in self.source.chunks():
+            self.audio.append(chunk)
+            yield chunk
+
+    def recorded_audio(self):
+        """İfade boyunca kaydedilen sesin tamamı (duygu analizi için)."""
+        return np.concatenate(self.audio) if self.audio else np.empty(0, dtype=np.float32)
+
+    def run(self, on_word, on_partial=None):
+        """Her yeni kararlı kelime için `on_word(word)` çağırır, tam metni döndürür."""
+        tracker = StableWordTracker()
+        segments = self.vad.segments(self._recorded_chunks())
+        for hypothesis in self.recognizer.hypotheses(segments, self.sample_rate):
+            if on_partial:
+                on_partial(hypothesis.text)
+            for word in tracker.update(hypothesis.text, hypothesis.final):
+                on_word(word)
+        return ' '.join(tracker.emitted)
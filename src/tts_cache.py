@@ -0,0 +1,191 @@
+import argparse
+import hashlib
+import io
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / 'static' / 'cache'
+
+# Açılışta önceden sentezlenen sık kullanılan ifadeler
+COMMON_PHRASES = [
+    "Algılanan metin:",
+    "Konuşmaya devam etmek ister misiniz?",
+]
+
+
+class GTTSBackend:
+    """Google TTS (ağ bağlantısı gerekir), MP3 üretir."""
+
+    name = 'gtts'
+    suffix = '.mp3'
+
+    def synthesize(self, text, lang):
+        from gtts import gTTS
+
+        buffer = io.BytesIO()
+        gTTS(text, lang=lang).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class EspeakBackend:
+    """Yerel espeak-ng ile çevrimdışı sentez, WAV üretir."""
+
+    name = 'espeak'
+    suffix = '.wav'
+
+    def __init__(self, executable=None):
+        self.executable = executable or shutil.which('espeak-ng') or shutil.which('espeak') or 'espeak-ng'
+
+    def synthesize(self, text, lang):
+        result = subprocess.run(
+            [self.executable, '-v', lang, '--stdout', text],
+            capture_output=True,
+            check=True,
+        )
+        return result.stdout
+
+
+class TTSCache:
+    """(metin, dil) özetine göre adlandırılan kalıcı TTS ses önbelleği.
+
+    Dosyalar geçici dosyaya yazılıp `os.replace` ile yerine konur, yani
+    okuyan bir oturum hiçbir zaman yarım dosya görmez. Kayıt sayısı ya da
+    toplam boyut sınırı aşılınca en uzun süredir kullanılmayan kayıt silinir;
+    kullanım sırası dosya değişiklik zamanı ile diskte de korunur.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, backend=None, max_entries=512, max_bytes=64 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.backend = backend or GTTSBackend()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _load(self):
+        pattern = re.compile(r'^[0-9a-f]{40}' + re.escape(self.backend.suffix) + '$')
+        files = []
+        for path in self.cache_dir.iterdir():
+            if pattern.match(path.name):
+                stat = path.stat()
+                files.append((stat.st_mtime_ns, path.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total_bytes += size
+        self._evict()
+
+    def key(self, text, lang='tr'):
+        """Metin ve dil için kararlı önbellek anahtarı (dosya adı)."""
+        payload = f"{self.backend.name}\0{lang}\0{text}".encode('utf-8')
+        return hashlib.sha1(payload).hexdigest() + self.backend.suffix
+
+    def get(self, text, lang='tr'):
+        """Metnin ses dosyasının yolunu döndürür, yoksa sentezleyip önbelleğe yazar."""
+        name = self.key(text, lang)
+        path = self.cache_dir / name
+        with self._lock:
+            if name in self._entries and path.exists():
+                self.hits += 1
+                self._entries.move_to_end(name)
+                os.utime(path)
+                return path
+            self.misses += 1
+            pending = self._pending.setdefault(name, threading.Lock())
+
+        # Aynı metin için eşzamanlı istekler tek bir sentez yapar; kilit yalnızca sentez süresince tutulur.
+        # Sentez hata verse de (ör. gTTS ağ hatası) kayıt silinir, sonraki istek yeniden dener.
+        try:
+            with pending:
+                if not path.exists():
+                    self._write(path, self.backend.synthesize(text, lang))
+        finally:
+            with self._lock:
+                if self._pending.get(name) is pending:
+                    del self._pending[name]
+
+        with self._lock:
+            if name not in self._entries:
+                size = path.stat().st_size
+                self._entries[name] = size
+                self._total_bytes += size
+            self._entries.move_to_end(name)
+            self._evict(keep=name)
+        return path
+
+    def _write(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _evict(self, keep=None):
+        while self._entries and (len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes):
+            name, size = next(iter(self._entries.items()))
+            if name == keep:
+                break
+            del self._entries[name]
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                (self.cache_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+
+    def warm(self, phrases=COMMON_PHRASES, lang='tr'):
+        """Verilen ifadeleri önceden sentezler; hata veren ifadeleri atlar."""
+        for phrase in phrases:
+            try:
+                self.get(phrase, lang)
+            except Exception as e:
+                print(f"Önbellek ısıtma hatası ({phrase}): {e}")
+
+    def stats(self):
+        """İsabet/ıska sayaçları ve önbellek boyutu."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+            }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TTS ses önbelleği araçları")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    warm_parser = subparsers.add_parser('warm', help="Sık kullanılan ifadeleri önceden sentezle")
+    warm_parser.add_argument('phrases', nargs='*', help="Sentezlenecek ifadeler (varsayılan: COMMON_PHRASES)")
+    warm_parser.add_argument('--lang', default='tr')
+    warm_parser.add_argument('--cache-dir', default=str(DEFAULT_CACHE_DIR))
+    warm_parser.add_argument('--offline', action='store_true', help="gTTS yerine yerel espeak-ng kullan")
+    args = parser.parse_args(argv)
+
+    backend = EspeakBackend() if args.offline else GTTSBackend()
+    cache = TTSCache(args.cache_dir, backend=backend)
+    cache.warm(args.phrases or COMMON_PHRASES, lang=args.lang)
+    print("Önbellek durumu:", cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from gif_lexicon import get_lexicon
+
+# Çekim ekleri (ünlü ve ünsüz uyumuna göre tüm biçimleriyle)
+SUFFIXES = [
+    # Çoğul
+    "ler", "lar",
+    # İyelik
+    "m", "im", "ım", "um", "üm",
+    "n", "in", "ın", "un", "ün",
+    "i", "ı", "u", "ü", "si", "sı", "su", "sü",
+    "miz", "mız", "muz", "müz", "imiz", "ımız", "umuz", "ümüz",
+    "niz", "nız", "nuz", "nüz", "iniz", "ınız", "unuz", "ünüz",
+    "leri", "ları",
+    # Hâl ekleri
+    "e", "a", "ye", "ya", "yi", "yı", "yu", "yü",
+    "de", "da", "te", "ta", "den", "dan", "ten", "tan",
+    "nde", "nda", "nden", "ndan", "ne", "na", "ni", "nı", "nu", "nü",
+    "nin", "nın", "nun", "nün",
+    "le", "la", "yle", "yla", "ki",
+    # Fiil ekleri (mastar, zaman, kişi, ek-fiil)
+    "mek", "mak", "me", "ma", "mekte", "makta",
+    "iyor", "ıyor", "uyor", "üyor", "yor",
+    "di", "dı", "du", "dü", "ti", "tı", "tu", "tü",
+    "miş", "mış", "muş", "müş",
+    "ecek", "acak", "yecek", "yacak",
+    "er", "ar", "ir", "ır", "ur", "ür", "r",
+    "sin", "sın", "sun", "sün", "siniz", "sınız", "sunuz", "sünüz",
+    "iz", "ız", "uz", "üz", "k",
+    "dik", "dık", "duk", "dük", "tik", "tık", "tuk", "tük",
+    "dir", "dır", "dur", "dür", "tir", "tır", "tur", "tür",
+]
+
+# Sözlükteki çok kelimeli işaret adlarında kelime ayırıcıları (iyi_akşamlar.gif)
+PHRASE_SEPARATORS = re.compile(r'[\s_\-]+')
+
+BACK_VOWELS = set("aıou")
+FRONT_VOWELS = set("eiöü")
+
+# Ünlüyle başlayan ek alınca yumuşayan son ünsüzler (kitabı -> kitap)
+SOFTENED = {'b': 'p', 'c': 'ç', 'd': 't', 'ğ': 'k', 'g': 'k'}
+
+
+class SuffixTrie:
+    """Ters çevrilmiş eklerden kurulan trie.
+
+    Kelime sondan başa bir kez yürünür ve sonunda bulunan tüm eklerin
+    uzunlukları (kısa olandan uzuna) tek geçişte bulunur.
+    """
+
+    def __init__(self, suffixes):
+        self._root = {}
+        for suffix in suffixes:
+            node = self._root
+            for char in reversed(suffix):
+                node = node.setdefault(char, {})
+            node[None] = len(suffix)
+
+    def matches(self, word):
+        """Kelimenin sonunda bulunan eklerin uzunlukları."""
+        lengths = []
+        node = self._root
+        for char in reversed(word):
+            node = node.get(char)
+            if node is None:
+                break
+            if None in node:
+                lengths.append(node[None])
+        return lengths
+
+
+class TurkishStemmer:
+    """Ek zinciri soyan basit Türkçe gövdeleyici.
+
+    Ekler sondan başa art arda soyulur (ör. çalışmalarımızdan -> çalışmalarımız
+    -> çalışmaları -> çalışma -> çalış); her adımda bulunan gövdeler aday kök
+    olur. Adaylar en uzundan (en az ek soyulmuş) kısaya doğru sıralanır, çünkü
+    daha az soyulan gövde sözlükteki anlamı daha iyi korur. İsteğe bağlı olarak
+    her gövde için ünlü uyumuna uygun mastar biçimi (-mak/-mek) ve yumuşamış
+    son ünsüzün sert biçimi de aday olarak eklenir.
+    """
+
+    def __init__(self, suffixes=SUFFIXES, min_root=2, max_depth=5, infinitive=True):
+        self.trie = SuffixTrie(suffixes)
+        self.min_root = min_root
+        self.max_depth = max_depth
+        self.infinitive = infinitive
+
+    def roots(self, word):
+        """Ek soyularak bulunan gövdeler, en uzundan kısaya (kelimenin kendisi hariç)."""
+        found = set()
+        level = {word}
+        for _ in range(self.max_depth):
+            next_level = set()
+            for stem in level:
+                for length in self.trie.matches(stem):
+                    root = stem[:-length]
+                    if len(root) >= self.min_root and root not in found:
+                        found.add(root)
+                        next_level.add(root)
+            if not next_level:
+                break
+            level = next_level
+        found.discard(word)
+        return sorted(found, key=lambda r: (-len(r), r))
+
+    def root(self, word):
+        """En uzun tek eki soyulmuş gövde (eski `get_word_root` davranışı)."""
+        for length in reversed(self.trie.matches(word)):
+            if len(word) - length >= self.min_root:
+                return word[:-length]
+        return word
+
+    def infinitive_of(self, root):
+        """Gövdenin son ünlüsüne göre mastar biçimi (gel -> gelmek, al -> almak)."""
+        for char in reversed(root):
+            if char in BACK_VOWELS:
+                return root + "mak"
+            if char in FRONT_VOWELS:
+                return root + "mek"
+        return None
+
+    def candidates(self, word):
+        """Sözlükte denenecek kök adayları, öncelik sırasıyla."""
+        seen = {word}
+        for root in self.roots(word):
+            forms = [root]
+            if root[-1] in SOFTENED:
+                forms.append(root[:-1] + SOFTENED[root[-1]])
+            if self.infinitive:
+                forms.extend(filter(None, [self.infinitive_of(form) for form in list(forms)]))
+            for form in forms:
+                if form not in seen:
+                    seen.add(form)
+                    yield form
+
+
+class PhraseTrie:
+    """Sözlükteki çok kelimeli işaret adlarından kurulan kelime trie'si."""
+
+    def __init__(self, entries):
+        self._root = {}
+        self.size = 0
+        for name, path in entries:
+            tokens = [t for t in PHRASE_SEPARATORS.split(name.lower()) if t]
+            if len(tokens) < 2:
+                continue
+            node = self._root
+            for token in tokens:
+                node = node.setdefault(token, {})
+            node[None] = path
+            self.size += 1
+
+    def longest_match(self, tokens, start):
+        """`start` konumundan başlayan en uzun ifade için (bitiş, yol); yoksa None."""
+        node = self._root
+        best = None
+        for end in range(start, len(tokens)):
+            node = node.get(tokens[end])
+            if node is None:
+                break
+            if None in node:
+                best = (end + 1, node[None])
+        return best
+
+
+# app.py ve main.py aynı gövdeleyiciyi kullanır, böylece aynı kelime aynı işarete çözülür
+STEMMER = TurkishStemmer()
+
+
+class SignResolver:
+    """Kelime -> GIF yolu çözümleyici; sonuçlar sınırlı bir LRU bellekte tutulur.
+
+    Sıra: tam kelime, gövdeleyicinin kök adayları, en uzun tek eki soyulmuş
+    gövdeye en benzer kelime. Bulunamayan kelimeler de belleğe alınır;
+    sözlük dizini değişince (`generation`) bellek ve ifade trie'si yenilenir.
+    """
+
+    def __init__(self, lexicon, stemmer=None, memo_size=8192):
+        self.lexicon = lexicon
+        self.stemmer = stemmer or STEMMER
+        self.memo_size = memo_size
+        self.hits = 0
+        self.misses = 0
+        self.methods = {'exact': 0, 'stem': 0, 'similar': 0, 'none': 0}
+        self._memo = OrderedDict()
+        self._generation = lexicon.generation
+        self._phrases = None
+        self._lock = threading.Lock()
+
+    def _check_generation(self):
+        # Çağıran kilidi tutar
+        if self._generation != self.lexicon.generation:
+            self._generation = self.lexicon.generation
+            self._memo.clear()
+            self._phrases = None
+
+    def resolve(self, word):
+        """Kelimenin GIF yolunu döndürür (yoksa None)."""
+        if not word or not word[0].isalpha():
+            return None
+        self.lexicon.refresh()
+        with self._lock:
+            self._check_generation()
+            if word in self._memo:
+                self._memo.move_to_end(word)
+                self.hits += 1
+                return self._memo[word]
+            self.misses += 1
+
+        path, method = self._lookup(word)
+        with self._lock:
+            self.methods[method] += 1
+            self._memo[word] = path
+            if len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return path
+
+    def _lookup(self, word):
+        path = self.lexicon.exact(word)
+        if path:
+            return path, 'exact'
+        for candidate in self.stemmer.candidates(word):
+            path = self.lexicon.exact(candidate)
+            if path:
+                return path, 'stem'
+        path = self.lexicon.similar(self.stemmer.root(word))
+        return (path, 'similar') if path else (None, 'none')
+
+    def phrases(self):
+        """Sözlüğün güncel ifade trie'si (gerektiğinde yeniden kurulur)."""
+        self.lexicon.refresh()
+        with self._lock:
+            self._check_generation()
+            if self._phrases is None:
+                self._phrases = PhraseTrie(self.lexicon.entries())
+            return self._phrases
+
+    def segment(self, words):
+        """Kelimeleri soldan sağa en uzun ifade eşleşmesiyle böler.
+
+        (ifade, yol) listesi döndürür; ifade eşleşmeyen kelimeler tek tek
+        çözülür (bulunamazsa yol None olur).
+        """
+        phrases = self.phrases()
+        segments = []
+        i = 0
+        while i < len(words):
+            match = phrases.longest_match(words, i) if phrases.size else None
+            if match:
+                end, path = match
+                segments.append((' '.join(words[i:end]), path))
+                i = end
+            else:
+                segments.append((words[i], self.resolve(words[i])))
+                i += 1
+        return segments
+
+    def stats(self):
+        """Bellek isabet oranı ve çözümleme yöntemlerinin dağılımı."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'entries': len(self._memo),
+                'methods': dict(self.methods),
+            }
+
+
+_RESOLVERS = {}
+_RESOLVERS_LOCK = threading.Lock()
+
+
+def get_resolver(gif_dir):
+    """Aynı sözlük klasörü için süreç boyunca tek bir SignResolver döndürür."""
+    key = str(Path(gif_dir).resolve())
+    with _RESOLVERS_LOCK:
+        resolver = _RESOLVERS.get(key)
+        if resolver is None:
+            resolver = _RESOLVERS[key] = SignResolver(get_lexicon(key))
+        return resolver